@@ -191,6 +191,9 @@ WIDGET_DEFAULTS: dict[str, dict] = {
             "line_dash": "solid",
             "line_width": 1.5,
             "responsive": True,
+            "float32": False,
+            "decimation": "none",
+            "max_points": 0,
         },
     },
 }
@@ -274,6 +277,9 @@ WIDGET_PROP_HINTS: dict[str, dict[str, dict[str, Any]]] = {
         "line_dash": {"label": "Linienart", "type": "string", "options": ["solid", "dot", "dash", "longdash", "dashdot", "longdashdot"]},
         "line_width": {"label": "Linienbreite", "type": "number", "min": 0.5, "max": 10},
         "responsive": {"label": "Responsive", "type": "boolean"},
+        "float32": {"label": "Daten als float32 senden (halbe Bytes pro Frame)", "type": "boolean"},
+        "decimation": {"label": "Lange Spuren reduzieren (Spitzen bleiben erhalten)", "type": "string", "options": ["none", "minmax", "lttb"]},
+        "max_points": {"label": "Punkte pro Spur (0 = 2 × Plotbreite)", "type": "integer", "min": 0, "max": 1000000},
     },
 }
 
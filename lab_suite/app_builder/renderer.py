@@ -11,6 +11,8 @@ import html as _html
 import json
 from typing import Any, Callable
 
+from tracing import span
+
 
 def _ui():
     from nicegui import ui
@@ -552,17 +554,19 @@ def _render_widget(
     props = node.get("props", {})
 
     def _on_change(cb_key: str, value: Any) -> None:
-        state[path_id] = value
-        if on_state_change:
-            on_state_change()
-        fn = callbacks.get(cb_key)
-        if fn:
-            fn(value)
+        with span("renderer.on_change", key=cb_key):
+            state[path_id] = value
+            if on_state_change:
+                on_state_change()
+            fn = callbacks.get(cb_key)
+            if fn:
+                fn(value)
 
     def _on_click(cb_key: str) -> None:
-        fn = callbacks.get(cb_key)
-        if fn:
-            fn()
+        with span("renderer.on_click", key=cb_key):
+            fn = callbacks.get(cb_key)
+            if fn:
+                fn()
 
     def _event_value(e: Any, widget: Any, fallback: Any) -> Any:
         """Wert aus Event: e.args wenn sinnvoll (bool/number/str), sonst widget.value (NiceGUI liefert teils Event-Objekt)."""
@@ -1212,6 +1216,9 @@ def _render_widget(
                 line_dash = _prop_str("line_dash", "solid") or "solid"
                 line_width = _prop_num("line_width", 1.5)
                 responsive = _prop_bool("responsive", True)
+                float32 = _prop_bool("float32", False)
+                decimation = _prop_str("decimation", "none") or "none"
+                max_points = int(_prop_num("max_points", 0))
 
                 layout: dict[str, Any] = {
                     "margin": {"t": 40, "r": 20, "b": 50, "l": 60},
@@ -1257,6 +1264,9 @@ def _render_widget(
                     config=config,
                     height=height,
                     plotly_script_url=plotly_script_url,
+                    float32=float32,
+                    max_points=max_points,
+                    decimation=decimation,
                 )
                 el.classes("w-full")
                 if widget_registry is not None:
@@ -0,0 +1,76 @@
+"""
+Benchmark: adaptiver Huffman-Code (coding.adaptive, FGK und Vitter, einpassig) gegen den statischen
+zweipassigen kanonischen Huffman-Code (coding.CanonicalCode).
+
+Eingabe: labs/01_02_Informationstheorie/sampletext.txt, wiederholt bis zur Zielgröße (Standard 5 MB),
+sowie optional beliebige weitere Dateien. Gemessen werden Encoder-/Decoder-Durchsatz (MB/s) und
+Kompressionsrate (bit/Byte); beim statischen Code zählt die Codelängen-Tabelle (1 Byte je Symbol)
+mit. Alle Round-Trips werden per Vergleich mit dem Original geprüft.
+
+Verwendung (aus lab_suite):
+  python benchmarks/bench_adaptive_huffman.py
+  python benchmarks/bench_adaptive_huffman.py --size-mb 1 --files labs/01_04_Datenkompression/sampletext.txt
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
+
+from coding import CanonicalCode, adaptive
+
+SAMPLE_PATH = _LAB_SUITE_ROOT / "labs" / "01_02_Informationstheorie" / "sampletext.txt"
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def bench(name: str, data: bytes) -> None:
+    mb = len(data) / 1e6
+    print(f"\n{name} ({mb:.2f} MB)")
+    print(f"{'Coder':>24} | {'Enc MB/s':>9} | {'Dec MB/s':>9} | {'bit/Byte':>9} | Round-Trip")
+    print("-" * 70)
+
+    def static_encode():
+        code = CanonicalCode.from_data(data)
+        return code, code.encode(data)
+
+    t_enc, (code, packed) = _timed(static_encode)
+    t_dec, decoded = _timed(lambda: code.decode(packed, len(data)))
+    bits = 8 * (len(packed) + len(code.symbols))  # Tabelle: eine Codelänge je Symbol
+    print(f"{'statisch (2 Durchläufe)':>24} | {mb / t_enc:>9.2f} | {mb / t_dec:>9.2f} | {bits / len(data):>9.3f} | "
+          f"{'OK' if decoded == data else 'FEHLER'}")
+
+    for algorithm in adaptive.ALGORITHMS:
+        t_enc, packed = _timed(lambda: adaptive.encode(data, algorithm))
+        t_dec, decoded = _timed(lambda: adaptive.decode(packed, len(data), algorithm))
+        print(f"{'adaptiv ' + algorithm.upper():>24} | {mb / t_enc:>9.2f} | {mb / t_dec:>9.2f} | "
+              f"{8 * len(packed) / len(data):>9.3f} | {'OK' if decoded == data else 'FEHLER'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark adaptiver (FGK/Vitter) vs. statischer Huffman-Code.")
+    parser.add_argument("--size-mb", type=float, default=5.0, help="Größe der skalierten Beispieldatei in MB (Standard 5)")
+    parser.add_argument("--files", nargs="*", default=[], help="weitere Dateien (werden vollständig gelesen)")
+    args = parser.parse_args()
+
+    sample = SAMPLE_PATH.read_bytes()
+    size = int(args.size_mb * 1e6)
+    data = (sample * (size // len(sample) + 1))[:size]
+    # kurze Eingabe: hier spart der adaptive Code die Tabelle, lange Eingabe: beide nähern sich an
+    bench(f"{SAMPLE_PATH.name} (einfach)", sample)
+    bench(f"{SAMPLE_PATH.name} (wiederholt)", data)
+    for name in args.files:
+        bench(name, Path(name).read_bytes())
+
+
+if __name__ == "__main__":
+    main()
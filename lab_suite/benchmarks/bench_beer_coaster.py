@@ -0,0 +1,63 @@
+"""
+Benchmark: Optimum-Basis des Bierdeckel-Telegrafen (Lab 01_01) – exakte Ganzzahl-Schleife wie in
+beer_coaster.py (V = B**n für jeden Teiler B, dann log2) gegen den vektorisierten NumPy-Sweep
+(coding.telegraph.optimum_sweep, G = n·log2(B) direkt).
+
+Beide Varianten laufen für R = 1 … --loop-r (Standard 2000); geprüft wird, dass sie dieselbe Basis
+und denselben Entscheidungsgehalt liefern. Danach nur der Sweep bis --sweep-r (Standard 10⁶).
+
+Verwendung (aus lab_suite):
+  python benchmarks/bench_beer_coaster.py
+  python benchmarks/bench_beer_coaster.py --loop-r 5000 --sweep-r 10000000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
+
+from coding.telegraph import exact_optimum, optimum_sweep
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bierdeckel-Telegraf: Ganzzahl-Schleife vs. vektorisierter Sweep.")
+    parser.add_argument("--loop-r", type=int, default=2000, help="R-Bereich für den Vergleich mit der Schleife (Standard 2000)")
+    parser.add_argument("--sweep-r", type=int, default=1_000_000, help="R-Bereich nur für den Sweep (Standard 10⁶)")
+    parser.add_argument("--b-max", type=int, default=64, help="größte Basis im Gitter des Sweeps (Standard 64)")
+    args = parser.parse_args()
+
+    r_max = args.loop_r
+    t0 = time.perf_counter()
+    exact = [exact_optimum(r) for r in range(1, r_max + 1)]
+    t_loop = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    sweep = optimum_sweep(r_max, b_max=args.b_max)
+    t_sweep = time.perf_counter() - t0
+    for r, (b, _, _, g) in enumerate(exact, start=1):
+        if sweep.best_divisor_base[r - 1] != b or abs(sweep.best_divisor_g[r - 1] - g) > 1e-9 * max(1.0, g):
+            raise AssertionError(f"Abweichung bei R={r}: Schleife B={b}, Sweep B={sweep.best_divisor_base[r - 1]}")
+
+    print(f"\nR = 1 … {r_max} (Ergebnisse identisch)")
+    print(f"{'Variante':>28} | {'Zeit s':>9} | {'µs pro R':>9} | {'Faktor':>8}")
+    print("-" * 64)
+    print(f"{'Ganzzahl-Schleife (B**n)':>28} | {t_loop:>9.3f} | {1e6 * t_loop / r_max:>9.2f} | {1.0:>7.1f}x")
+    print(f"{'NumPy-Sweep (n·log2 B)':>28} | {t_sweep:>9.3f} | {1e6 * t_sweep / r_max:>9.2f} | {t_loop / t_sweep:>7.1f}x")
+
+    t0 = time.perf_counter()
+    sweep = optimum_sweep(args.sweep_r, b_max=args.b_max)
+    t_big = time.perf_counter() - t0
+    bases, counts = np.unique(sweep.best_divisor_base, return_counts=True)
+    top = sorted(zip(bases.tolist(), counts.tolist()), key=lambda item: -item[1])[:5]
+    print(f"\nSweep R = 1 … {args.sweep_r}: {t_big:.3f} s ({1e9 * t_big / args.sweep_r:.0f} ns pro R)")
+    print("Häufigste Optimum-Basen (Teiler von R): " + ", ".join(f"B={b}: {c}×" for b, c in top))
+
+
+if __name__ == "__main__":
+    main()
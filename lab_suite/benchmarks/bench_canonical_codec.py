@@ -0,0 +1,120 @@
+"""
+Benchmark + Round-Trip-Prüfung: kanonischer Huffman-Code (coding.CanonicalCode),
+Bulk-Encoder/-Decoder auf gepackten Bytes.
+
+Eingabe: labs/01_02_Informationstheorie/sampletext.txt, wiederholt bis zur Zielgröße (Standard 200 MB).
+Der Datenstrom wird blockweise erzeugt, kodiert und wieder dekodiert; geprüft wird per CRC32 über
+Original und Dekodat, dass der Round-Trip bitgenau ist. Zusätzlich Round-Trips für Sonderfälle
+(ein Symbol, str-Alphabet, Wort-Alphabet, sehr lange Codes).
+
+Verwendung (aus lab_suite):
+  python benchmarks/bench_canonical_codec.py
+  python benchmarks/bench_canonical_codec.py --size-mb 20 --table-bits 12 14
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import zlib
+from pathlib import Path
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
+
+from coding import CanonicalCode
+
+SAMPLE_PATH = _LAB_SUITE_ROOT / "labs" / "01_02_Informationstheorie" / "sampletext.txt"
+CHUNK_SIZE = 1 << 20
+
+
+def _round_trip(code: CanonicalCode, data) -> None:
+    for chunk_size in (1, 7, 1 << 16):
+        encoded = code.encode(data, chunk_size=chunk_size)
+        decoded = code.decode(encoded, len(data), chunk_size=max(1, chunk_size // 3))
+        if decoded != data:
+            raise AssertionError(f"Round-Trip fehlgeschlagen (chunk_size={chunk_size})")
+
+
+def check_round_trips(sample: bytes) -> None:
+    """Sonderfälle: Byte-, Zeichen-, Wort-Alphabet, ein Symbol, sehr lange Codes (Fibonacci-Gewichte)."""
+    rng = random.Random(7)
+    text = sample.decode("utf-8", errors="replace")
+    words = text.split()
+    cases = [
+        ("bytes", CanonicalCode.from_data(sample), sample),
+        ("str", CanonicalCode.from_data(text), text),
+        ("Wörter", CanonicalCode.from_weights({w: words.count(w) for w in set(words)}), words),
+        ("ein Symbol", CanonicalCode.from_data(b"a"), b"aaaaaaaaa"),
+        ("Zufall 256", CanonicalCode.from_data(bytes(range(256))), bytes(rng.randrange(256) for _ in range(5000))),
+    ]
+    fib = [1, 1]
+    while len(fib) < 40:
+        fib.append(fib[-1] + fib[-2])
+    long_code = CanonicalCode.from_weights({i: f for i, f in enumerate(fib)})
+    cases.append((f"lange Codes (max {long_code.max_length} bit)", long_code, bytes(rng.choices(range(40), k=20000))))
+    for name, code, data in cases:
+        _round_trip(code, data)
+        print(f"  Round-Trip OK: {name}")
+
+
+def _input_chunks(sample: bytes, total: int):
+    block = sample * max(1, CHUNK_SIZE // len(sample))
+    sent = 0
+    while sent < total:
+        piece = block[: total - sent]
+        sent += len(piece)
+        yield piece
+
+
+def bench(sample: bytes, size_mb: float, table_bits: int) -> None:
+    total = int(size_mb * 1_000_000)
+    t0 = time.perf_counter()
+    code = CanonicalCode.from_data(sample, table_bits=table_bits)
+    t_build = time.perf_counter() - t0
+
+    crc_in = 0
+    for chunk in _input_chunks(sample, total):
+        crc_in = zlib.crc32(chunk, crc_in)
+    # Streaming-Encoder über alle Blöcke (Bitrest wird zwischen den Blöcken mitgeführt)
+    t0 = time.perf_counter()
+    encoded = list(code.encode_iter(_input_chunks(sample, total)))
+    t_enc = time.perf_counter() - t0
+    n_encoded = sum(map(len, encoded))
+
+    crc_out = 0
+    n_decoded = 0
+    t0 = time.perf_counter()
+    for block in code.decode_iter(encoded, total):
+        crc_out = zlib.crc32(block, crc_out)
+        n_decoded += len(block)
+    t_dec = time.perf_counter() - t0
+
+    ok = crc_in == crc_out and n_decoded == total
+    mb = total / 1_000_000
+    print(
+        f"{table_bits:>10} | {mb:>8.1f} | {t_build * 1000:>9.1f} | {mb / t_enc:>9.2f} | {mb / t_dec:>9.2f} | "
+        f"{8 * n_encoded / total:>9.3f} | {'OK' if ok else 'FEHLER'}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark kanonischer Huffman-Encoder/-Decoder (MB/s).")
+    parser.add_argument("--size-mb", type=float, default=200.0, help="Eingabegröße in MB (sampletext.txt wiederholt)")
+    parser.add_argument("--table-bits", type=int, nargs="*", default=[12], help="Breite(n) der Decoder-Tabelle")
+    args = parser.parse_args()
+
+    sample = SAMPLE_PATH.read_bytes()
+    print("Round-Trip-Prüfungen:")
+    check_round_trips(sample)
+    print(f"\nDurchsatz auf {SAMPLE_PATH.name} (wiederholt):")
+    print(f"{'table_bits':>10} | {'MB':>8} | {'Bau [ms]':>9} | {'Enc MB/s':>9} | {'Dec MB/s':>9} | {'bit/Byte':>9} | Round-Trip")
+    print("-" * 82)
+    for table_bits in args.table_bits:
+        bench(sample, args.size_mb, table_bits)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Benchmark: Konsolen-Aufzeichnung der Skript-Labs – bisherige _Tee-Klasse (flush() auf Konsole und
+Log-Datei bei jedem write) gegen console_capture.ConsoleCapture (Log blockweise, Konsole zeilengepuffert).
+
+Die Konsole wird durch einen zeilengepufferten Textstrom auf os.devnull ersetzt (verhält sich wie
+sys.__stdout__ im Terminal); gezählt werden die write-Aufrufe an das Betriebssystem für Konsole und
+Log-Datei. Szenarien wie in den Labs: viele kurze Tabellenzeilen (entropy1.py, word_dictionary.py)
+und Dateiinhalt in langen Zeilen (Echo in entropy1.py). Geprüft wird, dass console_log.txt in
+beiden Varianten identisch ist; zusätzlich Abschneiden bei max_bytes und Rotation.
+
+Verwendung (aus lab_suite):
+  python benchmarks/bench_console_capture.py
+  python benchmarks/bench_console_capture.py --lines 500000
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
+
+from console_capture import TRUNCATION_MARKER, ConsoleCapture
+
+
+class _Tee:
+    """Bisherige Variante aus den Skript-Labs (unverändert)."""
+    def __init__(self, *streams):
+        self.streams = streams
+    def write(self, data):
+        for s in self.streams:
+            s.write(data)
+            if getattr(s, "flush", None):
+                s.flush()
+    def flush(self):
+        for s in self.streams:
+            if getattr(s, "flush", None):
+                s.flush()
+    def writable(self):
+        return True
+
+
+class _CountingFileIO(io.FileIO):
+    """FileIO, das die write-Aufrufe (= Systemaufrufe) zählt."""
+    calls = 0
+
+    def write(self, b):
+        type(self).calls += 1
+        return super().write(b)
+
+
+class _CountingCapture(ConsoleCapture):
+    def _open_log(self):
+        return _CountingFileIO(self.log_path, "w")  # gleiche Zählung wie bei _Tee
+
+
+def _console() -> io.TextIOWrapper:
+    return io.TextIOWrapper(io.BufferedWriter(_CountingFileIO(os.devnull, "w")), encoding="utf-8", line_buffering=True)
+
+
+def _table_rows(lines: int) -> None:
+    for i in range(lines):
+        print(' {:5} | cnt={:3d}    p={:1.3f}   H={:3.3f} bit/char  H_av={:3.3f} bit/char'.format(repr(chr(32 + i % 90)), i % 997, 0.01, 6.6, 0.066))
+
+
+def _long_lines(lines: int) -> None:
+    text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+    for _ in range(lines // 20):
+        print(text)
+
+
+def _run(variant: str, workload, lines: int, log_path: Path) -> tuple[float, int]:
+    _CountingFileIO.calls = 0
+    console = _console()
+    saved = sys.stdout
+    t0 = time.perf_counter()
+    if variant == "_Tee":
+        log_file = io.TextIOWrapper(io.BufferedWriter(_CountingFileIO(log_path, "w")), encoding="utf-8")
+        sys.stdout = _Tee(console, log_file)
+        try:
+            workload(lines)
+        finally:
+            sys.stdout = saved
+            log_file.close()
+    else:
+        capture = _CountingCapture(console, log_path, flush_interval=0.5, max_bytes=0)
+        sys.stdout = capture
+        try:
+            workload(lines)
+        finally:
+            sys.stdout = saved
+            capture.close()
+    elapsed = time.perf_counter() - t0
+    console.close()
+    return elapsed, _CountingFileIO.calls
+
+
+def check_limits(tmp: Path) -> None:
+    """max_bytes mit Abschneide-Markierung und Rotation mit backup_count."""
+    path = tmp / "limit.txt"
+    capture = ConsoleCapture(io.StringIO(), path, buffer_size=100, flush_interval=0, max_bytes=1000)
+    for i in range(100):
+        capture.write(f"Zeile {i:03d} äöü\n")
+    capture.close()
+    data = path.read_bytes()
+    marker = TRUNCATION_MARKER.format(max_bytes=1000).encode("utf-8")
+    if not data.endswith(marker) or len(data) - len(marker) > 1000:
+        raise AssertionError("max_bytes: Abschneiden fehlerhaft")
+    data.decode("utf-8")  # kein halbes UTF-8-Zeichen
+    print(f"  Abschneiden OK: {len(data) - len(marker)} Bytes + Markierung")
+
+    path = tmp / "rotate.txt"
+    capture = ConsoleCapture(io.StringIO(), path, buffer_size=50, flush_interval=0, max_bytes=500, backup_count=2)
+    lines = [f"Zeile {i:04d}\n" for i in range(400)]
+    for line in lines:
+        capture.write(line)
+    capture.close()
+    parts = [p.read_text(encoding="utf-8") for p in (tmp / "rotate.txt.2", tmp / "rotate.txt.1", path)]
+    if not "".join(lines).endswith("".join(parts)) or any(len(p.encode()) > 500 for p in parts):
+        raise AssertionError("Rotation fehlerhaft")
+    print(f"  Rotation OK: console_log.txt + 2 Sicherungen, jüngste {len(parts[-1])} Bytes in der Hauptdatei")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="_Tee (flush pro write) vs. gepufferte Konsolen-Aufzeichnung.")
+    parser.add_argument("--lines", type=int, default=200_000, help="Anzahl print-Aufrufe je Szenario (Standard 200000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_name:
+        tmp = Path(tmp_name)
+        print(f"\n{'Szenario':>16} | {'Variante':>14} | {'Zeit s':>8} | {'µs/print':>8} | {'write-Aufrufe':>13} | {'Faktor':>7}")
+        print("-" * 82)
+        for name, workload, lines in (("Tabellenzeilen", _table_rows, args.lines), ("lange Zeilen", _long_lines, args.lines)):
+            results = {}
+            for variant in ("_Tee", "ConsoleCapture"):
+                log_path = tmp / f"{variant}.txt"
+                results[variant] = _run(variant, workload, lines, log_path)
+            if (tmp / "_Tee.txt").read_bytes() != (tmp / "ConsoleCapture.txt").read_bytes():
+                raise AssertionError(f"console_log.txt unterschiedlich ({name})")
+            prints = lines if workload is _table_rows else lines // 20
+            base = results["_Tee"][0]
+            for variant, (elapsed, calls) in results.items():
+                print(f"{name:>16} | {variant:>14} | {elapsed:>8.3f} | {1e6 * elapsed / prints:>8.2f} | {calls:>13} | {base / elapsed:>6.1f}x")
+        print("\nLog-Dateien identisch.")
+        check_limits(tmp)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Vergleich der Entropie-Coder auf derselben Häufigkeitstabelle: kanonischer Huffman-Code,
+Range-Coder, rANS und tANS gegen die Shannon-Schranke (bit/Symbol) sowie Encoder-/Decoder-MB/s.
+
+Eingabe: die Beispieltexte der Labs (01_02 und 01_04), jeweils wiederholt bis zur Zielgröße
+(Standard 5 MB). Alle Coder nutzen die Zählwerte der Eingabe; Range/ANS arbeiten mit der auf
+2**scale_bits quantisierten Tabelle (coding.FrequencyTable). Angegeben ist die Nutzlast ohne Tabelle.
+Jeder Round-Trip wird mit dem Original verglichen.
+
+Verwendung (aus lab_suite):
+  python benchmarks/bench_entropy_coders.py
+  python benchmarks/bench_entropy_coders.py --size-mb 20 --scale-bits 11 14
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
+
+from coding import CanonicalCode, FrequencyTable, RangeCoder, RANSCoder, TANSCoder
+
+SAMPLE_PATHS = [
+    _LAB_SUITE_ROOT / "labs" / "01_02_Informationstheorie" / "sampletext.txt",
+    _LAB_SUITE_ROOT / "labs" / "01_04_Datenkompression" / "sampletext.txt",
+]
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def bench(name: str, data: bytes, scale_bits: int) -> None:
+    mb = len(data) / 1e6
+    table = FrequencyTable.from_data(data, scale_bits=scale_bits)
+    print(f"\n{name} ({mb:.1f} MB, {len(table.counts)} Symbole, scale_bits={scale_bits})")
+    print(f"{'Coder':>16} | {'bit/Symbol':>10} | {'über H':>8} | {'Enc MB/s':>9} | {'Dec MB/s':>9} | Round-Trip")
+    print("-" * 74)
+    h = table.entropy()
+    print(f"{'Shannon-Schranke':>16} | {h:>10.4f} | {0.0:>7.2f}% | {'':>9} | {'':>9} |")
+
+    huffman = CanonicalCode.from_weights(table.counts)
+    coders = [
+        ("Huffman", huffman.encode, lambda e: huffman.decode(e, len(data))),
+        ("Range", RangeCoder(table).encode, lambda e: RangeCoder(table).decode(e, len(data))),
+        ("rANS", RANSCoder(table).encode, lambda e: RANSCoder(table).decode(e, len(data))),
+        ("tANS", TANSCoder(table).encode, lambda e: TANSCoder(table).decode(e, len(data))),
+    ]
+    for coder_name, encode, decode in coders:
+        t_enc, encoded = _timed(lambda: encode(data))
+        t_dec, decoded = _timed(lambda: decode(encoded))
+        bits = 8 * len(encoded) / len(data)
+        print(f"{coder_name:>16} | {bits:>10.4f} | {100 * (bits - h) / h:>7.2f}% | {mb / t_enc:>9.2f} | {mb / t_dec:>9.2f} | "
+              f"{'OK' if decoded == data else 'FEHLER'}")
+    print(f"{'(quantisiert)':>16} | {table.ideal_bits():>10.4f} | {100 * (table.ideal_bits() - h) / h:>7.2f}% | Grenze für Range/ANS")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Huffman vs. Range vs. rANS vs. tANS gegen die Shannon-Schranke.")
+    parser.add_argument("--size-mb", type=float, default=5.0, help="Größe je skaliertem Beispieltext in MB (Standard 5)")
+    parser.add_argument("--scale-bits", type=int, nargs="*", default=[12], help="Auflösung der Häufigkeitstabelle (2**bits)")
+    args = parser.parse_args()
+
+    size = int(args.size_mb * 1e6)
+    for path in SAMPLE_PATHS:
+        sample = path.read_bytes()
+        data = (sample * (size // len(sample) + 1))[:size]
+        for scale_bits in args.scale_bits:
+            bench(f"{path.parent.name}/{path.name}", data, scale_bits)
+
+
+if __name__ == "__main__":
+    main()
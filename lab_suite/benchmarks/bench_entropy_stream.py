@@ -0,0 +1,109 @@
+"""
+Benchmark: Entropie-Analyse großer Dateien (coding.entropy) – blockweise mit numpy.bincount
+gegen die bisherige Zeichen-Schleife aus entropy1.py.
+
+Erzeugt eine temporäre Datei aus labs/01_02_Informationstheorie/sampletext.txt (wiederholt bis zur
+Zielgröße, Standard 1 GB), misst Laufzeit und Spitzen-Speicher (tracemalloc, inkl. NumPy-Puffer)
+für Byte-Modus (read/mmap) und UTF-8-Zeichenmodus. Die Legacy-Schleife läuft nur auf den ersten
+--legacy-mb MB und wird linear hochgerechnet.
+
+Verwendung (aus lab_suite):
+  python benchmarks/bench_entropy_stream.py
+  python benchmarks/bench_entropy_stream.py --size-mb 200 --legacy-mb 5
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
+
+from coding.entropy import count_bytes, count_codepoints, entropy
+
+SAMPLE_PATH = _LAB_SUITE_ROOT / "labs" / "01_02_Informationstheorie" / "sampletext.txt"
+
+
+def legacy_count(path: str) -> dict:
+    """Zeichen-Schleife wie im bisherigen entropy1.py (ohne Dateiausgabe)."""
+    tokens = dict()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            for c in line:
+                if c in tokens:
+                    tokens[c] += 1
+                else:
+                    tokens[c] = 1
+    return tokens
+
+
+def _write_file(path: str, sample: bytes, size: int) -> None:
+    block = sample * max(1, (4 << 20) // len(sample))
+    written = 0
+    with open(path, "wb") as f:
+        while written < size:
+            piece = block[: size - written]
+            f.write(piece)
+            written += len(piece)
+
+
+def _measure(fn) -> tuple[float, float, object]:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Entropie-Analyse (Streaming vs. Zeichen-Schleife).")
+    parser.add_argument("--size-mb", type=float, default=1000.0, help="Größe der Testdatei in MB (Standard 1000)")
+    parser.add_argument("--legacy-mb", type=float, default=10.0, help="Größe für die Legacy-Messung in MB (0 = aus)")
+    parser.add_argument("--dir", default=None, help="Verzeichnis für die Testdatei (Standard: System-Temp)")
+    args = parser.parse_args()
+
+    sample = SAMPLE_PATH.read_bytes()
+    size = int(args.size_mb * 1e6)
+    fd, path = tempfile.mkstemp(suffix=".txt", dir=args.dir)
+    os.close(fd)
+    try:
+        print(f"Erzeuge Testdatei {path} ({args.size_mb:.0f} MB) …")
+        _write_file(path, sample, size)
+        mb = size / 1e6
+        print(f"\n{'Variante':>22} | {'Zeit [s]':>9} | {'MB/s':>8} | {'Peak-Speicher [MB]':>18} | {'H [bit/Symbol]':>14}")
+        print("-" * 84)
+        runs = [
+            ("byte (read)", lambda: count_bytes(path)),
+            ("byte (mmap)", lambda: count_bytes(path, use_mmap=True)),
+            ("utf8 (Codepoints)", lambda: count_codepoints(path)),
+        ]
+        for name, fn in runs:
+            t, peak, counts = _measure(fn)
+            print(f"{name:>22} | {t:>9.2f} | {mb / t:>8.1f} | {peak:>18.1f} | {entropy(counts):>14.4f}")
+
+        if args.legacy_mb > 0:
+            legacy_size = int(min(args.legacy_mb, args.size_mb) * 1e6)
+            fd, legacy_path = tempfile.mkstemp(suffix=".txt", dir=args.dir)
+            os.close(fd)
+            try:
+                _write_file(legacy_path, sample, legacy_size)
+                t, peak, _ = _measure(lambda: legacy_count(legacy_path))
+                rate = legacy_size / 1e6 / t
+                print(f"{'legacy (Zeichen-Schl.)':>22} | {t:>9.2f} | {rate:>8.1f} | {peak:>18.1f} | "
+                      f"(nur {legacy_size / 1e6:.0f} MB, hochgerechnet auf {mb:.0f} MB: {mb / rate:.0f} s)")
+            finally:
+                os.remove(legacy_path)
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
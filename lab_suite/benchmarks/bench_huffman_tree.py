@@ -0,0 +1,128 @@
+"""
+Benchmark: Huffman-Baumaufbau – gemeinsames coding-Paket (heapq, O(n log n)) gegen die
+bisherigen Implementierungen der Labs (Neusortieren nach jedem Merge, O(n² log n)).
+
+- legacy_sorted: wie labs/01_03_Codierung/huffman.py (sorted() der ganzen Liste pro Merge)
+- legacy_sort:   wie _build_huffman_tree in labs/01_05_Huffman_Codetree_live (nodes.sort im while)
+- coding:        coding.build_huffman_tree
+
+Verwendung (aus lab_suite):
+  python benchmarks/bench_huffman_tree.py                    # 256, 10k, 100k Symbole
+  python benchmarks/bench_huffman_tree.py 256 1000 --legacy-max 1000
+
+Die Legacy-Varianten werden oberhalb von --legacy-max übersprungen (quadratische Laufzeit).
+Alle Varianten müssen dieselbe mittlere Codelänge liefern – das wird mitgeprüft. Bei Gleichständen baut
+coding denselben Baum wie legacy_sort (mit reverse_ties=True wie legacy_sorted), siehe tests/test_huffman.py.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
+
+from coding import build_huffman_tree
+
+DEFAULT_SIZES = [256, 10_000, 100_000]
+
+
+def _leaf_depths(root: tuple, is_leaf) -> dict:
+    """Symbol → Tiefe für verschachtelte Legacy-Bäume (iterativ, damit tiefe Bäume kein RecursionError geben)."""
+    depths = {}
+    stack = [(root, 0)]
+    while stack:
+        node, d = stack.pop()
+        if is_leaf(node):
+            depths[node[0]] = d
+        else:
+            stack.append((node[-2], d + 1))
+            stack.append((node[-1], d + 1))
+    return depths
+
+
+def legacy_sorted(freq: list[tuple]) -> dict:
+    """Wie huffman.py: absteigend sortiert, die letzten zwei zusammenfassen, komplett neu sortieren."""
+    # Blatt = (symbol,), innerer Knoten = (None, left, right)
+    nodes = sorted((((sym,), w) for sym, w in freq), key=lambda x: x[1], reverse=True)
+    while len(nodes) > 1:
+        (key1, c1) = nodes[-1]
+        (key2, c2) = nodes[-2]
+        nodes = nodes[:-2]
+        nodes.append(((None, key1, key2), c1 + c2))
+        nodes = sorted(nodes, key=lambda x: x[1], reverse=True)
+    depths = _leaf_depths(nodes[0][0], lambda node: len(node) == 1)
+    return {sym: (d or 1) for sym, d in depths.items()}
+
+
+def legacy_sort(freq: list[tuple]) -> dict:
+    """Wie _build_huffman_tree im Live-Lab: nodes.sort() im while, innerer Knoten vorne eingefügt."""
+    nodes = [(sym, w) for sym, w in freq]
+    while len(nodes) > 1:
+        nodes.sort(key=lambda n: n[1])
+        left, right = nodes[0], nodes[1]
+        nodes = [(None, left[1] + right[1], left, right)] + nodes[2:]
+    depths = _leaf_depths(nodes[0], lambda node: len(node) == 2)
+    return {sym: (d or 1) for sym, d in depths.items()}
+
+
+def engine(freq: list[tuple]) -> dict:
+    tree = build_huffman_tree(freq)
+    return dict(zip(tree.symbols, tree.code_lengths()))
+
+
+def _mean_length(lengths: dict, freq: list[tuple]) -> float:
+    total = sum(w for _, w in freq)
+    return sum(w * lengths[sym] for sym, w in freq) / total
+
+
+def _time_best(fn, freq: list[tuple], repeat: int) -> tuple[float, dict]:
+    best = float("inf")
+    result = {}
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(freq)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Huffman-Baumaufbau (coding vs. Legacy).")
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES, help=f"Alphabetgrößen (Standard: {DEFAULT_SIZES})")
+    parser.add_argument("--legacy-max", type=int, default=10_000, help="Legacy-Varianten nur bis zu dieser Größe messen")
+    parser.add_argument("--repeat", type=int, default=3, help="Wiederholungen (Bestwert zählt)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    variants = [("legacy_sorted", legacy_sorted), ("legacy_sort", legacy_sort), ("coding", engine)]
+    print(f"{'Symbole':>9} | {'Variante':>14} | {'Zeit [ms]':>12} | {'Speedup':>8} | {'L_mittel [bit]':>14}")
+    print("-" * 70)
+    for n in args.sizes:
+        # Häufigkeiten wie bei Wort-/Byte-Alphabeten: Zipf-artig, mit Gleichständen
+        freq = [(f"s{i}", max(1, int(1_000_000 / (i + 1) ** 1.1) + rng.randint(0, 3))) for i in range(n)]
+        rng.shuffle(freq)
+        t_engine, lengths_engine = _time_best(engine, freq, args.repeat)
+        ref_mean = _mean_length(lengths_engine, freq)
+        for name, fn in variants:
+            if name == "coding":
+                t, mean = t_engine, ref_mean
+            elif n > args.legacy_max:
+                print(f"{n:>9} | {name:>14} | {'übersprungen':>12} | {'':>8} | {'':>14}")
+                continue
+            else:
+                t, lengths = _time_best(fn, freq, 1)
+                mean = _mean_length(lengths, freq)
+                if abs(mean - ref_mean) > 1e-9:
+                    print(f"WARNUNG: {name} liefert andere mittlere Codelänge ({mean:.6f} statt {ref_mean:.6f})")
+            speedup = t / t_engine if t_engine > 0 else float("inf")
+            print(f"{n:>9} | {name:>14} | {t * 1000:>12.2f} | {speedup:>7.1f}x | {mean:>14.4f}")
+        print("-" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: längenbegrenzte Huffman-Codes (Package-Merge, coding.length_limited_code_lengths)
+gegenüber dem unbegrenzten Huffman-Baum (coding.build_huffman_tree).
+
+Vokabulare: Wort-Häufigkeiten von sampletext.txt (01_04) sowie Zipf-verteilte Wort-Alphabete
+(Anzahl ∝ 1/Rang, viele seltene Wörter mit Anzahl 1) und ein Fibonacci-Alphabet als schlimmster
+Fall (Huffman-Codes so lang wie das Alphabet).
+Pro Vokabular und Längengrenze L: mittlere Codelänge, Aufschlag gegenüber Huffman (bit/Wort und %),
+Laufzeit. Geprüft wird jeweils, dass der Code vollständig ist (Kraft-Summe = 1) und L einhält.
+
+Verwendung (aus lab_suite):
+  python benchmarks/bench_length_limited.py
+  python benchmarks/bench_length_limited.py --sizes 1000 100000 --limits 10 12 16 20 24
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from fractions import Fraction
+from pathlib import Path
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
+
+from coding import build_huffman_tree, count_words_in_file, length_limited_code_lengths
+
+SAMPLE_PATH = _LAB_SUITE_ROOT / "labs" / "01_04_Datenkompression" / "sampletext.txt"
+
+
+def zipf_counts(size: int, top_count: int) -> dict[str, int]:
+    """Wort-Alphabet mit size Wörtern, Anzahl des Rangs r = max(1, top_count // r)."""
+    return {f"w{r}": max(1, top_count // r) for r in range(1, size + 1)}
+
+
+def fibonacci_counts(size: int) -> dict[str, int]:
+    """Anzahlen 1, 1, 2, 3, 5, … → entarteter Huffman-Baum mit Codelängen bis size − 1."""
+    counts = [1, 1]
+    while len(counts) < size:
+        counts.append(counts[-1] + counts[-2])
+    return {f"f{i}": c for i, c in enumerate(counts[:size])}
+
+
+def _mean(weights: dict, lengths: dict) -> float:
+    return sum(w * lengths[s] for s, w in weights.items()) / sum(weights.values())
+
+
+def bench(name: str, weights: dict, limits: list[int]) -> None:
+    n = len(weights)
+    total = sum(weights.values())
+    h = -sum(w / total * math.log2(w / total) for w in weights.values())
+    t0 = time.perf_counter()
+    tree = build_huffman_tree(weights)
+    t_huffman = time.perf_counter() - t0
+    huffman_lengths = dict(zip(tree.symbols, tree.code_lengths()))
+    huffman_mean = _mean(weights, huffman_lengths)
+    max_huffman = max(huffman_lengths.values())
+    print(f"\n{name}: {n} Symbole, H = {h:.4f} bit, Huffman {huffman_mean:.4f} bit/Symbol, "
+          f"längstes Codewort {max_huffman} bit ({t_huffman * 1e3:.1f} ms)")
+    print(f"{'L':>4} | {'mittl. Länge':>12} | {'Aufschlag bit':>13} | {'Aufschlag':>9} | {'max':>4} | {'Zeit ms':>8}")
+    print("-" * 66)
+    for limit in limits:
+        if (1 << limit) < n:
+            continue
+        t0 = time.perf_counter()
+        lengths = length_limited_code_lengths(weights, limit)
+        t_pm = time.perf_counter() - t0
+        if max(lengths.values()) > limit or sum(Fraction(1, 1 << l) for l in lengths.values()) != 1:
+            raise AssertionError(f"Ungültiger Code für L={limit}")
+        mean = _mean(weights, lengths)
+        print(f"{limit:>4} | {mean:>12.4f} | {mean - huffman_mean:>13.4f} | {100 * (mean - huffman_mean) / huffman_mean:>8.3f}% | "
+              f"{max(lengths.values()):>4} | {t_pm * 1e3:>8.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Package-Merge: Aufschlag der mittleren Codelänge je Längengrenze L.")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1_000, 10_000, 100_000], help="Vokabulargrößen (Zipf)")
+    parser.add_argument("--top-count", type=int, default=10_000_000, help="Anzahl des häufigsten Worts (Standard 10⁷)")
+    parser.add_argument("--limits", type=int, nargs="*", default=[8, 10, 12, 14, 16, 18, 20, 24, 32], help="Längengrenzen L")
+    args = parser.parse_args()
+
+    bench("sampletext.txt (Wörter)", dict(count_words_in_file(SAMPLE_PATH)), args.limits)
+    for size in args.sizes:
+        bench(f"Zipf {size}", zipf_counts(size, args.top_count), args.limits)
+    bench("Fibonacci 60", fibonacci_counts(60), args.limits)
+
+
+if __name__ == "__main__":
+    main()
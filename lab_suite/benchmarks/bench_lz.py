@@ -0,0 +1,140 @@
+"""
+Benchmark: Wörterbuch-Kompression (coding.LZSS, coding.LZW) gegen zlib und lzma aus der Standardbibliothek.
+
+Teil 1 – Kompressionsrate und Durchsatz: sampletext.txt (01_04), wiederholt bis zur Zielgröße
+(Standard 5 MB), blockweise kodiert (1 MiB) und wieder dekodiert; Round-Trip wird geprüft.
+
+Teil 2 – Treffersuche naiv vs. Hash-Ketten über der Fenstergröße auf einer kleinen Eingabe
+(Standard 100 kB): die naive Suche kostet O(Fenster) pro Byte, die Hash-Ketten höchstens
+max_chain Kandidaten. Ausgegeben wird, ab welcher Fenstergröße sich der Index lohnt.
+
+Verwendung (aus lab_suite):
+  python benchmarks/bench_lz.py
+  python benchmarks/bench_lz.py --size-mb 20 --crossover-kb 50 --max-window-bits 12
+"""
+from __future__ import annotations
+
+import argparse
+import lzma
+import sys
+import time
+import zlib
+from pathlib import Path
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
+
+from coding import LZSS, LZW
+
+SAMPLE_PATH = _LAB_SUITE_ROOT / "labs" / "01_04_Datenkompression" / "sampletext.txt"
+CHUNK_SIZE = 1 << 20
+
+
+def _scaled(sample: bytes, size: int) -> bytes:
+    return (sample * (size // len(sample) + 1))[:size]
+
+
+def _chunks(data: bytes):
+    for start in range(0, len(data), CHUNK_SIZE):
+        yield data[start : start + CHUNK_SIZE]
+
+
+def _stdlib_codecs():
+    """zlib/lzma als Streaming-Objekte in dieselbe (encode, decode)-Form bringen."""
+
+    def zlib_codec(level):
+        def encode(data):
+            c = zlib.compressobj(level)
+            return b"".join([*(c.compress(chunk) for chunk in _chunks(data)), c.flush()])
+
+        def decode(encoded):
+            d = zlib.decompressobj()
+            return b"".join([*(d.decompress(chunk) for chunk in _chunks(encoded)), d.flush()])
+
+        return f"zlib -{level}", encode, decode
+
+    def lzma_codec(preset):
+        def encode(data):
+            c = lzma.LZMACompressor(preset=preset)
+            return b"".join([*(c.compress(chunk) for chunk in _chunks(data)), c.flush()])
+
+        def decode(encoded):
+            d = lzma.LZMADecompressor()
+            return b"".join(d.decompress(chunk) for chunk in _chunks(encoded))
+
+        return f"lzma -{preset}", encode, decode
+
+    return [zlib_codec(1), zlib_codec(6), zlib_codec(9), lzma_codec(0), lzma_codec(6)]
+
+
+def bench_ratio(data: bytes) -> None:
+    mb = len(data) / 1e6
+    print(f"\nKompression von {mb:.1f} MB (sampletext.txt hochskaliert, Blöcke zu {CHUNK_SIZE >> 10} KiB)")
+    print(f"{'Verfahren':>22} | {'Größe':>10} | {'Rate':>7} | {'Enc MB/s':>9} | {'Dec MB/s':>9} | Round-Trip")
+    print("-" * 80)
+    codecs = []
+    for window_bits, max_chain in ((12, 8), (15, 4), (15, 32), (16, 128)):
+        lz = LZSS(window_bits=window_bits, max_chain=max_chain)
+        codecs.append((f"LZSS 2^{window_bits} Kette {max_chain}",
+                       lambda d, lz=lz: b"".join(lz.encode_iter(_chunks(d))),
+                       lambda e, lz=lz: b"".join(lz.decode_iter(_chunks(e)))))
+    for max_bits in (12, 16):
+        lzw = LZW(max_bits=max_bits)
+        codecs.append((f"LZW {max_bits} bit",
+                       lambda d, lzw=lzw: b"".join(lzw.encode_iter(_chunks(d))),
+                       lambda e, lzw=lzw: b"".join(lzw.decode_iter(_chunks(e)))))
+    codecs += _stdlib_codecs()
+    for name, encode, decode in codecs:
+        t0 = time.perf_counter()
+        encoded = encode(data)
+        t_enc = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        decoded = decode(encoded)
+        t_dec = time.perf_counter() - t0
+        print(f"{name:>22} | {len(encoded):>10} | {100 * len(encoded) / len(data):>6.2f}% | {mb / t_enc:>9.2f} | "
+              f"{mb / t_dec:>9.2f} | {'OK' if decoded == data else 'FEHLER'}")
+
+
+def bench_crossover(data: bytes, max_window_bits: int) -> None:
+    kb = len(data) / 1e3
+    print(f"\nTreffersuche naiv vs. Hash-Ketten ({kb:.0f} kB, LZSS-Encoder, Kette {LZSS().max_chain})")
+    print(f"{'Fenster':>8} | {'naiv s':>8} | {'Hash s':>8} | {'Faktor':>7} | {'Rate naiv':>9} | {'Rate Hash':>9}")
+    print("-" * 66)
+    crossover = None
+    for window_bits in range(3, max_window_bits + 1):
+        times = {}
+        sizes = {}
+        for finder in ("naive", "hash"):
+            lz = LZSS(window_bits=window_bits, match_finder=finder)
+            t0 = time.perf_counter()
+            encoded = lz.encode(data)
+            times[finder] = time.perf_counter() - t0
+            sizes[finder] = len(encoded)
+            if lz.decode(encoded) != data:
+                raise AssertionError(f"Round-Trip fehlgeschlagen ({finder}, Fenster 2^{window_bits})")
+        factor = times["naive"] / times["hash"]
+        if crossover is None and factor > 1.0:
+            crossover = window_bits
+        print(f"{1 << window_bits:>8} | {times['naive']:>8.3f} | {times['hash']:>8.3f} | {factor:>6.1f}x | "
+              f"{100 * sizes['naive'] / len(data):>8.2f}% | {100 * sizes['hash'] / len(data):>8.2f}%")
+    if crossover is not None:
+        print(f"Der Hash-Index lohnt sich ab einem Fenster von {1 << crossover} Bytes.")
+    else:
+        print("Der Hash-Index war in diesem Bereich nicht schneller.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="LZSS/LZW vs. zlib/lzma; naive vs. Hash-Ketten-Treffersuche.")
+    parser.add_argument("--size-mb", type=float, default=5.0, help="Eingabegröße für Teil 1 in MB (Standard 5)")
+    parser.add_argument("--crossover-kb", type=float, default=100.0, help="Eingabegröße für Teil 2 in kB (Standard 100)")
+    parser.add_argument("--max-window-bits", type=int, default=11, help="größtes Fenster in Teil 2 als 2**bits (Standard 11)")
+    args = parser.parse_args()
+
+    sample = SAMPLE_PATH.read_bytes()
+    bench_ratio(_scaled(sample, int(args.size_mb * 1e6)))
+    bench_crossover(_scaled(sample, int(args.crossover_kb * 1e3)), args.max_window_bits)
+
+
+if __name__ == "__main__":
+    main()
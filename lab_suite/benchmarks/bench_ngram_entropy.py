@@ -0,0 +1,113 @@
+"""
+Benchmark: bedingte Entropie H(X|X₋₁…X₋ₖ) (coding.ngram) je Ordnung k – n-Gramme als uint64-Codes,
+gezählt mit np.bincount/np.unique, gegen eine Dict-Zählung der Teilstrings.
+
+Erzeugt eine temporäre Datei aus labs/01_02_Informationstheorie/sampletext.txt (wiederholt bis zur
+Zielgröße, Standard 100 MB, mit eingestreuten Zählerwörtern, damit die Zahl der n-Gramme wächst).
+Pro k: Laufzeit, MB/s, Spitzen-Speicher (tracemalloc, inkl. NumPy-Puffer) und Zahl der (k+1)-Gramme.
+Die Dict-Variante läuft nur auf den ersten --legacy-mb MB; dort werden beide Ergebnisse verglichen.
+
+Verwendung (aus lab_suite):
+  python benchmarks/bench_ngram_entropy.py
+  python benchmarks/bench_ngram_entropy.py --size-mb 20 --orders 1 3 6 --unit byte
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
+
+from coding.entropy import UNITS
+from coding.ngram import conditional_entropies
+
+SAMPLE_PATH = _LAB_SUITE_ROOT / "labs" / "01_02_Informationstheorie" / "sampletext.txt"
+
+
+def legacy_conditional_entropy(path: str, k: int, unit: str) -> float:
+    """H(X|X₋ₖ…) über Dict-Zählung der Teilstrings (k+1)- und k-Gramme."""
+    if unit == "byte":
+        with open(path, "rb") as f:
+            data = f.read()
+    else:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            data = f.read()
+
+    def block(n: int) -> float:
+        if n == 0:
+            return 0.0
+        counts = Counter(data[i : i + n] for i in range(len(data) - n + 1))
+        total = sum(counts.values())
+        return math.log2(total) - sum(c * math.log2(c) for c in counts.values()) / total
+
+    return block(k + 1) - block(k)
+
+
+def _write_file(path: str, sample: bytes, size: int) -> None:
+    written = 0
+    i = 0
+    with open(path, "wb") as f:
+        while written < size:
+            piece = sample + f" wort{i % 100_000}\n".encode()
+            f.write(piece)
+            written += len(piece)
+            i += 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark bedingte Entropie je Ordnung k (NumPy-n-Gramme vs. Dict).")
+    parser.add_argument("--size-mb", type=float, default=100.0, help="Größe der Testdatei in MB (Standard 100)")
+    parser.add_argument("--orders", type=int, nargs="*", default=list(range(7)), help="Ordnungen k (Standard 0…6)")
+    parser.add_argument("--unit", choices=UNITS, default="utf8", help="Symbol-Einheit (Standard utf8)")
+    parser.add_argument("--legacy-mb", type=float, default=2.0, help="Größe für die Dict-Messung in MB (0 = aus)")
+    parser.add_argument("--dir", default=None, help="Verzeichnis für die Testdatei (Standard: System-Temp)")
+    args = parser.parse_args()
+
+    sample = SAMPLE_PATH.read_bytes()
+    fd, path = tempfile.mkstemp(suffix=".txt", dir=args.dir)
+    os.close(fd)
+    fd, legacy_path = tempfile.mkstemp(suffix=".txt", dir=args.dir)
+    os.close(fd)
+    try:
+        print(f"Erzeuge Testdatei {path} ({args.size_mb:.0f} MB) …")
+        _write_file(path, sample, int(args.size_mb * 1e6))
+        mb = os.path.getsize(path) / 1e6
+        if args.legacy_mb > 0:
+            _write_file(legacy_path, sample, int(min(args.legacy_mb, args.size_mb) * 1e6))
+        legacy_mb = os.path.getsize(legacy_path) / 1e6
+
+        print(f"\n{'k':>2} | {'Zeit [s]':>9} | {'MB/s':>7} | {'Peak [MB]':>9} | {'(k+1)-Gramme':>12} | {'H [bit/Symbol]':>14} | Dict ({legacy_mb:.1f} MB)")
+        print("-" * 96)
+        for k in args.orders:
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            rows = conditional_entropies(path, k, args.unit)
+            t = time.perf_counter() - t0
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            last = rows[-1]
+            legacy = ""
+            if args.legacy_mb > 0:
+                t0 = time.perf_counter()
+                h_ref = legacy_conditional_entropy(legacy_path, k, args.unit)
+                t_ref = time.perf_counter() - t0
+                h_new = conditional_entropies(legacy_path, k, args.unit)[-1].conditional_entropy
+                ok = abs(h_ref - h_new) < 1e-9
+                legacy = f"{legacy_mb / t_ref:.2f} MB/s, {'identisch' if ok else 'ABWEICHUNG'}"
+            print(f"{k:>2} | {t:>9.2f} | {mb / t:>7.1f} | {peak / 1e6:>9.1f} | {last.distinct:>12} | {last.conditional_entropy:>14.4f} | {legacy}")
+    finally:
+        os.remove(path)
+        os.remove(legacy_path)
+
+
+if __name__ == "__main__":
+    main()
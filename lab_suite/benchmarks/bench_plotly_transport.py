@@ -0,0 +1,103 @@
+"""
+Benchmark: Datentransport PlotlyGraph → Browser – bisher NumPy .tolist() + JSON-Dezimaltext gegen binäre
+Typed-Array-Payloads {"dtype", "bdata"} (base64, float64 bzw. float32).
+
+Gemessen pro Frame (eine Spur mit x und y, wie update_plot im Assignment): Zeit für _to_serializable plus
+JSON-Kodierung des Props-Dicts mit NiceGUIs json.dumps (orjson, wie beim Websocket-Versand) und die Bytes
+des kodierten Pakets. Geprüft wird, dass die base64-Daten zurück dekodiert den Eingabewerten entsprechen
+(float64 exakt, float32 bis auf die float32-Rundung). Die Dekodierung im Browser (plotly_graph.js:
+atob → ArrayBuffer → Float64Array) ist nicht enthalten. Zusätzlich mit Decimation (minmax, lttb auf
+--max-points Punkte, wie PlotlyGraph(decimation=...)) inkl. der Zeit für die Reduktion.
+
+Verwendung (aus lab_suite):
+  python benchmarks/bench_plotly_transport.py
+  python benchmarks/bench_plotly_transport.py --points 2000 50000 500000 1000000 --repeat 20
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
+
+from nicegui.json import dumps
+
+from widgets.plotly_decimation import decimate_trace
+from widgets.plotly_graph import _to_serializable
+
+VARIANTS = (
+    ("Liste (bisher)", {"binary": False}),
+    ("binär f8", {"binary": True}),
+    ("binär f4", {"binary": True, "float32": True}),
+    ("minmax + f8", {"binary": True, "decimation": "minmax"}),
+    ("lttb + f8", {"binary": True, "decimation": "lttb"}),
+)
+
+
+def _frame(points: int) -> list[dict]:
+    x = np.linspace(0.0, 1.0, points)
+    y = np.sin(2 * np.pi * 5 * x) + 0.01 * np.random.default_rng(0).standard_normal(points)
+    return [{"x": x, "y": y, "mode": "lines", "name": "Signal"}]
+
+
+def _encode(data: list[dict], options: dict, max_points: int) -> bytes:
+    options = dict(options)
+    method = options.pop("decimation", "none")
+    if method != "none":
+        data = [decimate_trace(t, max_points, method) for t in data]
+    return dumps({"props": {"data": _to_serializable(data, **options), "restyleOnly": True}}).encode("utf-8")
+
+
+def _run(data: list[dict], options: dict, repeat: int, max_points: int) -> tuple[float, int]:
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        size = len(_encode(data, options, max_points))
+        best = min(best, time.perf_counter() - t0)
+    return best, size
+
+
+def check_roundtrip(points: int) -> None:
+    data = _frame(points)
+    y = data[0]["y"]
+    f8 = _to_serializable(data, binary=True)[0]["y"]
+    f4 = _to_serializable(data, binary=True, float32=True)[0]["y"]
+    back8 = np.frombuffer(base64.b64decode(f8["bdata"]), dtype="<f8")
+    back4 = np.frombuffer(base64.b64decode(f4["bdata"]), dtype="<f4")
+    if f8["dtype"] != "f8" or not np.array_equal(back8, y):
+        raise AssertionError("float64-Payload weicht ab")
+    if f4["dtype"] != "f4" or not np.array_equal(back4, y.astype(np.float32)):
+        raise AssertionError("float32-Payload weicht ab")
+    print(f"  Round-Trip OK ({points} Punkte): f8 exakt, f4 max. Abweichung {np.abs(back4 - y).max():.2e}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PlotlyGraph-Transport: tolist()+JSON vs. base64-Typed-Arrays.")
+    parser.add_argument("--points", type=int, nargs="+", default=[2_000, 50_000, 500_000], help="Punkte pro Spur (Standard 2000 50000 500000)")
+    parser.add_argument("--repeat", type=int, default=10, help="Wiederholungen, bestes Ergebnis zählt (Standard 10)")
+    parser.add_argument("--max-points", type=int, default=2000, help="Zielpunkte der Decimation (Standard 2000 ≈ 2 × 1000 px)")
+    args = parser.parse_args()
+
+    print(f"\n{'Punkte':>8} | {'Variante':>14} | {'ms/Frame':>9} | {'KB/Frame':>9} | {'MB/s bei 10 Hz':>14} | {'Faktor':>7}")
+    print("-" * 76)
+    for points in args.points:
+        data = _frame(points)
+        base = None
+        for name, options in VARIANTS:
+            elapsed, size = _run(data, options, args.repeat, args.max_points)
+            base = base or elapsed
+            print(f"{points:>8} | {name:>14} | {1e3 * elapsed:>9.2f} | {size / 1024:>9.1f} | {10 * size / 1e6:>14.2f} | {base / elapsed:>6.1f}x")
+    print()
+    check_roundtrip(max(args.points))
+
+
+if __name__ == "__main__":
+    main()
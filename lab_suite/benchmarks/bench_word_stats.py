@@ -0,0 +1,105 @@
+"""
+Benchmark: Wort-Statistik (coding.words) – Block-Split + Counter, sequentiell und über mehrere Prozesse,
+gegen die bisherige Zeilen-Schleife aus word_dictionary.py (replace/split/dict).
+
+Erzeugt eine temporäre Datei aus labs/01_04_Datenkompression/sampletext.txt (wiederholt bis zur
+Zielgröße, Standard 200 MB). Alle Varianten müssen exakt dieselben Zählungen liefern; zusätzlich
+wird die Top-k-Auswahl per Heap mit dem vollständigen Sortieren verglichen.
+
+Verwendung (aus lab_suite):
+  python benchmarks/bench_word_stats.py
+  python benchmarks/bench_word_stats.py --size-mb 50 --workers 2 4 8
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
+
+from coding.words import average_entropy, count_words_in_file, top_k
+
+SAMPLE_PATH = _LAB_SUITE_ROOT / "labs" / "01_04_Datenkompression" / "sampletext.txt"
+
+
+def legacy_count(path: str) -> dict:
+    """Zeilen-Schleife wie im bisherigen word_dictionary.py."""
+    tokens = dict()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.replace(",", " ")
+            line = line.replace(".", " ")
+            for word in line.split():
+                if word in tokens:
+                    tokens[word] += 1
+                else:
+                    tokens[word] = 1
+    return tokens
+
+
+def _write_file(path: str, sample: bytes, size: int) -> None:
+    # Wiederholungen mit Zähler-Wort, damit das Vokabular mit der Dateigröße wächst (realistischer für top-k)
+    written = 0
+    i = 0
+    with open(path, "wb") as f:
+        while written < size:
+            piece = sample + f" wort{i % 100_000}\n".encode()
+            f.write(piece)
+            written += len(piece)
+            i += 1
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Wort-Statistik (Block-Split/Counter/Prozesse vs. Zeilen-Schleife).")
+    parser.add_argument("--size-mb", type=float, default=200.0, help="Größe der Testdatei in MB (Standard 200)")
+    parser.add_argument("--workers", type=int, nargs="*", default=sorted({2, 4, os.cpu_count() or 1}), help="Prozessanzahlen")
+    parser.add_argument("--shard-mb", type=float, default=16.0, help="Teilstückgröße in MB (Standard 16)")
+    parser.add_argument("--top", type=int, default=20, help="K für den Top-k-Vergleich (Standard 20)")
+    parser.add_argument("--dir", default=None, help="Verzeichnis für die Testdatei (Standard: System-Temp)")
+    args = parser.parse_args()
+
+    sample = SAMPLE_PATH.read_bytes()
+    size = int(args.size_mb * 1e6)
+    shard_size = max(1, int(args.shard_mb * 1e6))
+    fd, path = tempfile.mkstemp(suffix=".txt", dir=args.dir)
+    os.close(fd)
+    try:
+        print(f"Erzeuge Testdatei {path} ({args.size_mb:.0f} MB) …")
+        _write_file(path, sample, size)
+        mb = os.path.getsize(path) / 1e6
+
+        t_ref, reference = _timed(lambda: legacy_count(path))
+        print(f"\n{'Variante':>24} | {'Zeit [s]':>9} | {'MB/s':>8} | {'Speedup':>8} | Zählung")
+        print("-" * 70)
+        print(f"{'legacy (replace/split)':>24} | {t_ref:>9.2f} | {mb / t_ref:>8.1f} | {1.0:>8.2f} | Referenz")
+        runs = [("Block-Split + Counter", 1)] + [(f"{w} Prozesse", w) for w in args.workers if w > 1]
+        for name, workers in runs:
+            t, counts = _timed(lambda: count_words_in_file(path, workers=workers, shard_size=shard_size))
+            ok = counts == reference and list(counts) == list(reference)
+            print(f"{name:>24} | {t:>9.2f} | {mb / t:>8.1f} | {t_ref / t:>8.2f} | {'identisch' if ok else 'ABWEICHUNG'}")
+
+        counts = count_words_in_file(path, shard_size=shard_size)
+        t_sort, full = _timed(lambda: top_k(counts))
+        t_heap, best = _timed(lambda: top_k(counts, args.top))
+        ok = best == full[: args.top]
+        print(f"\nTop-{args.top} aus {len(counts)} Wörtern: sortieren {t_sort * 1000:.1f} ms, Heap {t_heap * 1000:.1f} ms "
+              f"({'identisch' if ok else 'ABWEICHUNG'})")
+        print(f"Mittlere Entropie: {average_entropy(counts):.4f} bit/Wort")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+lab_suite/coding – Wiederverwendbare Bausteine für Informationstheorie und Quellcodierung in den Labs
+(Entropie, n-Gramm-Entropie, Wort-Statistik, Huffman (auch längenbegrenzt), kanonische und adaptive Codes,
+Range-Coder und ANS, LZSS/LZW, Bierdeckel-Telegraf, …).
+
+Skript-Labs (python labs/.../skript.py) müssen den lab_suite-Ordner in sys.path eintragen;
+NiceGUI-Apps (python -m labs.<Name>) haben ihn bereits über app.py.
+"""
+from .adaptive import AdaptiveHuffman, VitterHuffman
+from .ans import RANSCoder, TANSCoder
+from .canonical import CanonicalCode
+from .entropy import count_symbols, entropy, entropy_table
+from .frequencies import FrequencyTable
+from .huffman import (
+    HuffmanTree,
+    build_huffman_tree,
+    build_length_limited_tree,
+    huffman_codebook,
+    length_limited_code_lengths,
+)
+from .lz import LZSS, LZW
+from .ngram import NgramCounter, conditional_entropies, conditional_entropies_of
+from .rangecoder import RangeCoder
+from .telegraph import optimum_sweep
+from .words import count_words_in_file, top_k
+
+__all__ = [
+    "AdaptiveHuffman",
+    "CanonicalCode",
+    "FrequencyTable",
+    "HuffmanTree",
+    "LZSS",
+    "LZW",
+    "NgramCounter",
+    "RANSCoder",
+    "RangeCoder",
+    "TANSCoder",
+    "VitterHuffman",
+    "build_huffman_tree",
+    "build_length_limited_tree",
+    "conditional_entropies",
+    "conditional_entropies_of",
+    "count_words_in_file",
+    "count_symbols",
+    "entropy",
+    "entropy_table",
+    "huffman_codebook",
+    "length_limited_code_lengths",
+    "optimum_sweep",
+    "top_k",
+]
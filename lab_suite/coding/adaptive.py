@@ -0,0 +1,293 @@
+"""
+Adaptiver Huffman-Code (einpassig) über Bytes: FGK (Faller–Gallager–Knuth) und Vitter (Algorithmus Λ).
+
+Encoder und Decoder starten mit demselben leeren Baum (nur der NYT-Knoten „not yet transmitted“)
+und aktualisieren ihn nach jedem Symbol identisch – eine Häufigkeitstabelle muss nicht übertragen
+werden. Ein neues Symbol wird als Code des NYT-Knotens plus 8 Rohbits gesendet.
+
+Knotenspeicher als Listen, indiziert über die implizite Nummerierung (Geschwister-Eigenschaft):
+Position ROOT = 2·257−2 ist die Wurzel, Geschwister liegen immer auf den Positionen (2j, 2j+1),
+das linke Kind auf der geraden Position – das Codebit eines Knotens ist also pos & 1.
+Umgehängt werden nur die Inhalte der Positionen (Gewicht, Symbol bzw. linkes Kind); der Speicher
+bleibt fest bei 513 Einträgen, unabhängig von der Länge des Datenstroms.
+
+- FGK: vor dem Erhöhen wird ein Knoten mit dem höchstnummerierten Knoten gleichen Gewichts getauscht.
+- Vitter: innerhalb eines Gewichts stehen Blätter vor inneren Knoten; ein Knoten „gleitet“ vor den
+  folgenden Block (SlideAndIncrement) – minimiert zusätzlich Summe und Maximum der Codelängen.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from .canonical import DEFAULT_CHUNK_SIZE, _bits_of, _chunks
+
+ALGORITHMS = ("fgk", "vitter")
+NYT = 256  # Pseudo-Symbol für „noch nicht gesendet“
+NUM_NODES = 2 * 257 - 1
+ROOT = NUM_NODES - 1
+_MAX_SYMBOL_BITS = NUM_NODES + 8  # obere Schranke für Pfadlänge + Rohbits eines Symbols
+
+
+class AdaptiveHuffman:
+    """
+    Baumzustand eines adaptiven Huffman-Coders (FGK). Encoder und Decoder benutzen je eine eigene
+    Instanz; nach jedem Symbol wird update(symbol) aufgerufen.
+    """
+
+    algorithm = "fgk"
+
+    def __init__(self) -> None:
+        self.weight = [0] * NUM_NODES
+        self.parent = [-1] * NUM_NODES
+        self.left = [-1] * NUM_NODES  # innere Knoten: Position des linken Kindes (rechts = left + 1)
+        self.symbol = [-1] * NUM_NODES  # Blätter: Bytewert bzw. NYT, innere Knoten: -1
+        self.position = [-1] * 257  # Symbol → Position des Blattes (-1 = noch nicht gesehen)
+        self.symbol[ROOT] = NYT
+        self.position[NYT] = ROOT
+        self.nyt = ROOT
+
+    def codeword(self, sym: int) -> str:
+        """Aktuelles Codewort für sym als '0'/'1'-String (neues Symbol: NYT-Code + 8 Rohbits)."""
+        q = self.position[sym]
+        raw = ""
+        if q < 0:
+            q = self.nyt
+            raw = format(sym, "08b")
+        bits = []
+        while q != ROOT:
+            bits.append("1" if q & 1 else "0")
+            q = self.parent[q]
+        return "".join(reversed(bits)) + raw
+
+    def code_lengths(self) -> dict[int, int]:
+        """Symbol → aktuelle Codelänge (ohne NYT)."""
+        out = {}
+        for sym, q in enumerate(self.position[:NYT]):
+            if q >= 0:
+                n = 0
+                while q != ROOT:
+                    q = self.parent[q]
+                    n += 1
+                out[sym] = n
+        return out
+
+    # ---- Baumpflege ----
+
+    def _split_nyt(self, sym: int) -> int:
+        """NYT-Knoten p wird innerer Knoten mit Kindern NYT (p−2, links) und neuem Blatt (p−1, rechts)."""
+        p = self.nyt
+        self.symbol[p] = -1
+        self.left[p] = p - 2
+        self.parent[p - 2] = self.parent[p - 1] = p
+        self.symbol[p - 2] = NYT
+        self.position[NYT] = p - 2
+        self.symbol[p - 1] = sym
+        self.position[sym] = p - 1
+        self.nyt = p - 2
+        return p
+
+    def _relink(self, x: int) -> None:
+        """Nach dem Verschieben eines Inhalts auf Position x: Symbol-Index bzw. Eltern der Kinder nachführen."""
+        s = self.symbol[x]
+        if s >= 0:
+            self.position[s] = x
+        else:
+            c = self.left[x]
+            self.parent[c] = self.parent[c + 1] = x
+
+    def _swap(self, a: int, b: int) -> None:
+        w, sym, left = self.weight, self.symbol, self.left
+        w[a], w[b] = w[b], w[a]
+        sym[a], sym[b] = sym[b], sym[a]
+        left[a], left[b] = left[b], left[a]
+        self._relink(a)
+        self._relink(b)
+
+    def update(self, sym: int) -> None:
+        """Gewicht von sym erhöhen und Geschwister-Eigenschaft wiederherstellen (FGK)."""
+        w, parent = self.weight, self.parent
+        q = self.position[sym]
+        if q < 0:
+            q = self._split_nyt(sym) - 1
+        while q >= 0:
+            wq = w[q]
+            leader = q
+            while leader < ROOT and w[leader + 1] == wq:
+                leader += 1
+            if leader != q and leader != parent[q]:
+                self._swap(q, leader)
+                q = leader
+            w[q] = wq + 1
+            q = parent[q]
+
+
+class VitterHuffman(AdaptiveHuffman):
+    """Adaptiver Huffman-Coder nach Vitter (Algorithmus Λ): Blätter vor inneren Knoten gleichen Gewichts."""
+
+    algorithm = "vitter"
+
+    def _slide_and_increment(self, p: int) -> int:
+        """Knoten p vor den folgenden Block schieben, Gewicht erhöhen; liefert den nächsten zu erhöhenden Knoten."""
+        w, sym, left = self.weight, self.symbol, self.left
+        wt = w[p]
+        is_leaf = sym[p] >= 0
+        former_parent = self.parent[p]
+        # Blatt: an inneren Knoten gleichen Gewichts vorbei; innerer Knoten: an Blättern mit Gewicht + 1 vorbei
+        target = wt if is_leaf else wt + 1
+        j = p
+        while j < ROOT and w[j + 1] == target and (sym[j + 1] >= 0) != is_leaf:
+            j += 1
+        if j > p:
+            saved = w[p], sym[p], left[p]
+            w[p:j] = w[p + 1 : j + 1]
+            sym[p:j] = sym[p + 1 : j + 1]
+            left[p:j] = left[p + 1 : j + 1]
+            w[j], sym[j], left[j] = saved
+            for x in range(p, j + 1):
+                self._relink(x)
+        w[j] += 1
+        return self.parent[j] if is_leaf else former_parent
+
+    def update(self, sym: int) -> None:
+        w, symbol = self.weight, self.symbol
+        leaf_to_increment = -1
+        q = self.position[sym]
+        if q < 0:
+            # Sonderfall 1: neues Symbol – erst den neuen inneren Knoten, zuletzt das neue Blatt erhöhen
+            q = self._split_nyt(sym)
+            leaf_to_increment = q - 1
+        else:
+            wq = w[q]
+            leader = q
+            while leader < ROOT and w[leader + 1] == wq and symbol[leader + 1] >= 0:
+                leader += 1
+            if leader != q:
+                self._swap(q, leader)
+                q = leader
+            if q == self.nyt + 1:
+                # Sonderfall 2: Geschwister des NYT-Knotens – Eltern zuerst, damit das Blatt nicht am Elternknoten vorbeigleitet
+                leaf_to_increment = q
+                q = self.parent[q]
+        parent = self.parent
+        while q >= 0:
+            wt = w[q]
+            is_leaf = symbol[q] >= 0
+            nxt = q + 1
+            if nxt <= ROOT and w[nxt] == (wt if is_leaf else wt + 1) and (symbol[nxt] >= 0) != is_leaf:
+                q = self._slide_and_increment(q)
+            else:
+                # häufigster Fall: kein Block zum Vorbeigleiten → nur erhöhen (inline, ohne Methodenaufruf)
+                w[q] = wt + 1
+                q = parent[q]
+        if leaf_to_increment >= 0:
+            self._slide_and_increment(leaf_to_increment)
+
+
+def new_model(algorithm: str = "vitter") -> AdaptiveHuffman:
+    """Leeres Modell für "fgk" oder "vitter"."""
+    if algorithm == "fgk":
+        return AdaptiveHuffman()
+    if algorithm == "vitter":
+        return VitterHuffman()
+    raise ValueError(f"Unbekannter Algorithmus {algorithm!r} (erlaubt: {', '.join(ALGORITHMS)})")
+
+
+# ---- Bulk-Encoder / -Decoder ----
+
+
+def encode_iter(chunks: Iterable[bytes], algorithm: str = "vitter") -> Iterator[bytes]:
+    """Byte-Blöcke → gepackter Bitstrom (MSB zuerst); letzter Block mit 0-Bits aufgefüllt."""
+    model = new_model(algorithm)
+    position, parent, update = model.position, model.parent, model.update
+    acc = 0
+    nbits = 0
+    for chunk in chunks:
+        out = bytearray()
+        for sym in chunk:
+            q = position[sym]
+            if q < 0:
+                # NYT-Pfad + 8 Rohbits
+                code = sym
+                n = 8
+                q = model.nyt
+            else:
+                code = 0
+                n = 0
+            while q != ROOT:
+                code |= (q & 1) << n
+                n += 1
+                q = parent[q]
+            acc = (acc << n) | code
+            nbits += n
+            if nbits >= 64:
+                full = nbits >> 3
+                nbits &= 7
+                out += (acc >> nbits).to_bytes(full, "big")
+                acc &= (1 << nbits) - 1
+            update(sym)
+        if nbits >= 8:
+            full = nbits >> 3
+            nbits &= 7
+            out += (acc >> nbits).to_bytes(full, "big")
+            acc &= (1 << nbits) - 1
+        if out:
+            yield bytes(out)
+    if nbits:
+        yield (acc << (8 - nbits)).to_bytes(1, "big")
+
+
+def encode(data: bytes, algorithm: str = "vitter", *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+    """Ganze Eingabe → gepackter Bitstrom. Der Decoder braucht zusätzlich die Symbolanzahl len(data)."""
+    return b"".join(encode_iter(_chunks(data, chunk_size), algorithm))
+
+
+def _decode_bits(model: AdaptiveHuffman, bits: str, stop: int, limit: int, out: bytearray) -> int:
+    """Dekodiert ab Bitposition 0, solange die Startposition <= stop ist und weniger als limit Symbole vorliegen."""
+    symbol, left, update = model.symbol, model.left, model.update
+    append = out.append
+    pos = 0
+    produced = 0
+    while pos <= stop and produced < limit:
+        q = ROOT
+        s = symbol[q]
+        while s < 0:
+            q = left[q] + (bits[pos] == "1")
+            pos += 1
+            s = symbol[q]
+        if s == NYT:
+            s = int(bits[pos : pos + 8], 2)
+            pos += 8
+        append(s)
+        update(s)
+        produced += 1
+    return pos
+
+
+def decode_iter(chunks: Iterable[bytes], count: int, algorithm: str = "vitter") -> Iterator[bytes]:
+    """Gepackte Byte-Blöcke → Blöcke dekodierter Bytes (genau count Symbole insgesamt)."""
+    model = new_model(algorithm)
+    remaining = count
+    rest = ""
+    for chunk in chunks:
+        if remaining <= 0:
+            return
+        bits = rest + _bits_of(chunk)
+        out = bytearray()
+        # nur Symbole beginnen, deren längstmöglicher Code noch vollständig im Puffer liegt
+        pos = _decode_bits(model, bits, len(bits) - _MAX_SYMBOL_BITS, remaining, out)
+        rest = bits[pos:]
+        remaining -= len(out)
+        if out:
+            yield bytes(out)
+    if remaining > 0:
+        out = bytearray()
+        # Restbits mit Nullen auffüllen; danach wird nach count Symbolen abgebrochen
+        _decode_bits(model, rest + "0" * _MAX_SYMBOL_BITS, len(rest) - 1, remaining, out)
+        if len(out) < remaining:
+            raise ValueError(f"Bitstrom zu kurz: {remaining - len(out)} Symbole fehlen")
+        yield bytes(out)
+
+
+def decode(data: bytes, count: int, algorithm: str = "vitter", *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+    """Gepackter Bitstrom → count Bytes."""
+    return b"".join(decode_iter(_chunks(data, chunk_size), count, algorithm))
@@ -0,0 +1,239 @@
+"""
+Asymmetric Numeral Systems (ANS): rANS (byteweise Normierung) und tANS (tabellenbasiert, FSE-Stil).
+
+Beide Varianten kodieren die Symbole eines Blocks in umgekehrter Reihenfolge (ANS ist ein Stapel),
+damit der Decoder vorwärts lesen kann. Jeder Block (Standard 64 Ki Symbole) ist eigenständig:
+Endzustand zuerst, danach die Normierungs-Bytes bzw. -Bits. Der Speicherbedarf ist damit durch die
+Blockgröße begrenzt; Blöcke lassen sich direkt hintereinander hängen.
+
+- rANS: Zustand x ∈ [2**23, 2**31); kodieren x → (x // f) · total + cum[s] + x % f.
+- tANS: Zustand ∈ [L, 2L) mit L = total; Symbole per Schrittweite über die Tabelle verteilt
+  (spread), Kodieren/Dekodieren als Tabellen-Lookup plus nb Bits.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from itertools import chain
+
+from .canonical import DEFAULT_CHUNK_SIZE, _chunks
+from .frequencies import FrequencyTable
+
+DEFAULT_BLOCK_SIZE = 1 << 16
+_RANS_L = 1 << 23
+
+
+def _blocks(chunks: Iterable[bytes], block_size: int) -> Iterator[bytes]:
+    """
+    Beliebige Eingabeblöcke → Blöcke von genau block_size Bytes (letzter ggf. kürzer).
+    Jeder Eingabeblock wird per Offset zerlegt; nur der Rest (< block_size) wird mitgeführt.
+    """
+    rest = b""
+    for chunk in chunks:
+        if rest:
+            chunk = rest + chunk
+        start = 0
+        last = len(chunk) - block_size
+        while start <= last:
+            yield chunk[start : start + block_size]
+            start += block_size
+        rest = chunk[start:]
+    if rest:
+        yield rest
+
+
+class RANSCoder:
+    """rANS über einer FrequencyTable (Bytes 0…255), 32-bit-Zustand, byteweise Normierung."""
+
+    def __init__(self, table: FrequencyTable, *, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        self.table = table
+        self.block_size = block_size
+
+    @classmethod
+    def from_data(cls, data: bytes, **kwargs) -> RANSCoder:
+        block_size = kwargs.pop("block_size", DEFAULT_BLOCK_SIZE)
+        return cls(FrequencyTable.from_data(data, **kwargs), block_size=block_size)
+
+    def _encode_block(self, block: bytes) -> bytes:
+        freq, cum, bits = self.table.freq, self.table.cum, self.table.scale_bits
+        x_max_base = (_RANS_L >> bits) << 8
+        out = bytearray()
+        append = out.append
+        x = _RANS_L
+        for s in reversed(block):
+            f = freq[s]
+            if not f:
+                raise ValueError(f"Symbol {s} nicht in der Häufigkeitstabelle")
+            x_max = x_max_base * f
+            while x >= x_max:
+                append(x & 0xFF)
+                x >>= 8
+            q, r = divmod(x, f)
+            x = (q << bits) + r + cum[s]
+        out += x.to_bytes(4, "little")
+        out.reverse()  # Zustand (big endian) zuerst, dann die Bytes in Lesereihenfolge
+        return bytes(out)
+
+    def encode_iter(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for block in _blocks(chunks, self.block_size):
+            yield self._encode_block(block)
+
+    def encode(self, data: bytes) -> bytes:
+        return b"".join(self._encode_block(block) for block in _chunks(data, self.block_size))
+
+    def decode_iter(self, chunks: Iterable[bytes], count: int) -> Iterator[bytes]:
+        """rANS-Bytestrom → Blöcke dekodierter Bytes (genau count Symbole)."""
+        freq, cum, bits = self.table.freq, self.table.cum, self.table.scale_bits
+        slot_symbol = self.table.slot_symbol
+        mask = (1 << bits) - 1
+        nxt = chain.from_iterable(chunks).__next__
+        remaining = count
+        try:
+            while remaining > 0:
+                n = min(self.block_size, remaining)
+                x = (nxt() << 24) | (nxt() << 16) | (nxt() << 8) | nxt()
+                out = bytearray(n)
+                for i in range(n):
+                    slot = x & mask
+                    s = slot_symbol[slot]
+                    out[i] = s
+                    x = freq[s] * (x >> bits) + slot - cum[s]
+                    while x < _RANS_L:
+                        x = (x << 8) | nxt()
+                remaining -= n
+                yield bytes(out)
+        except StopIteration:
+            raise ValueError("rANS-Bytestrom zu kurz") from None
+
+    def decode(self, data: bytes, count: int) -> bytes:
+        return b"".join(self.decode_iter(_chunks(data, DEFAULT_CHUNK_SIZE), count))
+
+
+class TANSCoder:
+    """
+    tANS (FSE-Stil) über einer FrequencyTable; Tabellengröße L = 2**scale_bits.
+    Zustände ∈ [L, 2L) beim Kodieren bzw. [0, L) beim Dekodieren.
+    """
+
+    def __init__(self, table: FrequencyTable, *, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        self.table = table
+        self.block_size = block_size
+        self._build_tables()
+
+    @classmethod
+    def from_data(cls, data: bytes, **kwargs) -> TANSCoder:
+        block_size = kwargs.pop("block_size", DEFAULT_BLOCK_SIZE)
+        return cls(FrequencyTable.from_data(data, **kwargs), block_size=block_size)
+
+    def _build_tables(self) -> None:
+        freq, cum = self.table.freq, self.table.cum
+        log = self.table.scale_bits
+        size = 1 << log
+        # Symbole über die Tabelle verteilen (ungerade Schrittweite → jede Position genau einmal)
+        spread = [0] * size
+        step = (size >> 1) + (size >> 3) + 3
+        pos = 0
+        for s in range(256):
+            for _ in range(freq[s]):
+                spread[pos] = s
+                pos = (pos + step) & (size - 1)
+        # Decoder: Zustand → (Symbol, Anzahl Bits, Basis des Folgezustands)
+        next_state = list(freq)
+        self._dec_symbol = bytearray(size)
+        self._dec_bits = bytearray(size)
+        self._dec_base = [0] * size
+        # Encoder: (x >> nb) + delta_find[s] → Folgezustand, nb = (x + delta_bits[s]) >> 16
+        self._enc_state = [0] * size
+        seen = [0] * 256
+        for u in range(size):
+            s = spread[u]
+            x = next_state[s]
+            next_state[s] += 1
+            nb = log - (x.bit_length() - 1)
+            self._dec_symbol[u] = s
+            self._dec_bits[u] = nb
+            self._dec_base[u] = (x << nb) - size
+            self._enc_state[cum[s] + seen[s]] = size + u
+            seen[s] += 1
+        self._delta_bits = [0] * 256
+        self._delta_find = [0] * 256
+        for s in range(256):
+            f = freq[s]
+            if f:
+                max_bits = log - ((f - 1).bit_length() - 1 if f > 1 else 0)
+                self._delta_bits[s] = (max_bits << 16) - (f << max_bits)
+                self._delta_find[s] = cum[s] - f
+
+    def _encode_block(self, block: bytes) -> bytes:
+        freq = self.table.freq
+        log = self.table.scale_bits
+        enc_state, delta_bits, delta_find = self._enc_state, self._delta_bits, self._delta_find
+        x = 1 << log
+        pieces: list[tuple[int, int]] = []
+        append = pieces.append
+        for s in reversed(block):
+            if not freq[s]:
+                raise ValueError(f"Symbol {s} nicht in der Häufigkeitstabelle")
+            nb = (x + delta_bits[s]) >> 16
+            append((x & ((1 << nb) - 1), nb))
+            x = enc_state[(x >> nb) + delta_find[s]]
+        # Bitstrom in Lesereihenfolge: Endzustand (log Bits), dann die Bits rückwärts, MSB zuerst
+        out = bytearray()
+        acc = x - (1 << log)
+        nbits = log
+        for value, nb in reversed(pieces):
+            acc = (acc << nb) | value
+            nbits += nb
+            if nbits >= 64:
+                full = nbits >> 3
+                nbits &= 7
+                out += (acc >> nbits).to_bytes(full, "big")
+                acc &= (1 << nbits) - 1
+        if nbits:
+            pad = -nbits & 7
+            out += (acc << pad).to_bytes((nbits + pad) >> 3, "big")
+        return bytes(out)
+
+    def encode_iter(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for block in _blocks(chunks, self.block_size):
+            yield self._encode_block(block)
+
+    def encode(self, data: bytes) -> bytes:
+        return b"".join(self._encode_block(block) for block in _chunks(data, self.block_size))
+
+    def decode_iter(self, chunks: Iterable[bytes], count: int) -> Iterator[bytes]:
+        """tANS-Bitstrom → Blöcke dekodierter Bytes (genau count Symbole)."""
+        log = self.table.scale_bits
+        dec_symbol, dec_bits, dec_base = self._dec_symbol, self._dec_bits, self._dec_base
+        nxt = chain.from_iterable(chunks).__next__
+        buf = 0
+        nbuf = 0
+        remaining = count
+        try:
+            while remaining > 0:
+                n = min(self.block_size, remaining)
+                while nbuf < log:
+                    buf = (buf << 8) | nxt()
+                    nbuf += 8
+                nbuf -= log
+                x = buf >> nbuf
+                buf &= (1 << nbuf) - 1
+                out = bytearray(n)
+                for i in range(n):
+                    out[i] = dec_symbol[x]
+                    nb = dec_bits[x]
+                    while nbuf < nb:
+                        buf = (buf << 8) | nxt()
+                        nbuf += 8
+                    nbuf -= nb
+                    x = dec_base[x] + (buf >> nbuf)
+                    buf &= (1 << nbuf) - 1
+                # Füllbits am Blockende verwerfen (Blöcke beginnen byteweise)
+                nbuf &= ~7
+                buf &= (1 << nbuf) - 1
+                remaining -= n
+                yield bytes(out)
+        except StopIteration:
+            raise ValueError("tANS-Bitstrom zu kurz") from None
+
+    def decode(self, data: bytes, count: int) -> bytes:
+        return b"".join(self.decode_iter(_chunks(data, DEFAULT_CHUNK_SIZE), count))
@@ -0,0 +1,253 @@
+"""
+Kanonischer Huffman-Code: gespeichert werden nur die Codelängen, die Codewörter folgen daraus.
+
+Zuordnung (wie DEFLATE): Symbole nach (Länge, Symbol) sortieren, dann fortlaufend nummerieren;
+beim Übergang zu einer größeren Länge wird der Code nach links geschoben. Encoder und Decoder
+brauchen daher nur {Symbol: Länge}.
+
+Bulk-Encoder/-Decoder arbeiten blockweise auf gepackten Bytes statt auf '0'/'1'-Strings pro Symbol:
+
+- Encoder: Tabelle Symbol → Codewort (aus (code, length) vorberechnet); ein Block wird per
+  str.join in C zusammengesetzt und einmal mit int(…, 2).to_bytes gepackt.
+- Decoder: Lookup-Tabelle über table_bits Bits; ein Eintrag liefert alle Symbole, die vollständig
+  in das Fenster passen (mehrere Symbole pro Lookup). Codes länger als table_bits gehen über den
+  klassischen kanonischen Decoder (first_code/first_index pro Länge).
+
+Symbole: Bytewerte 0…255 (Ein-/Ausgabe bytes), einzelne Zeichen (str) oder beliebige Objekte (list).
+"""
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from itertools import chain
+from typing import Any
+
+from .huffman import HuffmanTree, Weights, build_huffman_tree, build_length_limited_tree
+
+DEFAULT_TABLE_BITS = 12
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _chunks(data: Any, size: int) -> Iterator[Any]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def _bits_of(chunk: bytes) -> str:
+    """Bytes → '0'/'1'-String (MSB zuerst)."""
+    if not chunk:
+        return ""
+    return format(int.from_bytes(chunk, "big"), f"0{8 * len(chunk)}b")
+
+
+class CanonicalCode:
+    """
+    Kanonischer Präfixcode aus {Symbol: Codelänge}.
+    table_bits: Breite der Decoder-Lookup-Tabelle (2**table_bits Einträge). Darf größer als die
+    längste Codelänge sein – dann liefert ein Lookup entsprechend mehr Symbole.
+    """
+
+    def __init__(self, lengths: Mapping[Hashable, int], *, table_bits: int = DEFAULT_TABLE_BITS) -> None:
+        items = [(sym, int(l)) for sym, l in lengths.items() if l > 0]
+        if not items:
+            raise ValueError("Kanonischer Code benötigt mindestens ein Symbol mit Länge > 0")
+        try:
+            items.sort(key=lambda item: (item[1], item[0]))
+        except TypeError:
+            items.sort(key=lambda item: item[1])  # nicht vergleichbare Symbole: Eingabereihenfolge
+        self.symbols: list = [sym for sym, _ in items]
+        self.lengths: list[int] = [l for _, l in items]
+        self.max_length: int = self.lengths[-1]
+
+        # Codes vergeben; zusätzlich first_code/first_index/count pro Länge für den Langcode-Decoder
+        self.codes: list[int] = []
+        self._first_code = [0] * (self.max_length + 1)
+        self._first_index = [0] * (self.max_length + 1)
+        self._count = [0] * (self.max_length + 1)
+        code = 0
+        prev_len = self.lengths[0]
+        for i, l in enumerate(self.lengths):
+            code <<= l - prev_len
+            if self._count[l] == 0:
+                self._first_code[l] = code
+                self._first_index[l] = i
+            self._count[l] += 1
+            self.codes.append(code)
+            code += 1
+            prev_len = l
+        if code > (1 << prev_len):
+            raise ValueError("Codelängen verletzen die Kraft-Ungleichung (kein Präfixcode)")
+
+        if all(isinstance(s, int) and not isinstance(s, bool) and 0 <= s < 256 for s in self.symbols):
+            self._kind = "bytes"
+        elif all(isinstance(s, str) and len(s) == 1 for s in self.symbols):
+            self._kind = "str"
+        else:
+            self._kind = "object"
+        self._build_encode_table()
+        self._table_bits = max(1, table_bits)
+        # so viele Bits müssen ab jeder Startposition verfügbar sein (Tabellenfenster bzw. längster Code)
+        self._window = max(self._table_bits, self.max_length)
+        self._build_decode_table()
+
+    # ---- Konstruktion ----
+
+    @classmethod
+    def from_tree(cls, tree: HuffmanTree, **kwargs: Any) -> CanonicalCode:
+        return cls(dict(zip(tree.symbols, tree.code_lengths())), **kwargs)
+
+    @classmethod
+    def from_weights(cls, weights: Weights, *, max_length: int | None = None, **kwargs: Any) -> CanonicalCode:
+        """Huffman-Code zu den Gewichten; mit max_length längenbegrenzt (Package-Merge)."""
+        if max_length is None:
+            return cls.from_tree(build_huffman_tree(weights), **kwargs)
+        return cls.from_tree(build_length_limited_tree(weights, max_length), **kwargs)
+
+    @classmethod
+    def from_data(cls, data: bytes | str, **kwargs: Any) -> CanonicalCode:
+        """Häufigkeiten aus data zählen (bytes: Bytewerte, str: Zeichen) und Code bauen."""
+        counts: dict = {}
+        for sym in data:
+            counts[sym] = counts.get(sym, 0) + 1
+        return cls.from_weights(counts, **kwargs)
+
+    # ---- Ansichten ----
+
+    def code_lengths(self) -> dict:
+        """Symbol → Codelänge (alles, was zum Speichern/Übertragen des Codes nötig ist)."""
+        return dict(zip(self.symbols, self.lengths))
+
+    def codebook(self) -> dict:
+        """Symbol → Codewort als '0'/'1'-String (für Tabellen-Ausgabe in den Labs)."""
+        return {sym: format(c, f"0{l}b") for sym, c, l in zip(self.symbols, self.codes, self.lengths)}
+
+    def mean_length(self, weights: Mapping[Hashable, float]) -> float:
+        """Mittlere Codelänge (bit/Symbol) bezüglich der Gewichte weights."""
+        lengths = self.code_lengths()
+        total = sum(weights.values())
+        return sum(w * lengths[sym] for sym, w in weights.items()) / total if total else 0.0
+
+    # ---- Tabellen ----
+
+    def _build_encode_table(self) -> None:
+        words = [format(c, f"0{l}b") for c, l in zip(self.codes, self.lengths)]
+        if self._kind == "bytes":
+            table: list[str | None] = [None] * 256
+            for sym, word in zip(self.symbols, words):
+                table[sym] = word
+            self._enc_lookup = table.__getitem__
+        else:
+            self._enc_lookup = dict(zip(self.symbols, words)).__getitem__
+
+    def _match(self, bits: str, pos: int, max_bits: int) -> tuple[Any, int] | None:
+        """Kanonisch dekodieren ab pos (höchstens max_bits Bits); None, wenn kein Code passt."""
+        code = 0
+        first_code, first_index, count = self._first_code, self._first_index, self._count
+        for l in range(1, min(max_bits, self.max_length) + 1):
+            code = (code << 1) | (bits[pos + l - 1] == "1")
+            offset = code - first_code[l]
+            if count[l] and 0 <= offset < count[l]:
+                return self.symbols[first_index[l] + offset], l
+        return None
+
+    def _piece(self, syms: list) -> Any:
+        if self._kind == "bytes":
+            return bytes(syms)
+        if self._kind == "str":
+            return "".join(syms)
+        return tuple(syms)
+
+    def _join(self, pieces: list) -> Any:
+        if self._kind == "bytes":
+            return b"".join(pieces)
+        if self._kind == "str":
+            return "".join(pieces)
+        return list(chain.from_iterable(pieces))
+
+    def _build_decode_table(self) -> None:
+        """table_bits-Muster → (alle darin vollständig enthaltenen Symbole, verbrauchte Bits); 0 Bits = Langcode."""
+        k = self._table_bits
+        table: dict[str, tuple[Any, int]] = {}
+        for pattern in range(1 << k):
+            bits = format(pattern, f"0{k}b")
+            syms = []
+            pos = 0
+            while pos < k:
+                hit = self._match(bits, pos, k - pos)
+                if hit is None:
+                    break
+                syms.append(hit[0])
+                pos += hit[1]
+            table[bits] = (self._piece(syms), pos)
+        self._dec_table = table
+
+    # ---- Bulk-Encoder / -Decoder ----
+
+    def encode_iter(self, chunks: Iterable[Any]) -> Iterator[bytes]:
+        """Blöcke von Symbolen (bytes/str/list) → gepackte Bytes; letzter Block mit 0-Bits aufgefüllt."""
+        lookup = self._enc_lookup
+        carry = ""
+        for chunk in chunks:
+            try:
+                bits = carry + "".join(map(lookup, chunk))
+            except (KeyError, IndexError, TypeError) as e:
+                raise ValueError(f"Symbol nicht im Codebuch: {e}") from None
+            full = len(bits) & ~7
+            if full:
+                yield int(bits[:full], 2).to_bytes(full >> 3, "big")
+            carry = bits[full:]
+        if carry:
+            yield int(carry.ljust(8, "0"), 2).to_bytes(1, "big")
+
+    def encode(self, data: Any, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+        """Ganze Eingabe → gepackter Bitstrom (bytes). Die Symbolanzahl muss der Decoder kennen (len(data))."""
+        return b"".join(self.encode_iter(_chunks(data, chunk_size)))
+
+    def _decode_bits(self, bits: str, stop: int) -> tuple[list, int]:
+        """Dekodiert ab Bitposition 0, solange die Startposition <= stop ist. Rückgabe: (Stücke, neue Position)."""
+        table = self._dec_table
+        k = self._table_bits
+        out: list = []
+        append = out.append
+        pos = 0
+        while pos <= stop:
+            piece, used = table[bits[pos : pos + k]]
+            if used:
+                append(piece)
+                pos += used
+            else:
+                hit = self._match(bits, pos, self.max_length)
+                if hit is None:
+                    raise ValueError(f"Ungültiges Codewort an Bitposition {pos}")
+                append(self._piece([hit[0]]))
+                pos += hit[1]
+        return out, pos
+
+    def decode_iter(self, chunks: Iterable[bytes], count: int) -> Iterator[Any]:
+        """Gepackte Byte-Blöcke → Blöcke dekodierter Symbole (genau count Symbole insgesamt)."""
+        window = self._window
+        remaining = count
+        rest = ""
+        for chunk in chunks:
+            if remaining <= 0:
+                return
+            bits = rest + _bits_of(chunk)
+            pieces, pos = self._decode_bits(bits, len(bits) - window)
+            rest = bits[pos:]
+            block = self._join(pieces)
+            if len(block) >= remaining:
+                yield block[:remaining]
+                return
+            remaining -= len(block)
+            if block:
+                yield block
+        if remaining > 0:
+            # Restbits mit Nullen auffüllen; überzählige Symbole aus dem Füll-Padding werden abgeschnitten
+            pieces, _ = self._decode_bits(rest + "0" * window, len(rest) - 1)
+            block = self._join(pieces)
+            if len(block) < remaining:
+                raise ValueError(f"Bitstrom zu kurz: {remaining - len(block)} Symbole fehlen")
+            yield block[:remaining]
+
+    def decode(self, data: bytes, count: int, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+        """Gepackter Bitstrom → count Symbole (bytes, str oder list je nach Alphabet)."""
+        return self._join(list(self.decode_iter(_chunks(data, chunk_size), count)))
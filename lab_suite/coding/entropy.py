@@ -0,0 +1,157 @@
+"""
+Entropie nullter Ordnung für große Dateien: blockweise lesen, mit numpy.bincount zählen.
+
+Der Speicherbedarf ist konstant (ein Block + Zähl-Array), unabhängig von der Dateigröße.
+Zwei Symbol-Einheiten:
+
+- "byte": Bytewerte 0…255, Zählen direkt auf dem Binärstrom (optional per mmap),
+- "utf8": Unicode-Codepoints (Textmodus wie open(path, 'r'), d. h. mit Zeilenende-Übersetzung).
+
+Optional (first=…) wird beim Zählen das erste Vorkommen jedes Symbols festgehalten; entropy_table ordnet
+Gleichstände dann wie das Dictionary in entropy1.py (Reihenfolge des ersten Auftretens).
+"""
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB: Zwischenarrays von bincount bleiben im Cache
+UNITS = ("byte", "utf8")
+_NUM_CODEPOINTS = 0x110000
+
+
+def iter_byte_chunks(path: str | os.PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False) -> Iterator[np.ndarray]:
+    """Liest die Datei in Blöcken als uint8-Arrays (bei use_mmap ohne Kopie direkt aus der Abbildung)."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if use_mmap and size > 0:
+            # Kein explizites close(): der Aufrufer darf den letzten Block noch halten; die Abbildung
+            # wird freigegeben, sobald kein Array mehr darauf verweist.
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            for start in range(0, size, chunk_size):
+                yield np.frombuffer(mm, dtype=np.uint8, count=min(chunk_size, size - start), offset=start)
+            return
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield np.frombuffer(chunk, dtype=np.uint8)
+
+
+def iter_text_chunks(path: str | os.PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "utf-8") -> Iterator[str]:
+    """Liest die Datei als Text in Blöcken von chunk_size Zeichen (ungültige Bytes → U+FFFD)."""
+    with open(path, "r", encoding=encoding, errors="replace") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def new_first_array(unit: str = "utf8") -> np.ndarray:
+    """Array für first=… (-1 = Symbol noch nicht gesehen), Länge passend zur Einheit."""
+    return np.full(256 if unit == "byte" else _NUM_CODEPOINTS, -1, dtype=np.int64)
+
+
+def _note_first(first: np.ndarray, hist: np.ndarray, chunk: np.ndarray, offset: int) -> None:
+    """Erstes Vorkommen neuer Symbole eintragen; ohne neue Symbole im Block nur ein Vergleich über hist."""
+    n = len(hist)
+    if not ((hist > 0) & (first[:n] < 0)).any():
+        return
+    new = np.flatnonzero(first[chunk] < 0)
+    symbols, idx = np.unique(chunk[new], return_index=True)
+    first[symbols] = offset + new[idx]
+
+
+def count_bytes(
+    path: str | os.PathLike,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_mmap: bool = False,
+    first: np.ndarray | None = None,
+) -> np.ndarray:
+    """Häufigkeit jedes Bytewerts (Array der Länge 256, int64); first: siehe new_first_array."""
+    counts = np.zeros(256, dtype=np.int64)
+    offset = 0
+    for chunk in iter_byte_chunks(path, chunk_size, use_mmap):
+        hist = np.bincount(chunk, minlength=256)
+        counts += hist
+        if first is not None:
+            _note_first(first, hist, chunk, offset)
+            offset += len(chunk)
+    return counts
+
+
+def count_codepoints(
+    path: str | os.PathLike,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+    first: np.ndarray | None = None,
+) -> np.ndarray:
+    """Häufigkeit jedes Unicode-Codepoints (Array der Länge 0x110000, int64); first: siehe new_first_array."""
+    counts = np.zeros(_NUM_CODEPOINTS, dtype=np.int64)
+    offset = 0
+    for text in iter_text_chunks(path, chunk_size, encoding):
+        cps = np.frombuffer(text.encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32)
+        hist = np.bincount(cps)
+        counts[: len(hist)] += hist
+        if first is not None:
+            _note_first(first, hist, cps, offset)
+            offset += len(cps)
+    return counts
+
+
+def count_symbols(path: str | os.PathLike, unit: str = "utf8", **kwargs: Any) -> np.ndarray:
+    """Zählung je nach Einheit: "byte" → count_bytes, "utf8" → count_codepoints."""
+    if unit == "byte":
+        return count_bytes(path, **kwargs)
+    if unit == "utf8":
+        kwargs.pop("use_mmap", None)  # Textmodus liest immer über den Dekoder
+        return count_codepoints(path, **kwargs)
+    raise ValueError(f"Unbekannte Einheit {unit!r} (erlaubt: {', '.join(UNITS)})")
+
+
+def entropy_table(counts: np.ndarray, first: np.ndarray | None = None) -> list[tuple[int, int, float, float, float]]:
+    """
+    Tabelle wie in entropy1.py, absteigend nach Häufigkeit: (Symbolwert, count, p, H = log2(1/p), p·H).
+    Gleichstand: nach erstem Vorkommen, wenn first (aus count_symbols(..., first=…)) angegeben ist,
+    sonst nach Symbolwert.
+    """
+    symbols = np.nonzero(counts)[0]
+    if symbols.size == 0:
+        return []
+    cnt = counts[symbols]
+    if first is not None:
+        order = np.lexsort((first[symbols], -cnt))
+    else:
+        order = np.argsort(-cnt, kind="stable")
+    symbols, cnt = symbols[order], cnt[order]
+    p = cnt / cnt.sum()
+    h = -np.log2(p)
+    return list(zip(symbols.tolist(), cnt.tolist(), p.tolist(), h.tolist(), (p * h).tolist()))
+
+
+def entropy(counts: np.ndarray) -> float:
+    """Mittlere Entropie H = Σ p·log2(1/p) in bit/Symbol."""
+    cnt = counts[counts > 0]
+    if cnt.size == 0:
+        return 0.0
+    p = cnt / cnt.sum()
+    return float(-(p * np.log2(p)).sum())
+
+
+def echo_text(path: str | os.PathLike, max_chars: int, encoding: str = "utf-8") -> Iterator[str]:
+    """Erste max_chars Zeichen der Datei zeilenweise (für die optionale Datei-Ausgabe im Skript)."""
+    remaining = max_chars
+    with open(path, "r", encoding=encoding, errors="replace") as f:
+        while remaining > 0:
+            line = f.readline(remaining)  # begrenzt, auch bei Dateien ohne Zeilenumbrüche
+            if not line:
+                return
+            yield line
+            remaining -= len(line)
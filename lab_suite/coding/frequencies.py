@@ -0,0 +1,84 @@
+"""
+Quantisierte Häufigkeitstabelle für Arithmetik-/Range-Coder und ANS (Bytes 0…255).
+
+Die Zählwerte (dieselben wie für die Huffman-Labs: {Symbol: Anzahl}) werden auf eine Zweierpotenz
+total = 2**scale_bits skaliert, jedes vorkommende Symbol erhält mindestens 1. Rundungsreste werden
+dort verteilt, wo sie die mittlere Codelänge am wenigsten erhöhen. Daraus folgen die Tabellen der
+Coder: freq/cum je Symbol und slot → Symbol für den Decoder.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+
+DEFAULT_SCALE_BITS = 12
+MAX_SCALE_BITS = 16  # Range-Coder: range >= 2**24, davon mindestens 2**8 Stufen je Slot
+
+
+class FrequencyTable:
+    """
+    Häufigkeiten über dem Byte-Alphabet, skaliert auf total = 2**scale_bits.
+    freq[s] > 0 genau für die Symbole mit count > 0; cum[s] = Summe der freq aller kleineren Symbole.
+    """
+
+    def __init__(self, counts: Mapping[int, float], *, scale_bits: int = DEFAULT_SCALE_BITS) -> None:
+        if not 1 <= scale_bits <= MAX_SCALE_BITS:
+            raise ValueError(f"scale_bits muss zwischen 1 und {MAX_SCALE_BITS} liegen")
+        items = {int(s): c for s, c in counts.items() if c > 0}
+        if not items:
+            raise ValueError("Häufigkeitstabelle benötigt mindestens ein Symbol mit Anzahl > 0")
+        if any(not 0 <= s < 256 for s in items):
+            raise ValueError("Symbole müssen Bytewerte 0…255 sein")
+        self.scale_bits = scale_bits
+        self.total = 1 << scale_bits
+        if len(items) > self.total:
+            raise ValueError(f"{len(items)} Symbole passen nicht in 2**{scale_bits} Slots")
+        self.counts = items
+        self.freq = self._quantize(items, self.total)
+        self.cum = [0] * 257
+        for s in range(256):
+            self.cum[s + 1] = self.cum[s] + self.freq[s]
+        slots = bytearray(self.total)
+        for s in range(256):
+            slots[self.cum[s] : self.cum[s + 1]] = bytes([s]) * self.freq[s]
+        self.slot_symbol = bytes(slots)
+
+    @classmethod
+    def from_data(cls, data: bytes, **kwargs) -> FrequencyTable:
+        """Bytewerte in data zählen und Tabelle bauen."""
+        counts = [0] * 256
+        for b in data:
+            counts[b] += 1
+        return cls(dict(enumerate(counts)), **kwargs)
+
+    @staticmethod
+    def _quantize(counts: Mapping[int, float], total: int) -> list[int]:
+        n = sum(counts.values())
+        freq = [0] * 256
+        for s, c in counts.items():
+            freq[s] = max(1, round(c * total / n))
+        diff = total - sum(freq)
+        # Rest einzeln verteilen: jeweils das Symbol, bei dem sich c·log2(f) am günstigsten ändert
+        while diff > 0:
+            s = max(counts, key=lambda s: counts[s] * math.log2((freq[s] + 1) / freq[s]))
+            freq[s] += 1
+            diff -= 1
+        while diff < 0:
+            s = min((s for s in counts if freq[s] > 1), key=lambda s: counts[s] * math.log2(freq[s] / (freq[s] - 1)))
+            freq[s] -= 1
+            diff += 1
+        return freq
+
+    def symbols(self) -> list[int]:
+        """Vorkommende Symbole aufsteigend."""
+        return [s for s in range(256) if self.freq[s]]
+
+    def entropy(self) -> float:
+        """Shannon-Schranke der ursprünglichen Zählwerte in bit/Symbol."""
+        n = sum(self.counts.values())
+        return -sum(c / n * math.log2(c / n) for c in self.counts.values())
+
+    def ideal_bits(self) -> float:
+        """Mittlere Codelänge in bit/Symbol mit den quantisierten Wahrscheinlichkeiten (Grenze für Range/ANS)."""
+        n = sum(self.counts.values())
+        return sum(c / n * (self.scale_bits - math.log2(self.freq[s])) for s, c in self.counts.items())
@@ -0,0 +1,233 @@
+"""
+Statischer Huffman-Baum (zwei Durchläufe: erst zählen, dann Baum bauen).
+
+Aufbau in O(n log n) mit heapq statt wiederholtem Sortieren der Knotenliste.
+Der Baum ist array-basiert (keine Knoten-Objekte):
+
+- Blätter haben die Indizes 0 … n-1 (Reihenfolge der Eingabe),
+- innere Knoten n … 2n-2 in Entstehungsreihenfolge, die Wurzel ist der letzte Knoten,
+- left/right[i] = Kind-Indizes (-1 bei Blättern), weights[i] = Gewicht (Häufigkeit/Wahrscheinlichkeit).
+
+Kinder haben immer kleinere Indizes als ihr Elternknoten; Codelängen und Codewörter
+werden daher mit einer einfachen Schleife von der Wurzel abwärts berechnet (ohne Rekursion).
+Konvention wie in labs/01_03_Codierung/huffman.py: das seltenere Kind links ('0').
+Gleichstände werden wie in den bisherigen Lab-Implementierungen aufgelöst (gleiche Codes und Bäume):
+ein neu entstandener innerer Knoten kommt vor allen älteren Knoten gleichen Gewichts an die Reihe,
+Blätter in Eingabereihenfolge (reverse_ties=True: umgekehrt, wie die absteigend sortierte Liste in 01_03).
+
+Längenbegrenzte Codes (Package-Merge, O(n·L)): optimale Präfixcodes mit höchstens max_length Bit
+pro Codewort, z. B. für Wort-Alphabete, bei denen Huffman sonst 30+ Bit lange Codes liefert.
+"""
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Union
+
+# Eingabe: {Symbol: Gewicht} oder Folge von (Symbol, Gewicht)-Paaren (z. B. sortierte freq-Liste)
+Weights = Union[Mapping[Hashable, float], Iterable[tuple[Hashable, float]]]
+
+
+@dataclass
+class HuffmanTree:
+    """Array-basierter Huffman-Baum (siehe Modul-Docstring für die Index-Konvention)."""
+    symbols: list
+    weights: list
+    left: array
+    right: array
+
+    @property
+    def num_leaves(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def root(self) -> int:
+        return len(self.weights) - 1
+
+    def is_leaf(self, node: int) -> bool:
+        return node < len(self.symbols)
+
+    def depths(self) -> list[int]:
+        """Tiefe jedes Knotens (Wurzel = 0), Index wie weights."""
+        depth = [0] * len(self.weights)
+        left, right = self.left, self.right
+        for node in range(self.root, self.num_leaves - 1, -1):
+            d = depth[node] + 1
+            depth[left[node]] = d
+            depth[right[node]] = d
+        return depth
+
+    def code_lengths(self) -> list[int]:
+        """Codelänge pro Blatt (Reihenfolge wie symbols). Ein einzelnes Symbol bekommt Länge 1."""
+        if self.num_leaves == 1:
+            return [1]
+        return self.depths()[: self.num_leaves]
+
+    def codes(self) -> list[str]:
+        """Codewörter als '0'/'1'-Strings pro Blatt (Reihenfolge wie symbols); ein einzelnes Symbol: ''."""
+        n = self.num_leaves
+        if n == 1:
+            return [""]
+        code = [""] * len(self.weights)
+        left, right = self.left, self.right
+        for node in range(self.root, n - 1, -1):
+            prefix = code[node]
+            code[left[node]] = prefix + "0"
+            code[right[node]] = prefix + "1"
+        return code[:n]
+
+    def codebook(self) -> dict:
+        """Symbol → Codewort ('0'/'1'-String), wie huffman_code_tree() in den Skript-Labs."""
+        return dict(zip(self.symbols, self.codes()))
+
+    def mean_length(self) -> float:
+        """Mittlere Codelänge (bit/Symbol), gewichtet mit den Blattgewichten."""
+        total = sum(self.weights[: self.num_leaves])
+        if total <= 0:
+            return 0.0
+        return sum(w * l for w, l in zip(self.weights, self.code_lengths())) / total
+
+
+def build_huffman_tree(weights: Weights, *, reverse_ties: bool = False) -> HuffmanTree:
+    """
+    Baut den Huffman-Baum in O(n log n).
+    weights: {Symbol: Gewicht} oder Folge von (Symbol, Gewicht); Gewichte dürfen int oder float sein.
+    Gleiche Gewichte: zuerst der jüngste innere Knoten, dann Blätter in Eingabereihenfolge
+    (wie nodes.sort() im Live-Lab 01_05); reverse_ties=True: Blätter von hinten (wie 01_03).
+    """
+    items = list(weights.items()) if isinstance(weights, Mapping) else list(weights)
+    n = len(items)
+    if n == 0:
+        raise ValueError("Huffman-Baum benötigt mindestens ein Symbol")
+    symbols = [sym for sym, _ in items]
+    node_weights = [w for _, w in items]
+    left = array("i", [-1]) * n
+    right = array("i", [-1]) * n
+
+    # (Gewicht, Rang, Knoten): Rang der Blätter ±Index, innere Knoten immer kleiner und jeder neue kleiner
+    sign = -1 if reverse_ties else 1
+    heap = [(w, sign * i, i) for i, w in enumerate(node_weights)]
+    heapq.heapify(heap)
+    for node in range(n, 2 * n - 1):
+        w_a, _, a = heapq.heappop(heap)
+        w_b, _, b = heap[0]
+        w = w_a + w_b
+        heapq.heapreplace(heap, (w, -node, node))
+        node_weights.append(w)
+        left.append(a)
+        right.append(b)
+    return HuffmanTree(symbols=symbols, weights=node_weights, left=left, right=right)
+
+
+def huffman_codebook(weights: Weights, *, reverse_ties: bool = False) -> dict:
+    """Kurzform: Symbol → Codewort ('0'/'1'-String)."""
+    return build_huffman_tree(weights, reverse_ties=reverse_ties).codebook()
+
+
+def length_limited_code_lengths(weights: Weights, max_length: int) -> dict:
+    """
+    Optimale Codelängen mit höchstens max_length Bit (Package-Merge nach Larmore/Hirschberg), O(n·L).
+
+    Pro Ebene werden die Blätter (aufsteigend nach Gewicht) mit den Paketen der tieferen Ebene
+    (je zwei benachbarte Einträge zusammengefasst) gemischt; gespeichert wird nur, ob ein Eintrag
+    Blatt oder Paket ist. Auf der obersten Ebene werden die leichtesten 2n-2 Einträge gewählt und
+    rückwärts verfolgt: jedes gewählte Blatt verlängert den Code seines Symbols um ein Bit, gewählte
+    Pakete wählen die ersten 2·p Einträge der Ebene darunter.
+    """
+    items = list(weights.items()) if isinstance(weights, Mapping) else list(weights)
+    n = len(items)
+    if n == 0:
+        raise ValueError("Codelängen benötigen mindestens ein Symbol")
+    if n == 1:
+        return {items[0][0]: 1}
+    if max_length < 1 or (1 << max_length) < n:
+        raise ValueError(f"{n} Symbole passen nicht in Codes mit höchstens {max_length} Bit")
+    order = sorted(range(n), key=lambda i: items[i][1])
+    leaf_weights = [items[i][1] for i in order]
+
+    # Ebenen von unten (Länge max_length) nach oben; is_leaf[k] beschreibt die gemischte Liste der Ebene
+    levels: list[bytearray] = []
+    merged = leaf_weights
+    levels.append(bytearray(b"\x01") * n)
+    for _ in range(max_length - 1):
+        packages = [merged[j] + merged[j + 1] for j in range(0, len(merged) - 1, 2)]
+        out: list = []
+        is_leaf = bytearray()
+        a = b = 0
+        na, nb = n, len(packages)
+        while a < na and b < nb:
+            if leaf_weights[a] <= packages[b]:
+                out.append(leaf_weights[a])
+                is_leaf.append(1)
+                a += 1
+            else:
+                out.append(packages[b])
+                is_leaf.append(0)
+                b += 1
+        out.extend(leaf_weights[a:])
+        is_leaf.extend(b"\x01" * (na - a))
+        out.extend(packages[b:])
+        is_leaf.extend(bytes(nb - b))
+        # mehr als 2n-2 Einträge werden auf keiner Ebene gebraucht
+        del out[2 * n - 2 :], is_leaf[2 * n - 2 :]
+        merged = out
+        levels.append(is_leaf)
+
+    lengths = [0] * n
+    take = 2 * n - 2
+    for is_leaf in reversed(levels):
+        leaves = is_leaf.count(1, 0, take)
+        for k in range(leaves):
+            lengths[k] += 1
+        take = 2 * (take - leaves)
+    return {items[order[k]][0]: lengths[k] for k in range(n)}
+
+
+def build_tree_from_lengths(weights: Weights, lengths: Mapping[Hashable, int]) -> HuffmanTree:
+    """
+    Array-Baum zu vorgegebenen Codelängen (z. B. aus length_limited_code_lengths), Ebene für Ebene
+    von unten: die Knoten einer Tiefe werden nach Gewicht sortiert paarweise zusammengefasst.
+    Die Längen müssen einen vollständigen Code bilden (Kraft-Summe = 1).
+    """
+    items = list(weights.items()) if isinstance(weights, Mapping) else list(weights)
+    n = len(items)
+    if n == 0:
+        raise ValueError("Huffman-Baum benötigt mindestens ein Symbol")
+    symbols = [sym for sym, _ in items]
+    node_weights = [w for _, w in items]
+    left = array("i", [-1]) * n
+    right = array("i", [-1]) * n
+    if n == 1:
+        return HuffmanTree(symbols=symbols, weights=node_weights, left=left, right=right)
+    by_depth: dict[int, list[int]] = {}
+    for i, sym in enumerate(symbols):
+        by_depth.setdefault(lengths[sym], []).append(i)
+    carry: list[int] = []
+    for depth in range(max(by_depth), 0, -1):
+        level = sorted(by_depth.get(depth, []) + carry, key=node_weights.__getitem__)
+        if len(level) % 2:
+            raise ValueError("Codelängen bilden keinen vollständigen Präfixcode (Kraft-Summe ≠ 1)")
+        carry = []
+        for j in range(0, len(level), 2):
+            a, b = level[j], level[j + 1]
+            carry.append(len(node_weights))
+            node_weights.append(node_weights[a] + node_weights[b])
+            left.append(a)
+            right.append(b)
+    if len(carry) != 1:
+        raise ValueError("Codelängen bilden keinen vollständigen Präfixcode (Kraft-Summe ≠ 1)")
+    return HuffmanTree(symbols=symbols, weights=node_weights, left=left, right=right)
+
+
+def build_length_limited_tree(weights: Weights, max_length: int) -> HuffmanTree:
+    """
+    Wie build_huffman_tree, aber mit höchstens max_length Bit pro Codewort. Ist der Huffman-Baum
+    bereits flach genug, wird er unverändert zurückgegeben (gleiche Codes wie ohne Begrenzung).
+    """
+    items = list(weights.items()) if isinstance(weights, Mapping) else list(weights)
+    tree = build_huffman_tree(items)
+    if max(tree.code_lengths()) <= max_length:
+        return tree
+    return build_tree_from_lengths(items, length_limited_code_lengths(items, max_length))
@@ -0,0 +1,325 @@
+"""
+Wörterbuch-Kompression: LZSS (LZ77 mit Flag-Bits) und LZW.
+
+LZSS ersetzt Wiederholungen durch Verweise (Abstand, Länge) in ein gleitendes Fenster der letzten
+2**window_bits Bytes. Der Aufwand steckt in der Suche nach dem längsten Treffer:
+
+- "naive": jede Fensterposition wird verglichen – O(Fenster) pro Eingabebyte, quadratisch im Fenster.
+- "hash": Hash-Ketten wie in zlib. head[3 Bytes] → letzte Position, prev[pos mod Fenster] → vorherige
+  Position mit demselben Präfix; durchsucht werden höchstens max_chain Kandidaten.
+
+Format (bytegenau): Gruppen aus einem Flag-Byte und bis zu 8 Einträgen (Bit i gesetzt → Eintrag i ist
+ein Treffer). Literal: 1 Byte. Treffer: Abstand − 1 (2 Byte, big endian) und Länge − MIN_MATCH (1 Byte).
+
+LZW baut das Wörterbuch während des Kodierens auf (Trie als dict (Code << 8 | Byte) → Code) und
+gibt Codes mit wachsender Breite 9…max_bits aus (LSB zuerst). Ist das Wörterbuch voll, folgt der
+Code CLEAR und beide Seiten beginnen neu (wie compress/GIF).
+
+Beide Verfahren arbeiten blockweise (encode_iter/decode_iter); der Zustand (Fenster bzw. Wörterbuch)
+läuft über die Blockgrenzen weiter, die Ströme sind selbstbegrenzend.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from .canonical import DEFAULT_CHUNK_SIZE, _chunks
+
+MATCH_FINDERS = ("hash", "naive")
+DEFAULT_WINDOW_BITS = 15
+DEFAULT_MAX_CHAIN = 32
+MIN_MATCH = 3
+MAX_MATCH = MIN_MATCH + 255
+MAX_WINDOW_BITS = 16  # Abstand − 1 passt in 2 Byte
+
+LZW_CLEAR = 256
+LZW_FIRST_CODE = 257
+LZW_MIN_BITS = 9
+DEFAULT_LZW_MAX_BITS = 16
+
+
+class LZSS:
+    """
+    LZSS mit Fenster 2**window_bits und wählbarer Treffersuche ("hash" oder "naive").
+    max_chain begrenzt die Zahl der Kandidaten pro Position (nur "hash").
+    """
+
+    def __init__(
+        self,
+        *,
+        window_bits: int = DEFAULT_WINDOW_BITS,
+        max_chain: int = DEFAULT_MAX_CHAIN,
+        match_finder: str = "hash",
+    ) -> None:
+        if not 1 <= window_bits <= MAX_WINDOW_BITS:
+            raise ValueError(f"window_bits muss zwischen 1 und {MAX_WINDOW_BITS} liegen")
+        if match_finder not in MATCH_FINDERS:
+            raise ValueError(f"Unbekannte Treffersuche {match_finder!r}, erwartet: {', '.join(MATCH_FINDERS)}")
+        self.window_bits = window_bits
+        self.window = 1 << window_bits
+        self.max_chain = max(1, max_chain)
+        self.match_finder = match_finder
+
+    def encode_iter(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Byte-Blöcke → LZSS-Strom. Pro Eingabeblock höchstens ein Ausgabeblock."""
+        window = self.window
+        mask = window - 1
+        max_chain = self.max_chain
+        naive = self.match_finder == "naive"
+        head: dict[bytes, int] = {}
+        prev = [0] * window
+        buf = b""  # Fenster (bereits kodiert) + noch nicht kodierte Bytes
+        base = 0  # absolute Position von buf[0]
+        i = 0  # nächste zu kodierende Position in buf
+        group = bytearray()
+        flags = 0
+        nitems = 0
+        pending = iter(chunks)
+        final = False
+        while not final:
+            chunk = next(pending, None)
+            if chunk is None:
+                final = True
+            else:
+                buf += bytes(chunk)
+            end = len(buf)
+            # ohne Stromende nur so weit kodieren, dass ein Treffer maximaler Länge samt Hash-Einträgen
+            # noch hineinpasst – das Ergebnis hängt dann nicht von der Blockaufteilung ab
+            limit = end if final else end - MAX_MATCH - MIN_MATCH
+            out = bytearray()
+            while i < limit:
+                best_len = 0
+                best_dist = 0
+                max_len = min(MAX_MATCH, end - i)
+                if max_len >= MIN_MATCH:
+                    lo = max(0, i - window)
+                    if naive:
+                        first = buf[i]
+                        for cand in range(i - 1, lo - 1, -1):
+                            if buf[cand] != first or buf[cand + best_len] != buf[i + best_len]:
+                                continue
+                            n = 1
+                            while n + 16 <= max_len and buf[cand + n : cand + n + 16] == buf[i + n : i + n + 16]:
+                                n += 16
+                            while n < max_len and buf[cand + n] == buf[i + n]:
+                                n += 1
+                            if n > best_len:
+                                best_len, best_dist = n, i - cand
+                                if n == max_len:
+                                    break
+                    else:
+                        key = buf[i : i + MIN_MATCH]
+                        cand_abs = head.get(key)
+                        chain = max_chain
+                        while cand_abs is not None and chain:
+                            cand = cand_abs - base
+                            if cand < lo:
+                                break
+                            if buf[cand + best_len] == buf[i + best_len]:
+                                n = MIN_MATCH
+                                while n + 16 <= max_len and buf[cand + n : cand + n + 16] == buf[i + n : i + n + 16]:
+                                    n += 16
+                                while n < max_len and buf[cand + n] == buf[i + n]:
+                                    n += 1
+                                if n > best_len:
+                                    best_len, best_dist = n, i - cand
+                                    if n == max_len:
+                                        break
+                            chain -= 1
+                            nxt = prev[cand_abs & mask]
+                            cand_abs = nxt if nxt < cand_abs else None
+                if best_len >= MIN_MATCH:
+                    flags |= 1 << nitems
+                    d = best_dist - 1
+                    group += bytes((d >> 8, d & 0xFF, best_len - MIN_MATCH))
+                    step = best_len
+                else:
+                    group.append(buf[i])
+                    step = 1
+                if not naive:
+                    # alle überdeckten Positionen in die Hash-Ketten eintragen
+                    for p in range(i, min(i + step, end - MIN_MATCH + 1)):
+                        key = buf[p : p + MIN_MATCH]
+                        p_abs = base + p
+                        old = head.get(key)
+                        prev[p_abs & mask] = p_abs if old is None else old
+                        head[key] = p_abs
+                i += step
+                nitems += 1
+                if nitems == 8:
+                    out.append(flags)
+                    out += group
+                    group.clear()
+                    flags = 0
+                    nitems = 0
+            if final and nitems:
+                out.append(flags)
+                out += group
+            if out:
+                yield bytes(out)
+            # nur das Fenster behalten
+            drop = max(0, i - window)
+            if drop:
+                buf = buf[drop:]
+                base += drop
+                i -= drop
+
+    def encode(self, data: bytes, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+        return b"".join(self.encode_iter(_chunks(data, chunk_size)))
+
+    def decode_iter(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """LZSS-Strom → Blöcke dekodierter Bytes (ein Ausgabeblock pro Eingabeblock)."""
+        window = self.window
+        out = bytearray()  # Fenster + neu dekodierte Bytes
+        emitted = 0
+        data = b""
+        p = 0
+        pending = iter(chunks)
+        final = False
+        while not final:
+            chunk = next(pending, None)
+            if chunk is None:
+                final = True
+            else:
+                data = data[p:] + bytes(chunk)
+                p = 0
+            end = len(data)
+            while p < end:
+                flags = data[p]
+                need = 9 + 2 * bin(flags).count("1")
+                if end - p < need and not final:
+                    break  # Gruppe unvollständig: auf den nächsten Block warten
+                p += 1
+                for bit in range(8):
+                    if p >= end:
+                        break
+                    if flags >> bit & 1:
+                        if p + 3 > end:
+                            raise ValueError("LZSS-Strom endet mitten in einem Treffer")
+                        dist = (data[p] << 8 | data[p + 1]) + 1
+                        length = data[p + 2] + MIN_MATCH
+                        p += 3
+                        start = len(out) - dist
+                        if start < 0:
+                            raise ValueError("LZSS-Verweis vor den Anfang der Daten")
+                        if dist >= length:
+                            out += out[start : start + length]
+                        else:  # überlappende Kopie: Muster der Länge dist wiederholen
+                            pattern = out[start:]
+                            out += (pattern * (length // dist + 1))[:length]
+                    else:
+                        out.append(data[p])
+                        p += 1
+            if len(out) > emitted:
+                yield bytes(out[emitted:])
+            keep = min(len(out), window)
+            del out[: len(out) - keep]
+            emitted = len(out)
+
+    def decode(self, data: bytes, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+        return b"".join(self.decode_iter(_chunks(data, chunk_size)))
+
+
+class LZW:
+    """LZW mit Codebreite 9…max_bits; volles Wörterbuch → CLEAR und Neubeginn."""
+
+    def __init__(self, *, max_bits: int = DEFAULT_LZW_MAX_BITS) -> None:
+        if not LZW_MIN_BITS <= max_bits <= 24:
+            raise ValueError(f"max_bits muss zwischen {LZW_MIN_BITS} und 24 liegen")
+        self.max_bits = max_bits
+        self.limit = 1 << max_bits
+
+    def _width(self, next_code: int) -> int:
+        """Codebreite, wenn der Encoder als Nächstes next_code vergeben würde."""
+        return max(LZW_MIN_BITS, (min(next_code, self.limit) - 1).bit_length())
+
+    def encode_iter(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Byte-Blöcke → LZW-Codestrom."""
+        limit = self.limit
+        trie: dict[int, int] = {}
+        next_code = LZW_FIRST_CODE
+        width = self._width(next_code)
+        w = -1  # Code des bisher gelesenen Präfixes
+        acc = 0
+        nacc = 0
+        for chunk in chunks:
+            out = bytearray()
+            append = out.append
+            for c in chunk:
+                if w < 0:
+                    w = c
+                    continue
+                key = (w << 8) | c
+                code = trie.get(key)
+                if code is not None:
+                    w = code
+                    continue
+                acc |= w << nacc
+                nacc += width
+                if next_code < limit:
+                    trie[key] = next_code
+                    next_code += 1
+                else:
+                    acc |= LZW_CLEAR << nacc
+                    nacc += width
+                    trie.clear()
+                    next_code = LZW_FIRST_CODE
+                width = self._width(next_code)
+                while nacc >= 8:
+                    append(acc & 0xFF)
+                    acc >>= 8
+                    nacc -= 8
+                w = c
+            if out:
+                yield bytes(out)
+        out = bytearray()
+        if w >= 0:
+            acc |= w << nacc
+            nacc += width
+        while nacc > 0:
+            out.append(acc & 0xFF)
+            acc >>= 8
+            nacc -= 8
+        if out:
+            yield bytes(out)
+
+    def encode(self, data: bytes, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+        return b"".join(self.encode_iter(_chunks(data, chunk_size)))
+
+    def decode_iter(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """LZW-Codestrom → Blöcke dekodierter Bytes. Füllbits am Ende (< 8) werden ignoriert."""
+        limit = self.limit
+        table = [bytes((b,)) for b in range(256)] + [b""]
+        prev = None
+        acc = 0
+        nacc = 0
+        width = self._width(LZW_FIRST_CODE)
+        for chunk in chunks:
+            out = bytearray()
+            for byte in chunk:
+                acc |= byte << nacc
+                nacc += 8
+                while nacc >= width:
+                    code = acc & ((1 << width) - 1)
+                    acc >>= width
+                    nacc -= width
+                    if code == LZW_CLEAR:
+                        del table[LZW_FIRST_CODE:]
+                        prev = None
+                    else:
+                        if code < len(table):
+                            entry = table[code]
+                        elif code == len(table) and prev is not None:
+                            entry = prev + prev[:1]  # Fall KwKwK: Code wird gerade erst angelegt
+                        else:
+                            raise ValueError(f"Ungültiger LZW-Code {code}")
+                        out += entry
+                        if prev is not None and len(table) < limit:
+                            table.append(prev + entry[:1])
+                        prev = entry
+                    # der Decoder liegt einen Eintrag hinter dem Encoder
+                    width = self._width(len(table) + (prev is not None))
+            if out:
+                yield bytes(out)
+
+    def decode(self, data: bytes, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+        return b"".join(self.decode_iter(_chunks(data, chunk_size)))
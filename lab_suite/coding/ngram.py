@@ -0,0 +1,196 @@
+"""
+Entropie höherer Ordnung (Markov-Quelle / n-Gramme): H(X), H(X|X₋₁) … H(X|X₋ₖ).
+
+Schätzung über Blockentropien der überlappenden n-Gramme:
+H(X|X₋₁…X₋ₖ) = H(X₁…Xₖ₊₁) − H(X₁…Xₖ).
+
+Umsetzung ohne Python-Dicts:
+
+- Symbole werden auf dichte Indizes 0…A−1 abgebildet (Bytes: A = 256, Zeichen: Alphabet der Datei).
+- Ein n-Gramm wird als uint64 kodiert (Basis-A-Packung, rekursiv code_n = code_{n−1}·A + x);
+  passt A**n nicht in 64 bit, wird dieselbe Rekursion mit einem ungeraden 64-bit-Multiplikator als
+  Rolling-Hash gerechnet (Kollisionen bei realistischen Korpora vernachlässigbar).
+- Gezählt wird blockweise: kleine Zustandsräume (A**n ≤ DENSE_LIMIT) per np.bincount, sonst per
+  np.unique je Block; die Teilzählungen werden gesammelt und periodisch zusammengeführt.
+
+Speicherbedarf: ein Block plus die Tabelle der verschiedenen n-Gramme (16 Byte je n-Gramm) –
+unabhängig von der Korpusgröße, nur abhängig vom Vokabular der n-Gramme.
+"""
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+import numpy as np
+
+from .entropy import DEFAULT_CHUNK_SIZE, UNITS, count_codepoints, iter_byte_chunks, iter_text_chunks
+
+DEFAULT_MAX_ORDER = 6
+DENSE_LIMIT = 1 << 22  # bis 4 Mio. Zustände: Zähl-Array statt np.unique (32 MB int64)
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+@dataclass
+class OrderEntropy:
+    """Ergebnis für Gedächtnislänge k (n = k + 1)."""
+    order: int  # k: Anzahl der bedingenden Vorgängersymbole
+    distinct: int  # verschiedene (k+1)-Gramme
+    block_entropy: float  # H(X₁…Xₖ₊₁) in bit
+    conditional_entropy: float  # H(X|X₋₁…X₋ₖ) in bit/Symbol
+
+
+class _GramCounts:
+    """Häufigkeiten der n-Gramme einer Ordnung: dicht (bincount) oder dünn (sortierte Codes + Zähler)."""
+
+    def __init__(self, states: int | None) -> None:
+        self.dense = np.zeros(states, dtype=np.int64) if states is not None else None
+        self.codes = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self._pending: list[tuple[np.ndarray, np.ndarray]] = []
+        self._pending_size = 0
+
+    def add(self, codes: np.ndarray) -> None:
+        if codes.size == 0:
+            return
+        if self.dense is not None:
+            self.dense += np.bincount(codes.astype(np.intp), minlength=self.dense.size)
+            return
+        u, c = np.unique(codes, return_counts=True)
+        self._pending.append((u, c))
+        self._pending_size += u.size
+        # zusammenführen, sobald die gesammelten Teilzählungen so groß wie die Tabelle sind (amortisiert linear)
+        if self._pending_size >= max(self.codes.size, 1 << 20):
+            self._merge()
+
+    def _merge(self) -> None:
+        if not self._pending:
+            return
+        all_codes = np.concatenate([self.codes] + [u for u, _ in self._pending])
+        all_counts = np.concatenate([self.counts] + [c for _, c in self._pending])
+        self.codes, inverse = np.unique(all_codes, return_inverse=True)
+        self.counts = np.bincount(inverse, weights=all_counts, minlength=self.codes.size).astype(np.int64)
+        self._pending = []
+        self._pending_size = 0
+
+    def values(self) -> np.ndarray:
+        """Zähler aller vorkommenden n-Gramme (ohne Nullen)."""
+        if self.dense is not None:
+            return self.dense[self.dense > 0]
+        self._merge()
+        return self.counts
+
+
+def _block_entropy(counts: np.ndarray) -> float:
+    total = counts.sum()
+    if total == 0:
+        return 0.0
+    c = counts.astype(np.float64)
+    return float(np.log2(total) - (c * np.log2(c)).sum() / total)
+
+
+class NgramCounter:
+    """
+    Inkrementeller n-Gramm-Zähler für alle Ordnungen 1…max_order+1 in einem Durchlauf.
+    update() nimmt Blöcke von Symbolindizes (0…alphabet_size−1) an; die letzten max_order Symbole
+    werden mitgeführt, damit n-Gramme über Blockgrenzen korrekt gezählt werden.
+    """
+
+    def __init__(self, alphabet_size: int, max_order: int = DEFAULT_MAX_ORDER) -> None:
+        if alphabet_size < 1:
+            raise ValueError("Alphabet muss mindestens ein Symbol enthalten")
+        if max_order < 0:
+            raise ValueError("max_order muss >= 0 sein")
+        self.alphabet_size = alphabet_size
+        self.max_order = max_order
+        self.hashed = alphabet_size ** (max_order + 1) > 1 << 64
+        self._base = _HASH_MULTIPLIER if self.hashed else np.uint64(alphabet_size)
+        self._grams = [
+            _GramCounts(alphabet_size**n if not self.hashed and alphabet_size**n <= DENSE_LIMIT else None)
+            for n in range(1, max_order + 2)
+        ]
+        self._carry = np.empty(0, dtype=np.uint64)
+        self.length = 0
+
+    def update(self, symbols: np.ndarray) -> None:
+        """Nächsten Block von Symbolindizes zählen."""
+        if symbols.size == 0:
+            return
+        window = np.concatenate([self._carry, symbols.astype(np.uint64)])
+        carry_len = self._carry.size
+        codes = window
+        for n, grams in enumerate(self._grams, start=1):
+            if n > 1:
+                if codes.size < 2:
+                    break
+                codes = codes[:-1] * self._base + window[n - 1 :]  # uint64: Überlauf = mod 2**64 (Hash-Modus)
+            # nur n-Gramme, die in diesem Block enden (die übrigen wurden im Vorgängerblock gezählt)
+            grams.add(codes[max(0, carry_len - n + 1) :])
+        self._carry = window[-self.max_order :] if self.max_order else window[:0]
+        self.length += symbols.size
+
+    def result(self) -> list[OrderEntropy]:
+        """H(X|X₋₁…X₋ₖ) für k = 0…max_order (soweit der Text lang genug ist)."""
+        rows = []
+        prev = 0.0
+        for k, grams in enumerate(self._grams):
+            counts = grams.values()
+            if counts.size == 0:
+                break
+            h = _block_entropy(counts)
+            rows.append(OrderEntropy(order=k, distinct=int(counts.size), block_entropy=h, conditional_entropy=h - prev))
+            prev = h
+        return rows
+
+
+def _codepoint_index(path: str | os.PathLike, chunk_size: int, encoding: str) -> tuple[int, np.ndarray]:
+    """Alphabet der Datei (erster Durchlauf) → Lookup Codepoint → dichter Index."""
+    present = np.nonzero(count_codepoints(path, chunk_size=chunk_size, encoding=encoding))[0]
+    lookup = np.zeros(0x110000, dtype=np.uint32)
+    lookup[present] = np.arange(present.size, dtype=np.uint32)
+    return int(present.size), lookup
+
+
+def _text_indices(chunks: Iterable[str], lookup: np.ndarray) -> Iterator[np.ndarray]:
+    for text in chunks:
+        yield lookup[np.frombuffer(text.encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32)]
+
+
+def conditional_entropies(
+    path: str | os.PathLike,
+    max_order: int = DEFAULT_MAX_ORDER,
+    unit: str = "utf8",
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_mmap: bool = False,
+    encoding: str = "utf-8",
+) -> list[OrderEntropy]:
+    """H(X), H(X|X₋₁) … H(X|X₋ₖ) einer Datei (k = max_order), blockweise gelesen."""
+    if unit == "byte":
+        counter = NgramCounter(256, max_order)
+        chunks: Iterable[np.ndarray] = iter_byte_chunks(path, chunk_size, use_mmap)
+    elif unit == "utf8":
+        size, lookup = _codepoint_index(path, chunk_size, encoding)
+        if size == 0:
+            return []
+        counter = NgramCounter(size, max_order)
+        chunks = _text_indices(iter_text_chunks(path, chunk_size, encoding), lookup)
+    else:
+        raise ValueError(f"Unbekannte Einheit {unit!r} (erlaubt: {', '.join(UNITS)})")
+    for chunk in chunks:
+        counter.update(chunk)
+    return counter.result()
+
+
+def conditional_entropies_of(data: str | bytes, max_order: int = DEFAULT_MAX_ORDER) -> list[OrderEntropy]:
+    """Wie conditional_entropies, für einen Text im Speicher (z. B. Eingabefeld einer NiceGUI-App)."""
+    if isinstance(data, str):
+        cps = np.frombuffer(data.encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32)
+        alphabet, symbols = np.unique(cps, return_inverse=True)
+    else:
+        alphabet, symbols = np.arange(256), np.frombuffer(bytes(data), dtype=np.uint8)
+    if symbols.size == 0:
+        return []
+    counter = NgramCounter(int(alphabet.size), max_order)
+    counter.update(symbols)
+    return counter.result()
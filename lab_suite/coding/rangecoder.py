@@ -0,0 +1,110 @@
+"""
+Range-Coder (arithmetische Codierung mit ganzen Zahlen, 32 bit, byteweise Normierung wie in LZMA).
+
+Intervall [low, low + range): pro Symbol wird range in total = 2**scale_bits Slots geteilt und auf
+die freq[s] Slots ab cum[s] eingeengt. Fällt range unter 2**24, wird das oberste Byte von low
+ausgegeben. Ein Übertrag in bereits „fertige“ Bytes wird über cache/cache_size nachgereicht (low
+darf kurzzeitig 33 bit breit werden). Die Codelänge liegt damit sehr nahe an Σ log2(total/freq[s]).
+
+Alle Hot-Loops arbeiten nur mit int-Operationen und lokalen Variablen; Ausgabe in bytearray.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from itertools import chain
+
+from .canonical import DEFAULT_CHUNK_SIZE, _chunks
+from .frequencies import FrequencyTable
+
+_TOP = 1 << 24
+_MASK32 = 0xFFFFFFFF
+
+
+class RangeCoder:
+    """Range-Coder über einer FrequencyTable (Bytes 0…255). Der Decoder braucht die Symbolanzahl."""
+
+    def __init__(self, table: FrequencyTable) -> None:
+        self.table = table
+
+    @classmethod
+    def from_data(cls, data: bytes, **kwargs) -> RangeCoder:
+        return cls(FrequencyTable.from_data(data, **kwargs))
+
+    def encode_iter(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Byte-Blöcke → Range-codierter Bytestrom (Zustand läuft über die Blockgrenzen weiter)."""
+        freq, cum, bits = self.table.freq, self.table.cum, self.table.scale_bits
+        low = 0
+        rng = _MASK32
+        cache = 0
+        cache_size = 1
+        for chunk in chunks:
+            out = bytearray()
+            append = out.append
+            for s in chunk:
+                f = freq[s]
+                if not f:
+                    raise ValueError(f"Symbol {s} nicht in der Häufigkeitstabelle")
+                r = rng >> bits
+                low += r * cum[s]
+                rng = r * f
+                while rng < _TOP:
+                    rng <<= 8
+                    # shift_low: oberstes Byte ausgeben, Übertrag an die wartenden 0xFF-Bytes weitergeben
+                    if low < 0xFF000000 or low > _MASK32:
+                        carry = low >> 32
+                        append((cache + carry) & 0xFF)
+                        for _ in range(cache_size - 1):
+                            append((0xFF + carry) & 0xFF)
+                        cache_size = 0
+                        cache = (low >> 24) & 0xFF
+                    cache_size += 1
+                    low = (low & 0x00FFFFFF) << 8
+            if out:
+                yield bytes(out)
+        out = bytearray()
+        for _ in range(5):  # Abschluss: low vollständig ausgeben
+            if low < 0xFF000000 or low > _MASK32:
+                carry = low >> 32
+                out.append((cache + carry) & 0xFF)
+                for _ in range(cache_size - 1):
+                    out.append((0xFF + carry) & 0xFF)
+                cache_size = 0
+                cache = (low >> 24) & 0xFF
+            cache_size += 1
+            low = (low & 0x00FFFFFF) << 8
+        yield bytes(out)
+
+    def encode(self, data: bytes, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+        return b"".join(self.encode_iter(_chunks(data, chunk_size)))
+
+    def decode_iter(self, chunks: Iterable[bytes], count: int, *, block_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Range-codierter Bytestrom → Blöcke von höchstens block_size Bytes (genau count Symbole)."""
+        freq, cum, bits = self.table.freq, self.table.cum, self.table.scale_bits
+        slot_symbol = self.table.slot_symbol
+        source = chain.from_iterable(chunks)
+        nxt = source.__next__
+        try:
+            code = 0
+            for _ in range(5):
+                code = (code << 8) | nxt()
+            rng = _MASK32
+            remaining = count
+            while remaining > 0:
+                n = min(block_size, remaining)
+                out = bytearray(n)
+                for i in range(n):
+                    r = rng >> bits
+                    s = slot_symbol[code // r]
+                    out[i] = s
+                    code -= r * cum[s]
+                    rng = r * freq[s]
+                    while rng < _TOP:
+                        code = ((code << 8) | nxt()) & _MASK32
+                        rng <<= 8
+                remaining -= n
+                yield bytes(out)
+        except (StopIteration, IndexError):
+            raise ValueError("Range-codierter Bytestrom zu kurz oder beschädigt") from None
+
+    def decode(self, data: bytes, count: int, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+        return b"".join(self.decode_iter(_chunks(data, chunk_size), count))
@@ -0,0 +1,142 @@
+"""
+Bierdeckel-Telegraf (Lab 01_01): Entscheidungsgehalt G = n·log2(B) bei R Zeichen (Bezeichnungsraum),
+Basis B und n = R/B Stellen – für viele R auf einmal mit NumPy statt V = B**n als große Ganzzahl.
+
+G(R, B) = R · log2(B)/B. Der Faktor f(B) = log2(B)/B ist für reelles B bei B = e maximal und fällt
+für ganzzahlige B ≥ 3 streng monoton (f(2) = f(4) = 0,5, f(3) ≈ 0,528). Daraus folgt:
+
+- gebrochenes n (jede ganze Basis erlaubt): Optimum immer B = 3, G = R · log2(3)/3;
+- ganzzahliges n (nur Teiler B von R): bestes B ist 2/4 oder der kleinste Teiler ≥ 3. Die Suche
+  läuft deshalb vektorisiert über B = 2 … b_max; Teiler > b_max können nur gewinnen, wenn es keinen
+  kleineren Teiler ≥ 3 gibt – dann ist es der kleinste Primfaktor des ungeraden Anteils von R
+  (Sieb in NumPy) und wird als zusätzliche Spalte geprüft.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+DEFAULT_B_MAX = 64
+DEFAULT_CHUNK_ROWS = 1 << 15  # Zeilen (Werte von R) pro Block: Blockgitter ≈ 16 MB bei b_max = 64
+G_PER_SYMBOL_BOUND = math.log2(math.e) / math.e  # max f(B) bei B = e
+
+
+@dataclass
+class OptimumSweep:
+    """Ergebnis von optimum_sweep; alle Arrays mit Index i ↔ R = i + 1."""
+    r: np.ndarray
+    best_divisor_base: np.ndarray  # bestes B mit B | R (kleinstes bei Gleichstand, wie die Schleife)
+    best_divisor_g: np.ndarray  # G in bit bei diesem B
+    best_fractional_base: np.ndarray  # bestes ganzes B bei gebrochenem n
+    best_fractional_g: np.ndarray
+    bound_g: np.ndarray  # G bei B = e (obere Schranke)
+
+    @property
+    def best_divisor_n(self) -> np.ndarray:
+        return self.r // self.best_divisor_base
+
+
+def decision_content(r, b) -> np.ndarray:
+    """G = (R/B)·log2(B) in bit, elementweise mit Broadcasting (n darf gebrochen sein)."""
+    r = np.asarray(r, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    return r / b * np.log2(b)
+
+
+def smallest_prime_factors(n_max: int) -> np.ndarray:
+    """spf[k] = kleinster Primfaktor von k (spf[0] = 0, spf[1] = 1), Sieb in O(n log log n)."""
+    spf = np.arange(n_max + 1, dtype=np.int64)
+    for p in range(2, math.isqrt(n_max) + 1):
+        if spf[p] == p:
+            block = spf[p * p :: p]
+            np.minimum(block, p, out=block)
+    return spf
+
+
+def optimum_sweep(r_max: int, *, b_max: int = DEFAULT_B_MAX, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> OptimumSweep:
+    """Optimum-Basis für alle R = 1 … r_max in einem vektorisierten Durchlauf (blockweise über R)."""
+    if r_max < 1:
+        raise ValueError("r_max muss mindestens 1 sein")
+    b_max = max(4, b_max)
+    r_all = np.arange(1, r_max + 1, dtype=np.int64)
+    bases = np.arange(2, b_max + 1, dtype=np.int64)
+    f = np.log2(bases) / bases
+    spf = smallest_prime_factors(r_max)
+
+    best_b = np.ones(r_max, dtype=np.int64)
+    best_g = np.zeros(r_max, dtype=np.float64)
+    for start in range(0, r_max, chunk_rows):
+        r = r_all[start : start + chunk_rows]
+        g = np.where(r[:, None] % bases == 0, r[:, None] * f, -np.inf)
+        # Kandidat außerhalb des Gitters: kleinster Primfaktor des ungeraden Anteils (R = 2^a · m)
+        odd = r // (r & -r)
+        cand = spf[odd]
+        g_cand = np.where(cand > b_max, decision_content(r, np.maximum(cand, 2)), -np.inf)
+        idx = np.argmax(g, axis=1)
+        g_grid = g[np.arange(len(r)), idx]
+        use_cand = g_cand > g_grid
+        chosen_b = np.where(use_cand, cand, bases[idx])
+        chosen_g = np.where(use_cand, g_cand, g_grid)
+        ok = chosen_g > 0  # R = 1: nur B = 1, G = 0
+        best_b[start : start + len(r)] = np.where(ok, chosen_b, 1)
+        best_g[start : start + len(r)] = np.where(ok, chosen_g, 0.0)
+
+    frac_b = np.full(r_max, bases[np.argmax(f)], dtype=np.int64)
+    return OptimumSweep(
+        r=r_all,
+        best_divisor_base=best_b,
+        best_divisor_g=best_g,
+        best_fractional_base=frac_b,
+        best_fractional_g=decision_content(r_all, frac_b),
+        bound_g=r_all * G_PER_SYMBOL_BOUND,
+    )
+
+
+def exact_optimum(r: int) -> tuple[int, int, int, float]:
+    """Exakte Ganzzahl-Variante wie in beer_coaster.py: (B, n, V = B**n, G) über alle Teiler B von R."""
+    best = (1, r, 1, 0.0)
+    for b in range(1, r + 1):
+        if r % b == 0:
+            v = b ** (r // b)
+            if v > best[2]:
+                best = (b, r // b, v, math.log2(v))
+    return best
+
+
+def sweep_table(sweep: OptimumSweep, r_values) -> list[tuple[int, int, float, float, float, float]]:
+    """Zeilen (R, B_opt, n, G_Teiler, G_B=3, G_B=e) für ausgewählte R."""
+    rows = []
+    for r in r_values:
+        i = int(r) - 1
+        b = int(sweep.best_divisor_base[i])
+        rows.append((int(r), b, int(r) / b, float(sweep.best_divisor_g[i]), float(sweep.best_fractional_g[i]), float(sweep.bound_g[i])))
+    return rows
+
+
+def sweep_figure(sweep: OptimumSweep, *, max_points: int = 4000) -> dict:
+    """Plotly-Figur (data/layout als dict): Optimum-Basis und G/R über R, R logarithmisch ausgedünnt."""
+    r_max = len(sweep.r)
+    idx = np.unique(np.geomspace(1, r_max, num=min(max_points, r_max)).astype(np.int64)) - 1
+    r = sweep.r[idx].tolist()
+    data = [
+        {"type": "scattergl", "mode": "markers", "name": "bestes B (B teilt R)", "x": r,
+         "y": sweep.best_divisor_base[idx].tolist(), "marker": {"size": 4}},
+        {"type": "scattergl", "mode": "lines", "name": "bestes B (n gebrochen)", "x": r,
+         "y": sweep.best_fractional_base[idx].tolist()},
+        {"type": "scattergl", "mode": "lines", "name": "B = e", "x": [r[0], r[-1]], "y": [math.e, math.e],
+         "line": {"dash": "dot"}},
+        {"type": "scattergl", "mode": "markers", "name": "G/R (B teilt R)", "x": r,
+         "y": (sweep.best_divisor_g[idx] / sweep.r[idx]).tolist(), "marker": {"size": 4}, "yaxis": "y2"},
+        {"type": "scattergl", "mode": "lines", "name": "G/R (B = e)", "x": [r[0], r[-1]],
+         "y": [G_PER_SYMBOL_BOUND, G_PER_SYMBOL_BOUND], "line": {"dash": "dot"}, "yaxis": "y2"},
+    ]
+    layout = {
+        "title": {"text": f"Bierdeckel-Telegraf: Optimum-Basis für R = 1 … {r_max}"},
+        "xaxis": {"title": {"text": "R (Bezeichnungsraum)"}, "type": "log"},
+        "yaxis": {"title": {"text": "Optimum-Basis B"}, "type": "log", "domain": [0.55, 1.0]},
+        "yaxis2": {"title": {"text": "G/R [bit pro Zeichen]"}, "domain": [0.0, 0.45], "anchor": "x"},
+        "legend": {"orientation": "h"},
+    }
+    return {"data": data, "layout": layout}
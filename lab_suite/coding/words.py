@@ -0,0 +1,124 @@
+"""
+Wort-Statistik für große Textkorpora (word_dictionary.py).
+
+Ein Wort ist eine maximale Folge von Zeichen, die weder Whitespace noch Komma/Punkt sind (wie bisher
+line.replace(',', ' ').replace('.', ' ').split()). Zerlegt wird ein ganzer Block auf einmal mit
+replace/split (in C, etwa 3× schneller als re.findall mit der gleichen Zeichenklasse), gezählt wird
+mit collections.Counter.
+
+Große Dateien werden in Byte-Bereiche (Shards) zerlegt, deren Grenzen auf ASCII-Whitespace liegen
+(kein Wort und keine UTF-8-Sequenz wird geteilt). Die Shards zählt ein ProcessPoolExecutor; die
+Teil-Counter werden in Shard-Reihenfolge zusammengeführt, sodass die Einfügereihenfolge (erstes
+Vorkommen) – und damit die Reihenfolge bei gleicher Häufigkeit – wie im sequentiellen Fall bleibt.
+
+Hinweis: Aufrufer mit workers > 1 brauchen unter Windows den Schutz if __name__ == "__main__".
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import os
+import re
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+DEFAULT_SHARD_SIZE = 16 << 20
+_ASCII_WHITESPACE_RE = re.compile(rb"[ \t\n\r\x0b\x0c]")
+
+
+def count_words(text: str) -> Counter:
+    """Wörter eines Textes zählen (Reihenfolge der Schlüssel = erstes Vorkommen)."""
+    return Counter(text.replace(",", " ").replace(".", " ").split())
+
+
+def _count_shard(path: str, start: int, end: int, encoding: str) -> Counter:
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return count_words(data.decode(encoding, errors="replace"))
+
+
+def shard_bounds(path: str | os.PathLike, shard_size: int = DEFAULT_SHARD_SIZE) -> list[tuple[int, int]]:
+    """Byte-Bereiche [start, end), deren Grenzen direkt hinter einem ASCII-Whitespace liegen."""
+    size = os.path.getsize(path)
+    bounds = []
+    start = 0
+    with open(path, "rb") as f:
+        while start < size:
+            end = start + shard_size
+            if end >= size:
+                bounds.append((start, size))
+                break
+            f.seek(end)
+            # bis zum nächsten Whitespace vorlaufen (Wortende); ohne Whitespace bis Dateiende
+            while True:
+                block = f.read(1 << 16)
+                if not block:
+                    end = size
+                    break
+                hit = _ASCII_WHITESPACE_RE.search(block)
+                if hit is not None:
+                    end += hit.end()
+                    break
+                end += len(block)
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
+def count_words_in_file(
+    path: str | os.PathLike,
+    *,
+    workers: int | None = 1,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    encoding: str = "utf-8",
+) -> Counter:
+    """
+    Wörter einer Datei zählen. workers=1: sequentiell im eigenen Prozess;
+    workers=None: os.cpu_count() Prozesse; bei nur einem Shard immer sequentiell.
+    """
+    path = os.fspath(path)
+    bounds = shard_bounds(path, shard_size)
+    total: Counter = Counter()
+    if workers == 1 or len(bounds) <= 1:
+        for start, end in bounds:
+            total.update(_count_shard(path, start, end, encoding))
+        return total
+    n = len(bounds)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map liefert in Shard-Reihenfolge → Einfügereihenfolge wie sequentiell
+        for part in pool.map(_count_shard, [path] * n, [s for s, _ in bounds], [e for _, e in bounds], [encoding] * n):
+            total.update(part)
+    return total
+
+
+def top_k(counts: Counter, k: int | None = None) -> list[tuple[str, int]]:
+    """
+    Die k häufigsten Wörter über einen Heap (O(n log k)); k=None → alle, absteigend sortiert.
+    Bei gleicher Häufigkeit gilt die Reihenfolge des ersten Vorkommens (wie sorted(..., reverse=True)).
+    """
+    if k is None or k >= len(counts):
+        return sorted(counts.items(), key=itemgetter(1), reverse=True)
+    return heapq.nlargest(k, counts.items(), key=itemgetter(1))
+
+
+def word_entropy_rows(rows: Iterable[tuple[str, int]], total: int) -> list[tuple[str, int, float, float, float]]:
+    """(Wort, count) → (Wort, count, p, H = log2(1/p), p·H), wie die Tabelle in word_dictionary.py."""
+    out = []
+    for word, cnt in rows:
+        p = cnt / total
+        H = math.log(1 / p, 2)
+        out.append((word, cnt, p, H, p * H))
+    return out
+
+
+def average_entropy(counts: Counter) -> float:
+    """Mittlere Entropie in bit/Wort über das gesamte Vokabular (ohne Sortieren, Einfügereihenfolge)."""
+    total = sum(counts.values())
+    H_average = 0.0
+    for cnt in counts.values():
+        p = cnt / total
+        H_average += p * math.log(1 / p, 2)
+    return H_average
@@ -0,0 +1,238 @@
+"""
+lab_suite/console_capture – Konsolenausgabe der Skript-Labs parallel in submissions/console_log.txt
+(für „Konsolenausgabe einfügen“ im App-Launcher), gemeinsam für alle Skripte statt einer _Tee-Kopie pro Skript.
+
+Unterschied zur bisherigen _Tee-Klasse (flush() auf Konsole und Datei bei jedem write):
+
+- Die Log-Datei wird blockweise geschrieben (Puffer buffer_size Zeichen, ein os.write pro Block),
+  spätestens alle flush_interval Sekunden (Hintergrund-Thread), bei flush()/input() und beim Beenden.
+- Die Konsole wird nicht pro write geleert; sys.__stdout__ ist im Terminal ohnehin zeilengepuffert.
+- max_bytes begrenzt die Log-Datei: danach folgt eine Abschneide-Markierung und nur noch die Konsole
+  bekommt Ausgaben. Mit backup_count > 0 wird stattdessen rotiert (console_log.txt → .1 → .2 …);
+  console_log.txt enthält dann den jüngsten Teil.
+
+Einbindung in ein Skript (nach dem sys.path-Eintrag für lab_suite) mit einem Import:
+
+    import console_capture.auto  # Konsolenausgabe → submissions/console_log.txt
+
+Vor der Endlosschleife am Skriptende console_capture.uninstall() aufrufen (Log vollständig schreiben,
+Konsole wieder direkt nutzen). Einstellungen über Umgebungsvariablen: CONSOLE_LOG_MAX_BYTES,
+CONSOLE_LOG_BACKUPS, CONSOLE_LOG_FLUSH_SEC.
+"""
+from __future__ import annotations
+
+import atexit
+import io
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import TextIO
+
+CONSOLE_LOG_NAME = "console_log.txt"
+SUBMISSIONS_DIR = "submissions"
+DEFAULT_BUFFER_SIZE = 1 << 16
+DEFAULT_FLUSH_INTERVAL = 0.5
+DEFAULT_MAX_BYTES = 8 << 20
+TRUNCATION_MARKER = "\n[… Konsolenausgabe nach {max_bytes} Bytes abgeschnitten …]\n"
+
+_active: ConsoleCapture | None = None
+
+
+class ConsoleCapture(io.TextIOBase):
+    """Textstrom für sys.stdout: schreibt auf die Konsole und gepuffert in eine Log-Datei."""
+
+    def __init__(
+        self,
+        console: TextIO,
+        log_path: str | os.PathLike,
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = 0,
+        encoding: str = "utf-8",
+    ) -> None:
+        super().__init__()
+        self.console = console
+        self.log_path = Path(log_path)
+        self.buffer_size = max(1, buffer_size)
+        self.max_bytes = max_bytes
+        self.backup_count = max(0, backup_count)
+        self._encoding = encoding
+        self._lock = threading.Lock()
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._console_dirty = False
+        self._written = 0
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._log = self._open_log()
+        self._stop = threading.Event()
+        self._thread = None
+        if flush_interval > 0:
+            self._thread = threading.Thread(target=self._flush_loop, args=(flush_interval,), name="console-capture-flush", daemon=True)
+            self._thread.start()
+
+    # ---- Textstrom ----
+
+    @property
+    def encoding(self) -> str:
+        return getattr(self.console, "encoding", self._encoding)
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self.console.isatty()
+
+    def fileno(self) -> int:
+        return self.console.fileno()
+
+    def write(self, s: str) -> int:
+        if not isinstance(s, str):
+            raise TypeError(f"write() erwartet str, nicht {type(s).__name__}")
+        with self._lock:
+            self.console.write(s)
+            self._console_dirty = True
+            if self._log is not None:
+                self._pending.append(s)
+                self._pending_chars += len(s)
+                if self._pending_chars >= self.buffer_size:
+                    self._write_log()
+        return len(s)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Hintergrund-Thread beenden, Restpuffer schreiben, Log-Datei schließen (Konsole bleibt offen)."""
+        if self.closed:
+            return
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        with self._lock:
+            self._flush_locked()
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+        super().close()
+
+    # ---- intern ----
+
+    def _open_log(self):
+        """Log-Datei ungepuffert öffnen: die Pufferung übernimmt write() (ein os.write pro Block)."""
+        return open(self.log_path, "wb", buffering=0)
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            with self._lock:
+                if self._pending or self._console_dirty:
+                    self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        try:
+            self.console.flush()
+        except (OSError, ValueError):
+            pass
+        self._console_dirty = False
+        if self._log is not None and self._pending:
+            self._write_log()
+
+    def _write_log(self) -> None:
+        data = "".join(self._pending).encode(self._encoding, "replace")
+        self._pending.clear()
+        self._pending_chars = 0
+        try:
+            if self.max_bytes > 0 and self._written + len(data) > self.max_bytes:
+                if self.backup_count:
+                    if self._written:
+                        self._rotate()
+                else:
+                    room = max(0, self.max_bytes - self._written)
+                    head = data[:room].decode(self._encoding, "ignore").encode(self._encoding)
+                    marker = TRUNCATION_MARKER.format(max_bytes=self.max_bytes).encode(self._encoding)
+                    self._log.write(head + marker)
+                    self._log.close()
+                    self._log = None
+                    return
+            self._log.write(data)
+            self._written += len(data)
+        except OSError:
+            # Log-Datei nicht mehr beschreibbar (z. B. Datenträger voll): nur noch Konsole
+            try:
+                self._log.close()
+            except OSError:
+                pass
+            self._log = None
+
+    def _rotate(self) -> None:
+        self._log.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            older = self.log_path.with_name(f"{self.log_path.name}.{i}")
+            if older.exists():
+                os.replace(older, self.log_path.with_name(f"{self.log_path.name}.{i + 1}"))
+        os.replace(self.log_path, self.log_path.with_name(f"{self.log_path.name}.1"))
+        self._log = self._open_log()
+        self._written = 0
+
+
+def log_path_for(script_file: str | os.PathLike | None = None) -> Path:
+    """submissions/console_log.txt neben dem Skript (Standard: das gestartete Hauptskript)."""
+    if script_file is None:
+        script_file = getattr(sys.modules.get("__main__"), "__file__", None) or os.path.join(os.getcwd(), "_")
+    return Path(os.path.abspath(script_file)).parent / SUBMISSIONS_DIR / CONSOLE_LOG_NAME
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def install(script_file: str | os.PathLike | None = None, **options) -> ConsoleCapture | None:
+    """
+    sys.stdout durch ConsoleCapture ersetzen (Konsole + submissions/console_log.txt des Skripts).
+    Ohne beschreibbare Log-Datei bleibt sys.stdout unverändert (Rückgabe None). Ein zweiter Aufruf
+    liefert die bereits aktive Instanz.
+    """
+    global _active
+    if _active is not None:
+        return _active
+    options.setdefault("max_bytes", _env_int("CONSOLE_LOG_MAX_BYTES", DEFAULT_MAX_BYTES))
+    options.setdefault("backup_count", _env_int("CONSOLE_LOG_BACKUPS", 0))
+    try:
+        options.setdefault("flush_interval", float(os.environ.get("CONSOLE_LOG_FLUSH_SEC", DEFAULT_FLUSH_INTERVAL)))
+    except ValueError:
+        options.setdefault("flush_interval", DEFAULT_FLUSH_INTERVAL)
+    try:
+        capture = ConsoleCapture(sys.__stdout__, log_path_for(script_file), **options)
+    except OSError:
+        return None  # ohne Log-Datei weiterlaufen
+    sys.stdout = capture
+    _active = capture
+    atexit.register(uninstall)
+    return capture
+
+
+def uninstall() -> None:
+    """Log vollständig schreiben und schließen, sys.stdout wieder auf die Konsole setzen."""
+    global _active
+    capture, _active = _active, None
+    if capture is None:
+        return
+    if sys.stdout is capture:
+        sys.stdout = capture.console
+    capture.close()
+
+
+__all__ = [
+    "CONSOLE_LOG_NAME",
+    "ConsoleCapture",
+    "TRUNCATION_MARKER",
+    "install",
+    "log_path_for",
+    "uninstall",
+]
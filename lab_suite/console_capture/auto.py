@@ -0,0 +1,13 @@
+"""
+Import-Einbindung: `import console_capture.auto` installiert die Konsolen-Aufzeichnung für das
+gestartete Skript (submissions/console_log.txt neben dem Skript).
+
+In Kindprozessen (multiprocessing, Windows: spawn importiert das Hauptskript neu) wird nichts
+installiert – sonst würde jeder Prozess console_log.txt neu anlegen.
+"""
+import multiprocessing
+
+from . import install
+
+if multiprocessing.parent_process() is None:
+    install()
@@ -4,92 +4,129 @@ Bierdeckel-Quiz: Analogie Zahlensystem.
 R = 30 Bierdeckel insgesamt (Bezeichnungsraum).
 B = Basis = Anzahl Brauereien → n = R/B Stellen (Deckel pro Brauerei).
 V = B^n = Anzahl darstellbarer Nachrichten. Theorie: Optimum bei B = e (Eulersche Zahl).
+
+Mit --sweep [R_MAX] (Standard 10⁶): G = n·log2(B) für alle R bis R_MAX vektorisiert (NumPy),
+auch für Basen, die R nicht teilen (n gebrochen); Tabelle + Plotly-Figur als HTML.
 """
+import argparse
+import json
 import math
 import os
 import sys
 import time
+import webbrowser
+from pathlib import Path
 
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-_CONSOLE_LOG_PATH = os.path.join(_SCRIPT_DIR, "submissions", "console_log.txt")
-
-
-class _Tee:
-    """Schreibt gleichzeitig in Konsole und Datei."""
-    def __init__(self, *streams):
-        self.streams = streams
-    def write(self, data):
-        for s in self.streams:
-            s.write(data)
-            if getattr(s, "flush", None):
-                s.flush()
-    def flush(self):
-        for s in self.streams:
-            if getattr(s, "flush", None):
-                s.flush()
-    def writable(self):
-        return True
-
-
-_log_file = None
-try:
-    os.makedirs(os.path.dirname(_CONSOLE_LOG_PATH), exist_ok=True)
-    _log_file = open(_CONSOLE_LOG_PATH, "w", encoding="utf-8")
-    sys.stdout = _Tee(sys.__stdout__, _log_file)
-except OSError:
-    pass
-
-# --- Parameter: R = 30 Bierdeckel insgesamt ---
-R = 30
-try:
-    s = input(f"Anzahl Bierdeckel R (Bezeichnungsraum) [Standard {R}]: ").strip()
-    if s:
-        R = int(s)
-        if R < 1 or R > 1000:
-            R = 30
-except (ValueError, EOFError):
-    pass
-
-print(f"\nBierdeckel-Telegraf: R = {R} Deckel (Bezeichnungsraum), B = Brauereien (Basis)")
-print("n = R/B Stellen,  V = B^n = Signalvorrat,  G = log2(V) = Entscheidungsgehalt (H = G in bit)")
-print("=" * 60)
-
-# Nur B, die R teilen (damit n = R/B ganzzahlig)
-candidates = [b for b in range(1, R + 1) if R % b == 0]
-rows = []
-best_B, best_n, best_V, best_G = 1, R, 1, 0.0
-
-for B in candidates:
-    n = R // B
-    V = B ** n
-    G = math.log2(V) if V > 0 else 0
-    rows.append((B, n, V, G))
-    if V > best_V:
-        best_V = V
-        best_B = B
-        best_n = n
-        best_G = G
-
-def _fmt(V):
-    if V < 1e12:
-        return str(int(V))
-    return f"{V:.4e}"
-
-print(f"\n{'B':>4} | {'n=R/B':>6} | {'V = B^n':>14} | {'G = log2(V) [bit]':>12}")
-print("-" * 42)
-for B, n, V, G in rows:
-    print(f"{B:>4} | {n:>6} | {_fmt(V):>14} | {G:>12.2f}")
-
-print("\n" + "=" * 60)
-print(f"Optimum: B = {best_B}  (n = {best_n} Stellen)  =>  V_max = {_fmt(best_V)},  G_max = {best_G:.2f} bit (H = G)")
-print(f"Theorie: B = e ≈ {math.e:.2f} ist optimal; bei ganzzahligem B oft B = 2 oder B = 3.")
-
-if _log_file is not None:
+_SWEEP_HTML_PATH = os.path.join(_SCRIPT_DIR, "submissions", "beer_coaster_sweep.html")
+
+# lab_suite in sys.path, damit die gemeinsamen Pakete coding/ und console_capture/ importierbar sind (Start als Skript)
+_LAB_SUITE_ROOT = os.path.dirname(os.path.dirname(_SCRIPT_DIR))
+if _LAB_SUITE_ROOT not in sys.path:
+    sys.path.insert(0, _LAB_SUITE_ROOT)
+# plotly.min.js aus den gemeinsamen Widget-Assets (offline nutzbar)
+_PLOTLY_JS_PATH = os.path.join(_LAB_SUITE_ROOT, "widgets", "static", "plotly.min.js")
+
+# Konsolenausgabe parallel in submissions/console_log.txt schreiben (für Launcher „Konsolenausgabe einfügen“)
+import console_capture.auto
+
+
+def _single_r():
+    """Exakte Tabelle für ein R (Eingabe), V = B^n als Ganzzahl."""
+    # --- Parameter: R = 30 Bierdeckel insgesamt ---
+    R = 30
     try:
-        sys.stdout = sys.__stdout__
-        _log_file.close()
-    except (OSError, NameError):
+        s = input(f"Anzahl Bierdeckel R (Bezeichnungsraum) [Standard {R}]: ").strip()
+        if s:
+            R = int(s)
+            if R < 1 or R > 1000:
+                R = 30
+    except (ValueError, EOFError):
         pass
 
+    print(f"\nBierdeckel-Telegraf: R = {R} Deckel (Bezeichnungsraum), B = Brauereien (Basis)")
+    print("n = R/B Stellen,  V = B^n = Signalvorrat,  G = log2(V) = Entscheidungsgehalt (H = G in bit)")
+    print("=" * 60)
+
+    # Nur B, die R teilen (damit n = R/B ganzzahlig)
+    candidates = [b for b in range(1, R + 1) if R % b == 0]
+    rows = []
+    best_B, best_n, best_V, best_G = 1, R, 1, 0.0
+
+    for B in candidates:
+        n = R // B
+        V = B ** n
+        G = math.log2(V) if V > 0 else 0
+        rows.append((B, n, V, G))
+        if V > best_V:
+            best_V = V
+            best_B = B
+            best_n = n
+            best_G = G
+
+    def _fmt(V):
+        if V < 1e12:
+            return str(int(V))
+        return f"{V:.4e}"
+
+    print(f"\n{'B':>4} | {'n=R/B':>6} | {'V = B^n':>14} | {'G = log2(V) [bit]':>12}")
+    print("-" * 42)
+    for B, n, V, G in rows:
+        print(f"{B:>4} | {n:>6} | {_fmt(V):>14} | {G:>12.2f}")
+
+    print("\n" + "=" * 60)
+    print(f"Optimum: B = {best_B}  (n = {best_n} Stellen)  =>  V_max = {_fmt(best_V)},  G_max = {best_G:.2f} bit (H = G)")
+    print(f"Theorie: B = e ≈ {math.e:.2f} ist optimal; bei ganzzahligem B oft B = 2 oder B = 3.")
+
+
+def _sweep(r_max, b_max):
+    """Optimum-Basis für alle R = 1 … r_max in einem vektorisierten Durchlauf, Tabelle + Plotly-Figur."""
+    from coding.telegraph import optimum_sweep, sweep_figure, sweep_table
+
+    print(f"\nBierdeckel-Telegraf: Sweep R = 1 … {r_max}, G = (R/B)·log2(B) für B = 2 … {b_max} (vektorisiert)")
+    print("=" * 60)
+    t0 = time.perf_counter()
+    sweep = optimum_sweep(r_max, b_max=b_max)
+    print(f"Berechnet in {time.perf_counter() - t0:.3f} s")
+
+    r_values = sorted({r for r in (1, 2, 3, 4, 5, 6, 7, 10, 12, 30, 97, 100, 1000, 10**4, 10**5, 10**6) if r <= r_max} | {r_max})
+    print(f"\n{'R':>8} | {'B_opt':>6} | {'n=R/B':>8} | {'G (B|R)':>12} | {'G (B=3)':>12} | {'G (B=e)':>12} | {'Verlust':>7}")
+    print("-" * 82)
+    for r, b, n, g, g3, ge in sweep_table(sweep, r_values):
+        print(f"{r:>8} | {b:>6} | {n:>8.0f} | {g:>12.2f} | {g3:>12.2f} | {ge:>12.2f} | {100 * (1 - g / ge):>6.2f}%")
+
+    figure = sweep_figure(sweep)
+    script_src = Path(_PLOTLY_JS_PATH).as_uri() if os.path.exists(_PLOTLY_JS_PATH) else "https://cdn.plot.ly/plotly-2.35.2.min.js"
+    html = (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Bierdeckel-Telegraf</title>"
+        f"<script src=\"{script_src}\"></script></head><body>"
+        "<div id=\"plot\" style=\"width:100%;height:90vh\"></div>"
+        f"<script>Plotly.newPlot('plot', {json.dumps(figure['data'])}, {json.dumps(figure['layout'])}, {{responsive: true}});</script>"
+        "</body></html>"
+    )
+    try:
+        with open(_SWEEP_HTML_PATH, "w", encoding="utf-8") as f:
+            f.write(html)
+        print(f"\nPlotly-Figur: {_SWEEP_HTML_PATH}")
+        webbrowser.open(Path(_SWEEP_HTML_PATH).as_uri())
+    except OSError as e:
+        print(f"\nPlotly-Figur konnte nicht gespeichert werden: {e}")
+    print("Gebrochenes n: Optimum immer B = 3; nur Teiler von R: B = 3, sonst B = 2 oder der kleinste Teiler ≥ 3.")
+
+
+parser = argparse.ArgumentParser(description="Bierdeckel-Telegraf: Signalvorrat und Entscheidungsgehalt.")
+parser.add_argument("--sweep", type=int, nargs="?", const=1_000_000, default=None, metavar="R_MAX",
+                    help="alle R bis R_MAX vektorisiert (Standard 10⁶) statt Eingabe eines R")
+parser.add_argument("--b-max", type=int, default=64, help="größte Basis im Gitter des Sweeps (Standard 64)")
+args = parser.parse_args()
+
+if args.sweep is not None:
+    _sweep(max(1, args.sweep), args.b_max)
+else:
+    _single_r()
+
+# Log-Datei schließen, danach Konsole normal weiter nutzen (Endlosschleife)
+console_capture.uninstall()
+
 while True:
     time.sleep(1)
@@ -8,6 +8,7 @@ $list
 $comment for a given text file, calculate the character distribution, average and total Entropy
 """
 
+import argparse
 import os
 import sys
 import time
@@ -15,89 +16,90 @@ import math
 
 # Pfad relativ zum Skript-Verzeichnis, damit das Skript von überall (z. B. App-Launcher) funktioniert
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-path = os.path.join(_SCRIPT_DIR, "sampletext.txt")
+
+# lab_suite in sys.path, damit die gemeinsamen Pakete coding/ und console_capture/ importierbar sind (Start als Skript)
+_LAB_SUITE_ROOT = os.path.dirname(os.path.dirname(_SCRIPT_DIR))
+if _LAB_SUITE_ROOT not in sys.path:
+    sys.path.insert(0, _LAB_SUITE_ROOT)
+
+from coding.entropy import UNITS, count_symbols, echo_text, entropy_table, new_first_array
 
 # Konsolenausgabe parallel in submissions/console_log.txt schreiben (für Launcher „Konsolenausgabe einfügen“)
-_CONSOLE_LOG_PATH = os.path.join(_SCRIPT_DIR, "submissions", "console_log.txt")
-
-
-class _Tee:
-    """Schreibt gleichzeitig in mehrere Streams (z. B. Konsole + Datei)."""
-    def __init__(self, *streams):
-        self.streams = streams
-    def write(self, data):
-        for s in self.streams:
-            s.write(data)
-            if getattr(s, "flush", None):
-                s.flush()
-    def flush(self):
-        for s in self.streams:
-            if getattr(s, "flush", None):
-                s.flush()
-    def writable(self):
-        return True
-
-
-_log_file = None
-try:
-    os.makedirs(os.path.dirname(_CONSOLE_LOG_PATH), exist_ok=True)
-    _log_file = open(_CONSOLE_LOG_PATH, "w", encoding="utf-8")
-    sys.stdout = _Tee(sys.__stdout__, _log_file)
-except OSError:
-    pass  # ohne Log-Datei weiterlaufen
+import console_capture.auto
 
+# Optionen (der Launcher startet ohne Argumente → sampletext.txt, Zeichen-Modus, gekürzte Dateiausgabe)
+_parser = argparse.ArgumentParser(description="Zeichenverteilung, mittlere und Gesamt-Entropie einer Datei (blockweise, auch für GB-Dateien).")
+_parser.add_argument("path", nargs="?", default=os.path.join(_SCRIPT_DIR, "sampletext.txt"), help="Datei (Standard: sampletext.txt)")
+_parser.add_argument("--unit", choices=UNITS, default="utf8", help="utf8 = Unicode-Zeichen (Standard), byte = Bytewerte 0…255")
+_parser.add_argument("--mmap", action="store_true", help="Datei per mmap lesen (nur --unit byte)")
+_parser.add_argument("--chunk-mb", type=float, default=1.0, help="Blockgröße in MB bzw. Mio. Zeichen (Standard 1)")
+_parser.add_argument("--echo-max", type=int, default=10000, help="Dateiinhalt höchstens so viele Zeichen ausgeben, 0 = aus (Standard 10000)")
+args = _parser.parse_args()
+path = args.path
 
-print('Analyze the file: ',path)
-print('\n-----File Contents:---------------------------------------------------')
 
 
-# open the text file and create a dictionary for the characters 
-tokens = dict()
-count = 0
-try:
-    with open(path,'r') as f:
-        for line in f:
+print('Analyze the file: ',path)
+if args.echo_max > 0:
+    print('\n-----File Contents:---------------------------------------------------')
+    shown = 0
+    try:
+        for line in echo_text(path, args.echo_max):
             print(line)
-            for c in line:
-                count+=1
-                if c in tokens:
-                    tokens[c]+=1
-                else:
-                    tokens[c]=1
-except:
-    print("File open failed...")
+            shown += len(line)
+    except OSError:
+        pass
+    if shown >= args.echo_max:
+        print('... (Ausgabe nach {} Zeichen gekürzt, siehe --echo-max)'.format(args.echo_max))
     print('-----End of File---------------------------------------------------\n')
 
-print('Number of characters:',count)
-print('Character Dictionary:',tokens)
 
-#convert dictionary into list, and sort the list according to the character count
-token_list = sorted(tokens.items(), key = lambda x: x[1],reverse=True)
+def _key(sym):
+    """Symbolwert → Zeichen (utf8) bzw. Byte (byte) für Dictionary und Tabelle."""
+    return chr(sym) if args.unit == "utf8" else bytes([sym])
+
+
+# count the symbols block by block (numpy.bincount), memory stays constant for any file size
+t_start = time.perf_counter()
+try:
+    # first: erstes Vorkommen je Symbol → Dictionary und Gleichstände in der Tabelle wie beim Zeichen-Zählen
+    first = new_first_array(args.unit)
+    counts = count_symbols(path, args.unit, chunk_size=max(1, int(args.chunk_mb * (1 << 20))), use_mmap=args.mmap, first=first)
+    token_list = entropy_table(counts, first)
+except OSError:
+    print("File open failed...")
+    token_list = []
+t_analysis = time.perf_counter() - t_start
+count = sum(item[1] for item in token_list)
+unit_name = 'character' if args.unit == "utf8" else 'byte'
+
+print('Number of {}s:'.format(unit_name),count)
+print('Character Dictionary:',{_key(item[0]): item[1] for item in sorted(token_list, key=lambda item: first[item[0]])})
 
 #compute average entropy per character and total entropy for whole text
-print('\n-------Table of characters:----------------')
+print('\n-------Table of {}s:----------------'.format(unit_name))
 H_average = 0
-for item in token_list:
-    p = item[1]/count
-    H = math.log(1/p,2)
-    p_H = p*H
-    if item[0] < ' ':
-        print(' {} | cnt={:3d}    p={:1.3f}   H={:3.3f} bit/char  H_av={:3.3f} bit/char'.format(item[0].encode(),item[1],p,H,p_H))
+for sym, cnt, p, H, p_H in token_list:
+    key = _key(sym)
+    if args.unit == "byte" and 32 <= sym < 127:
+        key = chr(sym)
+    if isinstance(key, str) and key < ' ':
+        key = key.encode()
+    if isinstance(key, bytes):
+        print(' {} | cnt={:3d}    p={:1.3f}   H={:3.3f} bit/char  H_av={:3.3f} bit/char'.format(key,cnt,p,H,p_H))
     else:
-        print(' {:5} | cnt={:3d}    p={:1.3f}   H={:3.3f} bit/char  H_av={:3.3f} bit/char'.format(item[0],item[1],p,H,p_H))
+        print(' {:5} | cnt={:3d}    p={:1.3f}   H={:3.3f} bit/char  H_av={:3.3f} bit/char'.format(key,cnt,p,H,p_H))
     H_average += p_H
 
 print('-------------------------------------------\n')
 print('Average Entropy H = {:3.3f} bit/char'.format(H_average)   ) 
 print('Total Entropy of {:d} characters H={:3.2f} bit = {:3.2f} byte'.format(count, H_average*count,math.ceil(H_average*count/8))) 
+if t_analysis > 0 and count:
+    size_mb = os.path.getsize(path) / 1e6
+    print('Analysis time: {:.3f} s ({:.1f} MB/s)'.format(t_analysis, size_mb / t_analysis))
 
 # Log-Datei schließen, danach Konsole normal weiter nutzen (Endlosschleife)
-if _log_file is not None:
-    try:
-        sys.stdout = sys.__stdout__
-        _log_file.close()
-    except (OSError, NameError):
-        pass
+console_capture.uninstall()
 
 #infinite loop to keep console open
 while True:
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+$index 2
+$list
+$comment for a given text file, calculate the conditional entropy H(X|X_-1 ... X_-k) of higher order (n-grams)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Pfad relativ zum Skript-Verzeichnis, damit das Skript von überall (z. B. App-Launcher) funktioniert
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# lab_suite in sys.path, damit die gemeinsamen Pakete coding/ und console_capture/ importierbar sind (Start als Skript)
+_LAB_SUITE_ROOT = os.path.dirname(os.path.dirname(_SCRIPT_DIR))
+if _LAB_SUITE_ROOT not in sys.path:
+    sys.path.insert(0, _LAB_SUITE_ROOT)
+
+from coding.entropy import UNITS
+from coding.ngram import DEFAULT_MAX_ORDER, conditional_entropies
+
+# Konsolenausgabe parallel in submissions/console_log.txt schreiben (für Launcher „Konsolenausgabe einfügen“)
+import console_capture.auto
+
+# Optionen (der Launcher startet ohne Argumente → sampletext.txt, Zeichen-Modus, k bis 6)
+_parser = argparse.ArgumentParser(description="Bedingte Entropie H(X|X₋₁…X₋ₖ) einer Datei über n-Gramme (blockweise, auch für große Dateien).")
+_parser.add_argument("path", nargs="?", default=os.path.join(_SCRIPT_DIR, "sampletext.txt"), help="Datei (Standard: sampletext.txt)")
+_parser.add_argument("--order", type=int, default=DEFAULT_MAX_ORDER, help="größte Gedächtnislänge k (Standard 6)")
+_parser.add_argument("--unit", choices=UNITS, default="utf8", help="utf8 = Unicode-Zeichen (Standard), byte = Bytewerte 0…255")
+_parser.add_argument("--mmap", action="store_true", help="Datei per mmap lesen (nur --unit byte)")
+_parser.add_argument("--chunk-mb", type=float, default=1.0, help="Blockgröße in MB bzw. Mio. Zeichen (Standard 1)")
+args = _parser.parse_args()
+path = args.path
+
+
+
+print('Analyze the file: ',path)
+unit_name = 'char' if args.unit == "utf8" else 'byte'
+
+# count all n-grams (n = 1 ... k+1) in one pass, block by block with numpy
+t_start = time.perf_counter()
+try:
+    rows = conditional_entropies(path, args.order, args.unit, chunk_size=max(1, int(args.chunk_mb * (1 << 20))), use_mmap=args.mmap)
+except OSError:
+    print("File open failed...")
+    rows = []
+t_analysis = time.perf_counter() - t_start
+
+# H(X|X_-1 ... X_-k) = H(X_1 ... X_k+1) - H(X_1 ... X_k): block entropy of (k+1)-grams minus that of k-grams
+print('\n-------Conditional entropy of order k:------------------------------------')
+print(' {:>2} | {:>10} | {:>15} | {:>22}'.format('k', 'n-grams', 'H_block [bit]', 'H(X|X_-1..X_-k)'))
+for row in rows:
+    print(' {:2d} | {:10d} | {:15.3f} | {:12.3f} bit/{}'.format(row.order, row.distinct, row.block_entropy, row.conditional_entropy, unit_name))
+print('--------------------------------------------------------------------------\n')
+if rows:
+    print('Zero-order entropy H(X) = {:3.3f} bit/{}'.format(rows[0].conditional_entropy, unit_name))
+    print('Entropy with memory k={} H = {:3.3f} bit/{}'.format(rows[-1].order, rows[-1].conditional_entropy, unit_name))
+if t_analysis > 0 and rows:
+    size_mb = os.path.getsize(path) / 1e6
+    print('Analysis time: {:.3f} s ({:.1f} MB/s)'.format(t_analysis, size_mb / t_analysis))
+
+# Log-Datei schließen, danach Konsole normal weiter nutzen (Endlosschleife)
+console_capture.uninstall()
+
+#infinite loop to keep console open
+while True:
+    time.sleep(1)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+$list
+$comment Enter a string and encode it in one pass with adaptive Huffman coding (FGK / Vitter)
+$index 3
+"""
+
+import os
+import sys
+import time
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# lab_suite in sys.path, damit die gemeinsamen Pakete coding/ und console_capture/ importierbar sind (Start als Skript)
+_LAB_SUITE_ROOT = os.path.dirname(os.path.dirname(_SCRIPT_DIR))
+if _LAB_SUITE_ROOT not in sys.path:
+    sys.path.insert(0, _LAB_SUITE_ROOT)
+
+from coding import CanonicalCode
+from coding import adaptive
+
+# Konsolenausgabe parallel in submissions/console_log.txt schreiben (für Launcher „Konsolenausgabe einfügen“)
+import console_capture.auto
+
+# höchstens so viele Schritte in der Schritt-Tabelle ausgeben (lange Eingaben)
+MAX_STEPS_SHOWN = 60
+
+
+# Adaptive Huffman Coding: encoder and decoder update the same tree after every symbol,
+# no frequency table has to be transmitted. New symbols are sent as NYT code + 8 raw bits.
+
+#string = 'BCAADDDCCACACAC'
+string = input("Enter the string to encode with adaptive Huffman coding: ")
+print('---------------------------------------------------------')
+data = string.encode('utf-8')
+adaptive_bits = {}
+
+for algorithm in adaptive.ALGORITHMS:
+    print('\nAlgorithm: %s' % algorithm.upper())
+    print(' Step | Byte   | Code word')
+    print('-----------------------------------')
+    model = adaptive.new_model(algorithm)
+    total_bits = 0
+    for step, sym in enumerate(data):
+        word = model.codeword(sym)
+        if step < MAX_STEPS_SHOWN:
+            new = ' (new)' if model.position[sym] < 0 else ''
+            print(' %4d | %-6r | %s%s' % (step + 1, bytes([sym]), word, new))
+        total_bits += len(word)
+        model.update(sym)
+    adaptive_bits[algorithm] = total_bits
+    if len(data) > MAX_STEPS_SHOWN:
+        print(' ... (%d more steps)' % (len(data) - MAX_STEPS_SHOWN))
+
+    packed = adaptive.encode(data, algorithm)
+    ok = adaptive.decode(packed, len(data), algorithm) == data
+    print('Packed bitstream: %d bytes for %d bytes of input (round trip %s)' % (len(packed), len(data), 'OK' if ok else 'FAILED'))
+    if len(data) <= 64:
+        print('Bitstream (hex): %s' % packed.hex())
+
+# Vergleich mit dem statischen (zweipassigen) Huffman-Code: dort müssen die Codelängen mitgesendet werden
+if data:
+    canonical = CanonicalCode.from_data(data)
+    static_bits = sum(canonical.code_lengths()[sym] for sym in data)
+    print('\nStatic Huffman (two-pass): %d bits + code table (%d symbols)' % (static_bits, len(canonical.symbols)))
+    for algorithm in adaptive.ALGORITHMS:
+        print('Adaptive %-6s (one-pass): %d bits' % (algorithm.upper(), adaptive_bits[algorithm]))
+
+# Log-Datei schließen, danach Konsole normal weiter nutzen (Endlosschleife)
+console_capture.uninstall()
+
+while True:
+    time.sleep(1)
@@ -13,69 +13,24 @@ import os
 import sys
 import time
 
-# Konsolenausgabe parallel in submissions/console_log.txt schreiben (für Launcher „Konsolenausgabe einfügen“)
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-_CONSOLE_LOG_PATH = os.path.join(_SCRIPT_DIR, "submissions", "console_log.txt")
-
-
-class _Tee:
-    """Schreibt gleichzeitig in mehrere Streams (z. B. Konsole + Datei)."""
-    def __init__(self, *streams):
-        self.streams = streams
-    def write(self, data):
-        for s in self.streams:
-            s.write(data)
-            if getattr(s, "flush", None):
-                s.flush()
-    def flush(self):
-        for s in self.streams:
-            if getattr(s, "flush", None):
-                s.flush()
-    def writable(self):
-        return True
-
-
-_log_file = None
-try:
-    os.makedirs(os.path.dirname(_CONSOLE_LOG_PATH), exist_ok=True)
-    _log_file = open(_CONSOLE_LOG_PATH, "w", encoding="utf-8")
-    sys.stdout = _Tee(sys.__stdout__, _log_file)
-except OSError:
-    pass  # ohne Log-Datei weiterlaufen
-
-# Huffman Coding in python
-
-#string = 'BCAADDDCCACACAC'
-string = input("Enter the string to compute Huffman Code Tree: ")
-print('---------------------------------------------------------')
-
 
-# Creating tree nodes
-class NodeTree(object):
+# lab_suite in sys.path, damit die gemeinsamen Pakete coding/ und console_capture/ importierbar sind (Start als Skript)
+_LAB_SUITE_ROOT = os.path.dirname(os.path.dirname(_SCRIPT_DIR))
+if _LAB_SUITE_ROOT not in sys.path:
+    sys.path.insert(0, _LAB_SUITE_ROOT)
 
-    def __init__(self, left=None, right=None):
-        self.left = left
-        self.right = right
+from coding import CanonicalCode, huffman_codebook
 
-    def children(self):
-        return (self.left, self.right)
-
-    def nodes(self):
-        return (self.left, self.right)
+# Konsolenausgabe parallel in submissions/console_log.txt schreiben (für Launcher „Konsolenausgabe einfügen“)
+import console_capture.auto
 
-    def __str__(self):
-        return '%s_%s' % (self.left, self.right)
 
+# Huffman Coding in python
 
-# Main function implementing huffman coding
-def huffman_code_tree(node, left=True, binString=''):
-    if type(node) is str:
-        return {node: binString}
-    (l, r) = node.children()
-    d = dict()
-    d.update(huffman_code_tree(l, True,  binString + '0'))
-    d.update(huffman_code_tree(r, False, binString + '1'))
-    return d
+#string = 'BCAADDDCCACACAC'
+string = input("Enter the string to compute Huffman Code Tree: ")
+print('---------------------------------------------------------')
 
 
 # Calculating frequency of chars
@@ -91,17 +46,11 @@ print('Dictionary converted into a list:                  ',freq.items())
 #The sorted() function returns a sorted list of the specified iterable object.
 freq = sorted(freq.items(), key=lambda x: x[1], reverse=True)
 print('List of characters sorted to descending frequency: ',freq)
-nodes = freq
 
-while len(nodes) > 1:
-    (key1, c1) = nodes[-1]
-    (key2, c2) = nodes[-2]
-    nodes = nodes[:-2]
-    node = NodeTree(key1, key2)
-    nodes.append((node, c1 + c2))
-    nodes = sorted(nodes, key=lambda x: x[1], reverse=True)
-
-huffmanCode = huffman_code_tree(nodes[0][0])
+# Huffman-Baum mit dem gemeinsamen Engine-Modul (heapq, O(n log n)):
+# die zwei seltensten Knoten werden zusammengefasst, bis nur die Wurzel übrig ist
+# (reverse_ties: Gleichstände wie bisher, die Liste ist absteigend sortiert und wird von hinten abgebaut).
+huffmanCode = huffman_codebook(freq, reverse_ties=True) if freq else {}
 print('Huffman Code Dictionary:                           ',huffmanCode)
 
 print('\n Char | Huffman code ')
@@ -109,13 +58,16 @@ print('----------------------')
 for (char, frequency) in freq:
     print(' %-4r |%12s' % (char, huffmanCode[char]))
 
+# Kanonischer Code: gespeichert werden nur die Codelängen; der Text wird als gepackte Bytes kodiert
+if freq:
+    canonical = CanonicalCode.from_weights(freq)
+    packed = canonical.encode(string)
+    print('\nCanonical code lengths:', canonical.code_lengths())
+    print('Canonical Huffman code:', canonical.codebook())
+    print('Packed bitstream: %d bytes (%s) for %d chars' % (len(packed), packed.hex(), len(string)))
+
 # Log-Datei schließen, danach Konsole normal weiter nutzen (Endlosschleife)
-if _log_file is not None:
-    try:
-        sys.stdout = sys.__stdout__
-        _log_file.close()
-    except (OSError, NameError):
-        pass
+console_capture.uninstall()
 
 while True:
     time.sleep(1)    
\ No newline at end of file
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+$list
+$comment compress a text file with LZSS and LZW and compare with zlib / lzma
+$index 2
+"""
+
+import argparse
+import lzma
+import os
+import sys
+import time
+import zlib
+
+# Pfad relativ zum Skript-Verzeichnis, damit das Skript von überall (z. B. App-Launcher) funktioniert
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# lab_suite in sys.path, damit die gemeinsamen Pakete coding/ und console_capture/ importierbar sind (Start als Skript)
+_LAB_SUITE_ROOT = os.path.dirname(os.path.dirname(_SCRIPT_DIR))
+if _LAB_SUITE_ROOT not in sys.path:
+    sys.path.insert(0, _LAB_SUITE_ROOT)
+
+from coding import LZSS, LZW
+
+# Konsolenausgabe parallel in submissions/console_log.txt schreiben (für Launcher „Konsolenausgabe einfügen“)
+import console_capture.auto
+
+# Datei in Blöcken lesen (große Dateien passen nicht am Stück in den Speicher)
+CHUNK_SIZE = 1 << 20
+
+
+def _file_chunks(path):
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _measure(path, encode_iter, decode_iter):
+    """Datei blockweise kodieren und dekodieren → (komprimierte Größe, Enc-Sekunden, Dec-Sekunden, Round-Trip ok)."""
+    t0 = time.perf_counter()
+    encoded = b"".join(encode_iter(_file_chunks(path)))
+    t_enc = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    decoded = b"".join(decode_iter([encoded[i:i + CHUNK_SIZE] for i in range(0, len(encoded), CHUNK_SIZE)]))
+    t_dec = time.perf_counter() - t0
+    original = b"".join(_file_chunks(path))
+    return len(encoded), t_enc, t_dec, decoded == original
+
+
+def _zlib_stream(level):
+    def encode_iter(chunks):
+        c = zlib.compressobj(level)
+        for chunk in chunks:
+            yield c.compress(chunk)
+        yield c.flush()
+    def decode_iter(chunks):
+        d = zlib.decompressobj()
+        for chunk in chunks:
+            yield d.decompress(chunk)
+        yield d.flush()
+    return encode_iter, decode_iter
+
+
+def _lzma_stream(preset):
+    def encode_iter(chunks):
+        c = lzma.LZMACompressor(preset=preset)
+        for chunk in chunks:
+            yield c.compress(chunk)
+        yield c.flush()
+    def decode_iter(chunks):
+        d = lzma.LZMADecompressor()
+        for chunk in chunks:
+            yield d.decompress(chunk)
+    return encode_iter, decode_iter
+
+
+def main():
+    # Optionen (der Launcher startet ohne Argumente → sampletext.txt mit Standard-Fenster)
+    parser = argparse.ArgumentParser(description="LZSS/LZW-Kompression einer Datei im Vergleich mit zlib und lzma.")
+    parser.add_argument("path", nargs="?", default=os.path.join(_SCRIPT_DIR, "sampletext.txt"), help="Datei (Standard: sampletext.txt)")
+    parser.add_argument("--window-bits", type=int, default=15, help="LZSS-Fenster 2**bits Bytes, 1…16 (Standard 15)")
+    parser.add_argument("--max-chain", type=int, default=32, help="LZSS: höchstens so viele Kandidaten pro Position (Standard 32)")
+    parser.add_argument("--lzw-bits", type=int, default=16, help="LZW: maximale Codebreite in bit, 9…24 (Standard 16)")
+    args = parser.parse_args()
+    path = args.path
+
+    size = os.path.getsize(path)
+    print('Compress the file: ', path)
+    print('Size of file: {} bytes'.format(size))
+
+    lzss = LZSS(window_bits=args.window_bits, max_chain=args.max_chain)
+    lzw = LZW(max_bits=args.lzw_bits)
+    methods = [
+        ('LZSS (window {} B)'.format(lzss.window), lzss.encode_iter, lzss.decode_iter),
+        ('LZW ({} bit codes)'.format(lzw.max_bits), lzw.encode_iter, lzw.decode_iter),
+        ('zlib -6', *_zlib_stream(6)),
+        ('zlib -9', *_zlib_stream(9)),
+        ('lzma -6', *_lzma_stream(6)),
+    ]
+
+    print('\n-------Compression results:--------------------------------------------------------')
+    print(' {:>22} | {:>10} | {:>7} | {:>10} | {:>10} | {}'.format('method', 'bytes', 'ratio', 'enc MB/s', 'dec MB/s', 'round trip'))
+    for name, encode_iter, decode_iter in methods:
+        compressed, t_enc, t_dec, ok = _measure(path, encode_iter, decode_iter)
+        print(' {:>22} | {:>10d} | {:>6.2f}% | {:>10.2f} | {:>10.2f} | {}'.format(
+            name, compressed, 100 * compressed / max(1, size), size / 1e6 / max(t_enc, 1e-9), size / 1e6 / max(t_dec, 1e-9), 'OK' if ok else 'FAILED'))
+    print('-----------------------------------------------------------------------------------')
+
+    # Log-Datei schließen, danach Konsole normal weiter nutzen (Endlosschleife)
+    console_capture.uninstall()
+
+    #infinite loop to keep console open
+    while True:
+        time.sleep(1)
+
+
+if __name__ == "__main__":
+    main()
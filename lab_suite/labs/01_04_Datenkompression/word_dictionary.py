@@ -8,6 +8,7 @@ $comment create a dictionary for words in a text file
 $index 1
 """
 
+import argparse
 import os
 import sys
 import time
@@ -15,87 +16,64 @@ import math
 
 # Pfad relativ zum Skript-Verzeichnis, damit das Skript von überall (z. B. App-Launcher) funktioniert
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-path = os.path.join(_SCRIPT_DIR, "sampletext.txt")
 
-# Konsolenausgabe parallel in submissions/console_log.txt schreiben (für Launcher „Konsolenausgabe einfügen“)
-_CONSOLE_LOG_PATH = os.path.join(_SCRIPT_DIR, "submissions", "console_log.txt")
-
-
-class _Tee:
-    """Schreibt gleichzeitig in mehrere Streams (z. B. Konsole + Datei)."""
-    def __init__(self, *streams):
-        self.streams = streams
-    def write(self, data):
-        for s in self.streams:
-            s.write(data)
-            if getattr(s, "flush", None):
-                s.flush()
-    def flush(self):
-        for s in self.streams:
-            if getattr(s, "flush", None):
-                s.flush()
-    def writable(self):
-        return True
-
-
-_log_file = None
-try:
-    os.makedirs(os.path.dirname(_CONSOLE_LOG_PATH), exist_ok=True)
-    _log_file = open(_CONSOLE_LOG_PATH, "w", encoding="utf-8")
-    sys.stdout = _Tee(sys.__stdout__, _log_file)
-except OSError:
-    pass  # ohne Log-Datei weiterlaufen
-
-
-print('Analyze the file: ',path)
-tokens = dict()
-count = 0
-
-# open the text file and create a dictionary for the characters 
-with open(path,'r') as f:
-    for line in f:
-        line = line.replace(',',' ')
-        line = line.replace('.',' ')
-        words = line.split()
-        for word in words:
-            count+=1
-            if word in tokens:
-                tokens[word]+=1
-            else:
-                tokens[word]=1
-
-print('Total number of words:    ',count)
-print('Number of different words:',len(tokens))
-
-#convert dictionary into list, and sort the list according to the character count
-token_list = sorted(tokens.items(), key = lambda x: x[1],reverse=True)
-
-#compute average entropy per character and total entropy for whole text
-print('\n-------Table of words:-----------------------------------------')
-H_average = 0
-for item in token_list:
-    p = item[1]/count
-    H = math.log(1/p,2)
-    p_H = p*H
-    print(' {:>30} | cnt={:3d}    p={:1.3f}   H={:3.3f} bit/word   H_av={:3.3f} bit/word'.format(item[0],item[1],p,H,p_H))
-    H_average += p_H
-
-print('-----------------------------------------------------------------\n')
-print('Average Entropy H = {:3.3f} bit/word'.format(H_average)   ) 
-print('Total Entropy of {:d} words H={:3.3f} bit ({} bytes)'.format(count, H_average*count, math.ceil(H_average*count/8)))  
-print('Size of text file: {} bytes'.format(os.path.getsize(path)))
-
-# Log-Datei schließen, danach Konsole normal weiter nutzen (Endlosschleife)
-if _log_file is not None:
-    try:
-        sys.stdout = sys.__stdout__
-        _log_file.close()
-    except (OSError, NameError):
-        pass
-
-#infinite loop to keep console open
-while True:
-    time.sleep(1)
-    
+# lab_suite in sys.path, damit die gemeinsamen Pakete coding/ und console_capture/ importierbar sind (Start als Skript)
+_LAB_SUITE_ROOT = os.path.dirname(os.path.dirname(_SCRIPT_DIR))
+if _LAB_SUITE_ROOT not in sys.path:
+    sys.path.insert(0, _LAB_SUITE_ROOT)
 
+from coding.words import average_entropy, count_words_in_file, top_k, word_entropy_rows
 
+# Konsolenausgabe parallel in submissions/console_log.txt schreiben (für Launcher „Konsolenausgabe einfügen“)
+import console_capture.auto
+
+
+def main():
+    # Optionen (der Launcher startet ohne Argumente → sampletext.txt, ganze Tabelle, ein Prozess)
+    parser = argparse.ArgumentParser(description="Wort-Häufigkeiten, mittlere und Gesamt-Entropie einer Textdatei.")
+    parser.add_argument("path", nargs="?", default=os.path.join(_SCRIPT_DIR, "sampletext.txt"), help="Datei (Standard: sampletext.txt)")
+    parser.add_argument("--top", type=int, default=None, help="nur die K häufigsten Wörter in der Tabelle (Standard: alle)")
+    parser.add_argument("--workers", type=int, default=1, help="Prozesse für große Dateien, 0 = alle CPU-Kerne (Standard 1)")
+    parser.add_argument("--shard-mb", type=float, default=16.0, help="Größe eines Teilstücks pro Prozess in MB (Standard 16)")
+    args = parser.parse_args()
+    path = args.path
+
+    print('Analyze the file: ',path)
+
+    # Wörter zählen: Kommas und Punkte wirken wie Leerzeichen (blockweise split, Counter, optional mehrere Prozesse)
+    tokens = count_words_in_file(path, workers=args.workers or None, shard_size=max(1, int(args.shard_mb * 1_000_000)))
+    count = sum(tokens.values())
+
+    print('Total number of words:    ',count)
+    print('Number of different words:',len(tokens))
+
+    # häufigste Wörter zuerst; bei --top nur die K größten über einen Heap statt das ganze Vokabular zu sortieren
+    token_list = top_k(tokens, args.top)
+
+    #compute average entropy per character and total entropy for whole text
+    print('\n-------Table of words:-----------------------------------------')
+    rows = word_entropy_rows(token_list, count)
+    for word, cnt, p, H, p_H in rows:
+        print(' {:>30} | cnt={:3d}    p={:1.3f}   H={:3.3f} bit/word   H_av={:3.3f} bit/word'.format(word,cnt,p,H,p_H))
+    if len(rows) < len(tokens):
+        print(' ... ({} weitere Wörter, siehe --top)'.format(len(tokens) - len(rows)))
+        H_average = average_entropy(tokens)
+    else:
+        H_average = sum(row[4] for row in rows)
+
+    print('-----------------------------------------------------------------\n')
+    print('Average Entropy H = {:3.3f} bit/word'.format(H_average)   ) 
+    print('Total Entropy of {:d} words H={:3.3f} bit ({} bytes)'.format(count, H_average*count, math.ceil(H_average*count/8)))  
+    print('Size of text file: {} bytes'.format(os.path.getsize(path)))
+
+    # Log-Datei schließen, danach Konsole normal weiter nutzen (Endlosschleife)
+    console_capture.uninstall()
+
+    #infinite loop to keep console open
+    while True:
+        time.sleep(1)
+
+
+# Schutz nötig: mit --workers > 1 starten die Prozesse (Windows: spawn) dieses Modul neu
+if __name__ == "__main__":
+    main()
@@ -28,12 +28,110 @@ from __future__ import annotations
 
 # Zugriff auf die GUI über fachliche Größen (User-IDs aus dem Layout)
 from .._core import gui_binding
+from coding import build_huffman_tree
 
 import math
 import sys
+import weakref
+from collections import Counter
 global probabilities
 probabilities = []
 
+_COMPARE_BLOCK = 4096
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    """Länge des gemeinsamen Anfangs (blockweise Slice-Vergleiche in C, dann zeichenweise)."""
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i : i + _COMPARE_BLOCK] == b[i : i + _COMPARE_BLOCK]:
+        i += _COMPARE_BLOCK
+    i = min(i, n)
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _common_suffix_len(a: str, b: str, limit: int) -> int:
+    """Länge des gemeinsamen Endes, höchstens limit Zeichen (überlappt nicht mit dem Anfang)."""
+    i = 0
+    while i + _COMPARE_BLOCK <= limit and a[len(a) - i - _COMPARE_BLOCK : len(a) - i] == b[len(b) - i - _COMPARE_BLOCK : len(b) - i]:
+        i += _COMPARE_BLOCK
+    while i < limit and a[len(a) - i - 1] == b[len(b) - i - 1]:
+        i += 1
+    return i
+
+
+class _FrequencyModel:
+    """
+    Zeichenhäufigkeiten des Textes, inkrementell nachgeführt: nur der geänderte Bereich zwischen
+    altem und neuem Text (gemeinsamer Anfang/Ende) wird abgezogen bzw. hinzugezählt.
+    Zusätzlich die Position des ersten Vorkommens je Zeichen – sie legt wie bisher die Reihenfolge
+    bei gleicher Häufigkeit fest.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.counts: dict[str, int] = {}
+        self.first: dict[str, int] = {}
+
+    def update(self, new: str) -> None:
+        old = self.text
+        if new == old:
+            return
+        p = _common_prefix_len(old, new)
+        s = _common_suffix_len(old, new, min(len(old), len(new)) - p)
+        counts = self.counts
+        for c, n in Counter(old[p : len(old) - s]).items():
+            counts[c] -= n
+            if counts[c] == 0:
+                del counts[c]
+                del self.first[c]
+        for c, n in Counter(new[p : len(new) - s]).items():
+            counts[c] = counts.get(c, 0) + n
+        # erstes Vorkommen vor der Änderung bleibt gültig; alle anderen ab p neu suchen
+        for c in counts:
+            if self.first.get(c, p) >= p:
+                self.first[c] = new.find(c, p)
+        self.text = new
+
+    def ranking(self) -> list[tuple[str, int]]:
+        """(Zeichen, Anzahl) absteigend nach Häufigkeit, bei Gleichstand nach erstem Vorkommen."""
+        first = self.first
+        return sorted(self.counts.items(), key=lambda item: (-item[1], first[item[0]]))
+
+
+class _Session:
+    """
+    Zustand pro Browser-Tab: jeder Tab hat eigenen Text, eigene Widgets und einen eigenen App-Timer.
+    Änderungen am Text werden gesammelt und höchstens einmal pro Tick dieses Tabs neu berechnet;
+    solange der Timer des Tabs noch nicht getickt hat (oder die App keinen Timer startet), sofort.
+    """
+
+    def __init__(self) -> None:
+        self.model = _FrequencyModel()
+        self.signature = None  # (Rangfolge, gerundete Wahrscheinlichkeiten) der letzten Ausgabe
+        self.pending = False
+        self.ticking = False
+
+
+_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # Client → _Session, fällt mit dem Tab weg
+_no_client_session = _Session()
+
+
+def _session() -> _Session:
+    """_Session des aktuellen Clients (ui.context.client); ohne GUI-Kontext eine gemeinsame Ersatz-Session."""
+    try:
+        from nicegui import ui
+        client = ui.context.client
+    except Exception:
+        return _no_client_session
+    session = _sessions.get(client)
+    if session is None:
+        session = _sessions[client] = _Session()
+    return session
+
+
 def _node_label(node: tuple) -> str:
     """Knoten-Beschriftung: Blatt 'x' (0.25) oder innerer Knoten [0.50]."""
     if node[0] is not None:
@@ -61,16 +159,12 @@ def _huffman_tree_ascii(node: tuple, prefix: str = "", is_tail: bool = True, is_
 
 def _build_huffman_tree(freq: list[tuple], probabilities: list[float]) -> tuple:
     """Baut den Huffman-Baum aus (symbol, prob)-Blättern. Rückgabe: Wurzel-Knoten (symbol, prob) oder (None, prob, left, right)."""
-    nodes = [(sym, p) for (sym, _), p in zip(freq, probabilities)]
-    if len(nodes) == 1:
-        return nodes[0]
-    while len(nodes) > 1:
-        nodes.sort(key=lambda n: n[1])
-        left, right = nodes[0], nodes[1]
-        prob_sum = left[1] + right[1]
-        internal = (None, prob_sum, left, right)
-        nodes = [internal] + nodes[2:]
-    return nodes[0]
+    tree = build_huffman_tree([(sym, p) for (sym, _), p in zip(freq, probabilities)])
+    # Array-Baum → verschachtelte Tupel für _huffman_tree_ascii; Kinder haben kleinere Indizes als der Elternknoten
+    nodes: list[tuple] = [(sym, p) for sym, p in zip(tree.symbols, tree.weights)]
+    for i in range(tree.num_leaves, tree.root + 1):
+        nodes.append((None, tree.weights[i], nodes[tree.left[i]], nodes[tree.right[i]]))
+    return nodes[tree.root]
 
 
 class HuffmanCode:
@@ -144,21 +238,28 @@ class HuffmanCode:
 
 def run_domain_logic() -> None:
 
-    string =  gui_binding.get("my_text")
-
-    freq = {}
-    for c in string:
-        if c in freq:
-            freq[c] += 1
-        else:
-            freq[c] = 1
+    string =  gui_binding.get("my_text") or ""
 
-    freq = sorted(freq.items(), key=lambda x: x[1], reverse=True)
+    session = _session()
+    # nur die Änderung seit dem letzten Aufruf zählen (statt den ganzen Text neu)
+    session.model.update(string)
+    freq = session.model.ranking()
     length = len(string)
+    if length == 0:
+        session.signature = None
+        gui_binding.clear_markdown('code_table')
+        gui_binding.clear_markdown('code_tree')
+        return
 
     probabilities = [float("{:.2f}".format(frequency[1]/length)) for frequency in freq]
     probabilities = sorted(probabilities, reverse=True)
 
+    # Code und Baum hängen nur von Rangfolge und gerundeten Wahrscheinlichkeiten ab → sonst nichts neu bauen
+    signature = (tuple(char for char, _ in freq), tuple(probabilities))
+    if signature == session.signature:
+        return
+    session.signature = signature
+
     huffmanClassObject = HuffmanCode(probabilities)
     P = probabilities
 
@@ -192,5 +293,21 @@ def solve_task() -> None:
     Wird typisch aus user_callbacks.py oder einem Timer aufgerufen.
     """
     print("Solve Task")
-    run_domain_logic()
+    session = _session()
+    if session.ticking:
+        session.pending = True  # Tipp-Serien zusammenfassen: Berechnung im nächsten timer_tick dieses Tabs
+    else:
+        run_domain_logic()
+
+
+def timer_tick() -> None:
+    """
+    Vom App-Timer des Tabs aufgerufen (Client-Kontext, Takt TIMER_INTERVAL_SEC der App): höchstens eine
+    Neuberechnung pro Tick, nur wenn sich der Text dieses Tabs geändert hat.
+    """
+    session = _session()
+    session.ticking = True
+    if session.pending:
+        session.pending = False
+        run_domain_logic()
 
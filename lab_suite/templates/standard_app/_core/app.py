@@ -21,7 +21,7 @@ _lab_suite_root = APP_ROOT.parent.parent
 if str(_lab_suite_root) not in sys.path:
     sys.path.insert(0, str(_lab_suite_root))
 
-from nicegui import Client, app, ui
+from nicegui import Client, app, background_tasks, ui
 
 from app_builder import (
     build_ui_from_layout,
@@ -31,17 +31,24 @@ from app_builder import (
     load_layout,
 )
 from app_builder.editor_helper import get_editor_context
+import tracing
 
 # Projektbezogene Module (gleicher Ordner)
 from .assignment_registry import (
     get_active_assignment_name,
     get_assignment,
+    get_timer_tick,
     list_assignments,
     set_active_assignment,
 )
 from .callback_skeleton import get_callback_registry
 from .gui_binding import update_binding_from_layout
+from .hot_reload import CallbackRegistry, HotReloader, ReloadResult, hot_reload_enabled
 from .model_schema import load_state, save_state, STATE_DEFAULTS
+from .profiler import DEFAULT_SECONDS, capture, is_local_client, is_local_request, profile_endpoint_enabled
+from .tick_driver import TickDriver
+from .tick_executor import executor_mode, shutdown_executors
+from .tick_scheduler import scheduler_from_env
 
 # Property-Editor (wie im Grid-Editor)
 from app_builder import get_prop_editor_specs
@@ -100,6 +107,76 @@ if _widgets_static.exists():
 # Gemeinsamer State für alle Clients (ein Tab = eine state-Kopie würde beim Shutdown mit altem Stand überschreiben)
 _SHARED_STATE_REF: list = [None]
 
+# Gemeinsame Callback-Registry für alle Clients; Hot-Reload tauscht den Inhalt (swap) nach Änderung an user_callbacks.py
+_CALLBACKS = CallbackRegistry(get_callback_registry())
+
+
+def _notify_reload(result: ReloadResult) -> None:
+    """Reload-Ergebnis (Latenz bzw. Fehler) in allen verbundenen Browser-Tabs anzeigen."""
+    for client in list(getattr(Client, "instances", {}).values()):
+        if not getattr(client, "has_socket_connection", True):
+            continue
+        try:
+            with client:
+                ui.notify(
+                    result.summary(),
+                    type="positive" if result.ok else "negative",
+                    multi_line=not result.ok,
+                    timeout=3000 if result.ok else 0,
+                    close_button=not result.ok,
+                )
+        except Exception:
+            pass
+
+
+# Hot-Reload (watchfiles): geänderte Assignments/user_callbacks.py ohne Neustart laden; HOT_RELOAD=0 schaltet ab
+_hot_reloader = HotReloader(__package__.rsplit("._core", 1)[0], _CALLBACKS, on_result=_notify_reload) if __package__ else None
+if _hot_reloader is not None and hot_reload_enabled():
+    app.on_startup(lambda: background_tasks.create(_hot_reloader.run(), name="hot-reload"))
+    app.on_shutdown(_hot_reloader.stop)
+app.on_shutdown(shutdown_executors)
+
+# Tracing-Spans (TRACE_SPANS=1): Websocket-Emit mit erfassen, beim Beenden Chrome-Trace-JSON schreiben (TRACE_FILE)
+if tracing.enabled():
+    tracing.install_socket_tracing()
+    app.on_shutdown(lambda: print(f"[trace] {tracing.dump_trace()}"))
+
+# Profil-Messung per HTTP (PROFILE_ENDPOINT=1, nur localhost): GET /_profile?seconds=5[&format=collapsed]
+PROFILE_SECONDS = float(__import__("os").environ.get("PROFILE_SECONDS", str(DEFAULT_SECONDS)))
+if profile_endpoint_enabled():
+    from fastapi import Request
+    from fastapi.responses import PlainTextResponse
+
+    @app.get("/_profile")
+    async def _profile_route(request: Request, seconds: float = PROFILE_SECONDS, format: str = "report"):
+        if not is_local_request(request):
+            return PlainTextResponse("Profil nur von localhost", status_code=403)
+        try:
+            result = await capture(seconds, APP_ROOT / "profiles")
+        except RuntimeError as e:
+            return PlainTextResponse(str(e), status_code=409)
+        if format == "collapsed":
+            return PlainTextResponse(result.collapsed_path.read_text(encoding="utf-8"))
+        return PlainTextResponse(result.report, headers={"X-Profile-Collapsed": str(result.collapsed_path)})
+
+# Timer für User-Logik (Plot-Updates etc.); Rate über Umgebungsvariable TIMER_INTERVAL_SEC (z. B. 0.1 = 10 Hz).
+# Ein Tick-Driver für alle Clients: timer_tick einmal pro Periode rechnen, Ergebnis an alle Tabs verteilen.
+# Tick-Scheduler statt ui.timer: feste Fristen, Overrun-Erkennung, verspätete Ticks werden zusammengefasst
+# (TIMER_LATE_POLICY=merge|skip), optional adaptive Rate (TIMER_ADAPTIVE=1, TIMER_MAX_INTERVAL_SEC).
+# TIMER_EXECUTOR=thread|process: timer_tick im Worker, set()/update_plot() zurück auf dem Loop.
+TIMER_INTERVAL_SEC = float(__import__("os").environ.get("TIMER_INTERVAL_SEC", "0.1"))
+_TICK_DRIVER: TickDriver | None = None
+if TIMER_INTERVAL_SEC > 0:
+    _TICK_DRIVER = TickDriver(
+        get_timer_tick,  # timer_tick aus dem Registry-Cache: kein active.json-Lesen/Import pro Tick
+        lambda: _SHARED_STATE_REF[0],
+        lambda get_tick: scheduler_from_env(get_tick, TIMER_INTERVAL_SEC),
+        executor_mode=lambda: executor_mode(get_assignment()),
+        is_client_alive=lambda client: client.id in Client.instances,
+    )
+    app.on_startup(lambda: background_tasks.create(_TICK_DRIVER.run(), name="tick-driver"))
+    app.on_shutdown(_TICK_DRIVER.stop)
+
 
 async def build_root() -> None:
     await ui.context.client.connected()
@@ -117,7 +194,7 @@ async def build_root() -> None:
     if _SHARED_STATE_REF[0] is None:
         _SHARED_STATE_REF[0] = load_state(APP_ROOT / SESSION_STATE_FILENAME)
     state = _SHARED_STATE_REF[0]
-    callbacks = get_callback_registry()
+    callbacks = _CALLBACKS
 
     state_label_holder: list = []
     _persist_state_timer_ref: list = [None]  # für debounced Save bei Widget-Änderung
@@ -133,6 +210,7 @@ async def build_root() -> None:
     edit_mode_container_ref: list = []  # wird in Editor-Bereich befüllt
     debug_mode_ref: list = [False]  # DEBUG MODE: State-Dictionary-Anzeige ein/aus
     debug_mode_checkbox_ref: list = []
+    profile_button_ref: list = []  # Button „Profil“ (nur bei DEBUG MODE sichtbar, nur für localhost angelegt)
     state_label_container_ref: list = []  # Container um State-Label; Sichtbarkeit per DEBUG MODE
 
     def _refresh_state_display() -> None:
@@ -263,11 +341,43 @@ async def build_root() -> None:
                 if state_label_container_ref:
                     state_label_container_ref[0].set_visibility(debug_mode_ref[0])
                     state_label_container_ref[0].update()
+                if profile_button_ref:
+                    profile_button_ref[0].set_visibility(debug_mode_ref[0])
 
             dbg_cb = ui.checkbox("DEBUG MODE", value=debug_mode_ref[0]).props("dense")
             debug_mode_checkbox_ref.append(dbg_cb)
             dbg_cb.on("update:model-value", _on_debug_mode_change)
 
+            async def _on_profile_click() -> None:
+                # laufende App PROFILE_SECONDS lang profilieren (Ticks, Callbacks); Bericht + Flamegraph-Datei
+                btn = profile_button_ref[0]
+                btn.disable()
+                ui.notify(f"Profil läuft {PROFILE_SECONDS:.0f} s …")
+                try:
+                    result = await capture(PROFILE_SECONDS, APP_ROOT / "profiles")
+                except RuntimeError as e:
+                    ui.notify(str(e), type="warning")
+                    return
+                finally:
+                    btn.enable()
+                with ui.dialog() as dialog, ui.card().style("max-width: 90vw"):
+                    ui.label(result.summary()).classes("text-subtitle2")
+                    with ui.scroll_area().style("height: 60vh; width: 85vw"):
+                        ui.label(result.report).style("white-space: pre; font-family: monospace; font-size: 12px")
+                    with ui.row():
+                        ui.button("Collapsed Stacks", on_click=lambda: ui.download.file(result.collapsed_path)).props("dense")
+                        if result.pstats_path is not None:
+                            ui.button("pstats", on_click=lambda: ui.download.file(result.pstats_path)).props("dense")
+                        ui.button("Schließen", on_click=dialog.close).props("dense flat")
+                dialog.open()
+
+            # Profil schreibt Dateien auf dem Server und bremst alle Clients: nur Browser auf diesem Rechner
+            if is_local_client(ui.context.client):
+                profile_btn = ui.button("Profil", on_click=_on_profile_click).props("dense outline size=sm")
+                profile_btn.tooltip(f"Laufende App {PROFILE_SECONDS:.0f} s profilieren (cProfile + Stichproben)")
+                profile_btn.set_visibility(debug_mode_ref[0])
+                profile_button_ref.append(profile_btn)
+
             ui.space()
             ui.label("(Edit-Modus: Hover path_id, Rahmen, Klick wählt; Code/Properties erscheinen)").classes(
                 "text-caption text-grey"
@@ -290,19 +400,9 @@ async def build_root() -> None:
         register_markdown_view=lambda src, prev, update=None, always_show_source=False: markdown_views_ref.append((src, prev, update, always_show_source)),
     )
 
-    # Timer für User-Logik (Plot-Updates etc.); Rate über Umgebungsvariable TIMER_INTERVAL_SEC (z. B. 0.1 = 10 Hz)
-    _timer_interval = float(__import__("os").environ.get("TIMER_INTERVAL_SEC", "0.1"))
-    if _timer_interval > 0:
-
-        def _timer_callback() -> None:
-            mod = get_assignment()
-            if mod is not None and hasattr(mod, "timer_tick"):
-                try:
-                    mod.timer_tick()
-                except Exception:
-                    pass
-
-        ui.timer(_timer_interval, _timer_callback)
+    # Timer für User-Logik: ein prozessweiter Tick-Driver für alle Tabs (siehe _TICK_DRIVER); Client anmelden
+    if _TICK_DRIVER is not None:
+        _TICK_DRIVER.subscribe(ui.context.client)
 
     # State-Dictionary-Anzeige (Code bleibt; Sichtbarkeit per DEBUG MODE Checkbox)
     with ui.element("div") as state_label_container:
@@ -4,13 +4,25 @@ Assignment-Registry: Wahlweise eine Fachaufgabe (Assignment) in die App einhäng
 Assignments liegen im Ordner assignments/ (user_template.py, assignment_01.py, …).
 Aktives Assignment: GUI-Auswahl (speichert in assignments/active.json) oder Fallback ASSIGNMENT.
 Aus user_callbacks.py oder Timer: get_assignment() → Modul mit run_domain_logic() / solve_task().
+
+Cache: Das aufgelöste Modul und sein timer_tick bleiben im Speicher; der Timer (get_timer_tick)
+liest weder active.json noch ruft er importlib auf. Neu aufgelöst wird nur
+- nach set_active_assignment() oder invalidate_assignment_cache(),
+- wenn sich active.json ändert: mit watchfiles (requirements) per Hintergrund-Thread, ohne watchfiles
+  per mtime-Vergleich höchstens alle ASSIGNMENT_POLL_SEC Sekunden (Default 1.0),
+- nach einem fehlgeschlagenen Import (Syntaxfehler im Assignment) im selben Takt erneut.
+get_registry_stats() zählt die Dateisystem-Zugriffe (stat/read/import) gegen die Anzahl Abfragen.
 """
 from __future__ import annotations
 
 import importlib
 import json
+import os
+import threading
+import time
 from pathlib import Path
 from types import ModuleType
+from typing import Any, Callable
 
 # Fallback, wenn keine GUI-Auswahl und keine active.json
 ASSIGNMENT: str = "user_template"
@@ -23,6 +35,24 @@ _ACTIVE_FILE = _ASSIGNMENTS_DIR / "active.json"
 # Modulnamen, die keine Assignments sind (nur Callbacks/Infrastruktur)
 _NON_ASSIGNMENT_MODULES = frozenset({"user_callbacks", "__init__"})
 
+# mtime-Prüfung von active.json ohne watchfiles (Sekunden); ASSIGNMENT_WATCH=0 schaltet watchfiles ab
+ACTIVE_POLL_INTERVAL_SEC = float(os.environ.get("ASSIGNMENT_POLL_SEC", "1.0"))
+_USE_WATCHFILES = os.environ.get("ASSIGNMENT_WATCH", "1").strip().lower() not in ("0", "false", "no")
+
+_lock = threading.RLock()
+# Aufgelöstes Assignment: valid=False erzwingt Neuauflösung bei der nächsten Abfrage
+_cache: dict[str, Any] = {
+    "valid": False,
+    "name": None,
+    "module": None,
+    "timer_tick": None,
+    "mtime_ns": None,
+    "next_check": 0.0,
+}
+# Zähler: Dateisystem-Zugriffe (stat, read, import) und Abfragen (lookups) bzw. Neuauflösungen
+_stats: dict[str, int] = {"lookups": 0, "resolves": 0, "stat": 0, "read": 0, "import": 0}
+_watcher: dict[str, Any] = {"thread": None, "stop": None}
+
 
 def _parent_package() -> str:
     """Paket der App (development_app), nicht _core, für Import .assignments.<name>."""
@@ -32,35 +62,160 @@ def _parent_package() -> str:
     return pkg
 
 
-def _get_active_name(override: str | None) -> str | None:
-    """Aktives Assignment: override (z. B. aus State) > active.json > ASSIGNMENT."""
-    if override and override.strip():
-        return override.strip()
-    if _ACTIVE_FILE.exists():
-        try:
-            data = json.loads(_ACTIVE_FILE.read_text(encoding="utf-8"))
-            name = (data.get("assignment") or "").strip()
-            if name:
-                return name
-        except Exception:
-            pass
-    return ASSIGNMENT.strip() or None
+def _active_mtime_ns() -> int | None:
+    """mtime von active.json (None, wenn nicht vorhanden)."""
+    _stats["stat"] += 1
+    try:
+        return _ACTIVE_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
 
 
-def get_assignment(active_override: str | None = None) -> ModuleType | None:
-    """Lädt das aktive Assignment-Modul aus assignments/ (user_template, assignment_01, …)."""
-    name = _get_active_name(active_override)
-    if not name:
+def _read_active_file() -> str | None:
+    """Assignment-Name aus active.json (None bei fehlender/ungültiger Datei)."""
+    _stats["read"] += 1
+    try:
+        data = json.loads(_ACTIVE_FILE.read_text(encoding="utf-8"))
+        name = (data.get("assignment") or "").strip()
+        return name or None
+    except Exception:
         return None
+
+
+def _import_assignment(name: str) -> ModuleType | None:
     parent = _parent_package()
     if not parent:
         return None
+    _stats["import"] += 1
     try:
         return importlib.import_module(f".assignments.{name}", package=parent)
     except Exception:
         return None
 
 
+def _resolve_locked() -> None:
+    """active.json lesen, Modul importieren, timer_tick binden (Aufruf unter _lock)."""
+    _stats["resolves"] += 1
+    mtime_ns = _active_mtime_ns()
+    # Aktives Assignment: active.json > ASSIGNMENT
+    name = (_read_active_file() if mtime_ns is not None else None) or ASSIGNMENT.strip() or None
+    module = _import_assignment(name) if name else None
+    tick = getattr(module, "timer_tick", None) if module is not None else None
+    _cache.update(
+        valid=True,
+        name=name,
+        module=module,
+        timer_tick=tick if callable(tick) else None,
+        mtime_ns=mtime_ns,
+        next_check=time.monotonic() + ACTIVE_POLL_INTERVAL_SEC,
+    )
+
+
+def _ensure_current() -> None:
+    """Cache gültig halten; im Normalfall (gültig, Watcher aktiv) ohne Dateisystem-Zugriff."""
+    _stats["lookups"] += 1
+    if _cache["valid"] and _cache["module"] is not None and _watcher["thread"] is not None:
+        return
+    _start_watcher()
+    with _lock:
+        if not _cache["valid"]:
+            _resolve_locked()
+            return
+        if time.monotonic() < _cache["next_check"]:
+            return
+        if _cache["module"] is None and _cache["name"]:
+            _resolve_locked()  # Import war fehlgeschlagen: erneut versuchen
+        elif _watcher["thread"] is None:
+            if _active_mtime_ns() != _cache["mtime_ns"]:
+                _resolve_locked()
+            else:
+                _cache["next_check"] = time.monotonic() + ACTIVE_POLL_INTERVAL_SEC
+
+
+def _watch_loop(stop: threading.Event) -> None:
+    """Hintergrund-Thread: Änderungen an active.json per watchfiles → Cache ungültig."""
+    from watchfiles import watch
+
+    try:
+        for changes in watch(_ASSIGNMENTS_DIR, stop_event=stop, recursive=False):
+            if any(Path(path).name == _ACTIVE_FILE.name for _, path in changes):
+                invalidate_assignment_cache()
+    except Exception:
+        pass
+    # Watcher beendet (z. B. Ordner gelöscht): zurück auf mtime-Prüfung, kein Neustart pro Tick
+    with _lock:
+        if _watcher["stop"] is stop:
+            _watcher["unavailable"] = not stop.is_set()
+            _watcher["thread"] = None
+            _watcher["stop"] = None
+
+
+def _start_watcher() -> None:
+    if not _USE_WATCHFILES or _watcher["thread"] is not None or _watcher.get("unavailable"):
+        return
+    with _lock:
+        if _watcher["thread"] is not None:
+            return
+        try:
+            import watchfiles  # noqa: F401
+        except ImportError:
+            _watcher["unavailable"] = True  # optional: ohne watchfiles mtime-Prüfung
+            return
+        if not _ASSIGNMENTS_DIR.is_dir():
+            return
+        stop = threading.Event()
+        thread = threading.Thread(target=_watch_loop, args=(stop,), name="assignment-watch", daemon=True)
+        _watcher["thread"] = thread
+        _watcher["stop"] = stop
+        thread.start()
+
+
+def stop_watcher() -> None:
+    """watchfiles-Thread beenden (z. B. beim Herunterfahren); danach mtime-Prüfung."""
+    with _lock:
+        thread, stop = _watcher["thread"], _watcher["stop"]
+        _watcher["thread"] = None
+        _watcher["stop"] = None
+    if stop is not None:
+        stop.set()
+    if thread is not None and thread is not threading.current_thread():
+        thread.join(timeout=2.0)
+
+
+def invalidate_assignment_cache() -> None:
+    """Erzwingt Neuauflösung (active.json lesen, importieren) bei der nächsten Abfrage."""
+    with _lock:
+        _cache["valid"] = False
+
+
+def get_assignment(active_override: str | None = None) -> ModuleType | None:
+    """Lädt das aktive Assignment-Modul aus assignments/ (user_template, assignment_01, …)."""
+    if active_override and active_override.strip():
+        _stats["lookups"] += 1
+        return _import_assignment(active_override.strip())
+    _ensure_current()
+    return _cache["module"]
+
+
+def get_timer_tick() -> Callable[..., Any] | None:
+    """timer_tick des aktiven Assignments (gebunden beim Auflösen) oder None – für den App-Timer."""
+    _ensure_current()
+    return _cache["timer_tick"]
+
+
+def get_registry_stats() -> dict[str, Any]:
+    """
+    Zähler seit Start: lookups (Abfragen), resolves (Neuauflösungen), stat/read/import
+    (Dateisystem-Zugriffe), fs_hits (Summe) und watching (watchfiles aktiv).
+    Im Dauerbetrieb steigt lookups mit jedem Timer-Tick, fs_hits bleibt stehen.
+    """
+    out: dict[str, Any] = dict(_stats)
+    out["fs_hits"] = _stats["stat"] + _stats["read"] + _stats["import"]
+    out["watching"] = _watcher["thread"] is not None
+    out["active"] = _cache["name"]
+    return out
+
+
 def list_assignments() -> list[str]:
     """Listet Assignment-Modulnamen aus assignments/*.py (ohne __init__, user_callbacks)."""
     names = []
@@ -75,10 +230,14 @@ def list_assignments() -> list[str]:
 
 def get_active_assignment_name(override: str | None = None) -> str:
     """Name des aktiven Assignments (für GUI-Anzeige/Dropdown)."""
-    return _get_active_name(override) or ASSIGNMENT or "user_template"
+    if override and override.strip():
+        return override.strip()
+    _ensure_current()
+    return _cache["name"] or ASSIGNMENT or "user_template"
 
 
 def set_active_assignment(name: str) -> None:
     """Setzt das aktive Assignment (persistent in assignments/active.json)."""
     _ASSIGNMENTS_DIR.mkdir(parents=True, exist_ok=True)
     _ACTIVE_FILE.write_text(json.dumps({"assignment": name.strip()}, indent=2), encoding="utf-8")
+    invalidate_assignment_cache()
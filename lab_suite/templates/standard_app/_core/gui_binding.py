@@ -10,12 +10,23 @@ Hier findet die Kopplung zwischen User-Logik und GUI statt. Statt path_ids
   Dann wird das Binding automatisch erzeugt – kein manuelles Dict nötig.
 - get(key): Liest den aktuellen Wert aus dem State.
 - set(key, value): Schreibt in State und aktualisiert Output-Widgets (LED, VU-Meter) über die Registry.
+- update_plot(key, data): Plot komplett ersetzen; append_points(key, x_new, y_new, max_points): nur neue
+  Samples an ein gleitendes Fenster anhängen (Streaming, Payload proportional zu den neuen Daten).
 
 Analogie Qt: Wie QObject.property(name) / setProperty(name, value); user_id = logischer Name.
+
+Aufgezeichneter Tick (tick_driver/tick_executor): timer_tick läuft ohne Client-Kontext – einmal für alle
+Clients, ggf. in einem Worker-Thread/-Prozess. run_deferred() setzt dafür einen Rahmen: get() liest aus einer
+State-Kopie, set()/clear_markdown()/update_plot()/append_points()/notify() werden nur aufgezeichnet und später
+mit apply_ops() auf dem Event-Loop in jedem Client-Kontext ausgeführt. Direkter GUI-Zugriff (ui.notify,
+ui.context.client) ist im Rahmen nicht möglich; gui_context_available() prüft das und warnt einmalig.
 """
 from __future__ import annotations
 
-from typing import Any
+import threading
+from typing import Any, Callable
+
+from tracing import span
 
 
 # Logischer Name (fachliche Größe) → path_id. Wird bei App-Start aus Layout (props.user_id) befüllt;
@@ -36,8 +47,74 @@ def update_binding_from_layout(layout: dict, merge: bool = False) -> None:
     SEMANTIC_BINDING.update(collected)
 
 
+# Aufgezeichneter Rahmen pro Thread (nur im Worker-Modus gesetzt)
+_deferred = threading.local()
+
+
+class _DeferredFrame:
+    """State-Kopie und Binding für get(); ops sammelt set()/update_plot() als (Name, args, kwargs)."""
+
+    def __init__(self, state: dict[str, Any], binding: dict[str, str]) -> None:
+        self.state = state
+        self.binding = binding
+        self.ops: list[tuple[str, tuple, dict]] = []
+
+
+def _frame() -> _DeferredFrame | None:
+    return getattr(_deferred, "frame", None)
+
+
+_warned: set[str] = set()  # bereits gemeldete GUI-Zugriffe im Rahmen (hier noch das eingebaute set)
+
+
+def gui_context_available(what: str = "") -> bool:
+    """
+    False im aufgezeichneten Tick (kein Client-Kontext), sonst True. Mit what (z. B. "debug_plot_binding")
+    wird einmalig pro what eine Warnung ausgegeben – statt dass der GUI-Zugriff still ins Leere läuft.
+    """
+    if _frame() is None:
+        return True
+    if what and what not in _warned:
+        _warned.add(what)
+        print(
+            f"[gui_binding] {what}: kein Client-Kontext im aufgezeichneten Tick (Tick-Driver/Worker); "
+            "nur get/set/clear_markdown/update_plot/append_points/notify werden übertragen"
+        )
+    return False
+
+
+def snapshot() -> tuple[dict[str, Any], dict[str, str]]:
+    """Kopie von State und SEMANTIC_BINDING des aktuellen Clients (Eingabe für run_deferred)."""
+    state, _, _ = _client_state_and_registry()
+    return dict(state or {}), dict(SEMANTIC_BINDING)
+
+
+def run_deferred(fn: Callable[[], Any], state: dict[str, Any], binding: dict[str, str]) -> list[tuple[str, tuple, dict]]:
+    """
+    Führt fn() (z. B. timer_tick) ohne GUI-Kontext aus – auf dem Event-Loop (Tick-Driver) oder im Worker.
+    get() liest aus state, set()/update_plot() usw. werden aufgezeichnet; Rückgabe: Liste für apply_ops().
+    """
+    frame = _DeferredFrame(state, binding)
+    _deferred.frame = frame
+    try:
+        with span("gui_binding.run_deferred"):
+            fn()
+    finally:
+        _deferred.frame = None
+    return frame.ops
+
+
+def apply_ops(ops: list[tuple[str, tuple, dict]]) -> None:
+    """Aufgezeichnete set()/update_plot()-Aufrufe ausführen (Event-Loop, im Client-Kontext)."""
+    with span("gui_binding.apply_ops", ops=len(ops)):
+        for name, args, kwargs in ops:
+            _DEFERRABLE[name](*args, **kwargs)
+
+
 def _client_state_and_registry() -> tuple[dict[str, Any] | None, dict[str, Any] | None, dict[str, Any] | None]:
     """State, Widget-Registry und State-Input-Registry aus dem aktuellen Client-Kontext (NiceGUI)."""
+    if not gui_context_available("Zugriff auf State/Widget-Registry"):
+        return None, None, None
     try:
         from nicegui import ui
         client = ui.context.client
@@ -56,13 +133,18 @@ def get(key: str, default: Any = None) -> Any:
     Liest den Wert der fachlichen Größe key (über SEMANTIC_BINDING → path_id → state).
     Nur in GUI-Kontext aufrufen (z. B. in Callbacks, Timer); sonst default.
     """
-    path_id = SEMANTIC_BINDING.get(key)
-    if not path_id:
-        return default
-    state, _, _ = _client_state_and_registry()
-    if state is None:
-        return default
-    return state.get(path_id, default)
+    with span("gui_binding.get", key=key):
+        frame = _frame()
+        if frame is not None:
+            path_id = frame.binding.get(key)
+            return frame.state.get(path_id, default) if path_id else default
+        path_id = SEMANTIC_BINDING.get(key)
+        if not path_id:
+            return default
+        state, _, _ = _client_state_and_registry()
+        if state is None:
+            return default
+        return state.get(path_id, default)
 
 
 def set(key: str, value: Any) -> None:
@@ -72,40 +154,71 @@ def set(key: str, value: Any) -> None:
     - State-Input-Registry: editierbare Markdown-Textarea (.value) wird gesetzt.
     Nur in GUI-Kontext aufrufen (Callbacks, Timer).
     """
-    path_id = SEMANTIC_BINDING.get(key)
-    if not path_id:
-        return
-    state, registry, state_input_registry = _client_state_and_registry()
-    str_value = str(value) if value is not None else ""
-    if state is not None:
-        state[path_id] = value
-    if registry is not None and path_id in registry:
-        w = registry[path_id]
-        if hasattr(w, "set_state"):
-            w.set_state(value)
-        elif hasattr(w, "set_value"):
-            try:
-                w.set_value(float(value))
-            except (TypeError, ValueError):
-                pass
-        elif hasattr(w, "set_content"):
-            w.set_content(str_value)
-    if state_input_registry is not None and path_id in state_input_registry:
-        inp = state_input_registry[path_id]
-        if hasattr(inp, "value"):
-            inp.value = str_value
-            if hasattr(inp, "update"):
-                inp.update()
+    with span("gui_binding.set", key=key):
+        frame = _frame()
+        if frame is not None:
+            path_id = frame.binding.get(key)
+            if path_id:
+                frame.state[path_id] = value  # nachfolgende get() im selben Tick sehen den neuen Wert
+                frame.ops.append(("set", (key, value), {}))
+            return
+        path_id = SEMANTIC_BINDING.get(key)
+        if not path_id:
+            return
+        state, registry, state_input_registry = _client_state_and_registry()
+        str_value = str(value) if value is not None else ""
+        if state is not None:
+            state[path_id] = value
+        if registry is not None and path_id in registry:
+            w = registry[path_id]
+            if hasattr(w, "set_state"):
+                w.set_state(value)
+            elif hasattr(w, "set_value"):
+                try:
+                    w.set_value(float(value))
+                except (TypeError, ValueError):
+                    pass
+            elif hasattr(w, "set_content"):
+                w.set_content(str_value)
+        if state_input_registry is not None and path_id in state_input_registry:
+            inp = state_input_registry[path_id]
+            if hasattr(inp, "value"):
+                inp.value = str_value
+                if hasattr(inp, "update"):
+                    inp.update()
 
 
 def clear_markdown(key: str) -> None:
     """
     Löscht den Inhalt der Markdown-Box (user_id = key).
-    Gleichbedeutend mit set(key, ""). Nur in GUI-Kontext aufrufen.
+    Gleichbedeutend mit set(key, ""); im aufgezeichneten Tick wird der Aufruf aufgezeichnet.
     """
+    frame = _frame()
+    if frame is not None:
+        path_id = frame.binding.get(key)
+        if path_id:
+            frame.state[path_id] = ""
+            frame.ops.append(("clear_markdown", (key,), {}))
+        return
     set(key, "")
 
 
+def notify(message: Any, **kwargs: Any) -> None:
+    """
+    ui.notify im Client-Kontext (kwargs wie ui.notify, z. B. type="warning"). Im aufgezeichneten Tick wird
+    die Meldung aufgezeichnet und beim Anwenden in jedem Client angezeigt; ohne Client-Kontext entfällt sie.
+    """
+    frame = _frame()
+    if frame is not None:
+        frame.ops.append(("notify", (message,), kwargs))
+        return
+    try:
+        from nicegui import ui
+        ui.notify(message, **kwargs)
+    except Exception:
+        pass
+
+
 def update_plot(
     key: str,
     data: Any,
@@ -123,30 +236,84 @@ def update_plot(
     fallback_to_any: Wenn key nicht gebunden ist, erstes Plotly-Widget in der Registry nutzen (Default True).
     Nur in GUI-Kontext aufrufen (Callbacks, Timer).
     """
-    import os as _os
-    _debug = _os.environ.get("DEBUG_GUI_BINDING", "").strip().lower() in ("1", "true", "yes")
-    path_id = SEMANTIC_BINDING.get(key)
-    _, registry, _ = _client_state_and_registry()
-    if registry is None:
-        if _debug:
-            print("[update_plot] widget_registry ist None (kein GUI-Kontext?)")
-        return
-    if not path_id or path_id not in registry:
-        if path_id and path_id not in registry and _debug:
-            plotly_paths = [pid for pid, w in registry.items() if hasattr(w, "update_figure")]
-            print(f"[update_plot] path_id={path_id!r} nicht in widget_registry. Plotly-Widgets: {plotly_paths}")
-        if not path_id and _debug:
-            print(f"[update_plot] key={key!r} nicht in SEMANTIC_BINDING. Verfügbar: {list(SEMANTIC_BINDING.keys())}")
-        if fallback_to_any:
-            for pid, w in registry.items():
-                if hasattr(w, "update_figure"):
-                    w.update_figure(data, layout=layout, config=config, restyle_only=restyle_only)
-                    if _debug and not path_id:
-                        print(f"[update_plot] Fallback: erstes Plotly-Widget {pid!r} aktualisiert (setze user_id={key!r} für feste Zuordnung)")
-                    return
-        return
-    w = registry[path_id]
-    if hasattr(w, "update_figure"):
-        w.update_figure(data, layout=layout, config=config, restyle_only=restyle_only)
-    elif _debug:
-        print(f"[update_plot] Widget {path_id!r} hat keine update_figure-Methode")
+    with span("gui_binding.update_plot", key=key):
+        frame = _frame()
+        if frame is not None:
+            frame.ops.append((
+                "update_plot",
+                (key, data, layout, config),
+                {"fallback_to_any": fallback_to_any, "restyle_only": restyle_only},
+            ))
+            return
+        import os as _os
+        _debug = _os.environ.get("DEBUG_GUI_BINDING", "").strip().lower() in ("1", "true", "yes")
+        path_id = SEMANTIC_BINDING.get(key)
+        _, registry, _ = _client_state_and_registry()
+        if registry is None:
+            if _debug:
+                print("[update_plot] widget_registry ist None (kein GUI-Kontext?)")
+            return
+        if not path_id or path_id not in registry:
+            if path_id and path_id not in registry and _debug:
+                plotly_paths = [pid for pid, w in registry.items() if hasattr(w, "update_figure")]
+                print(f"[update_plot] path_id={path_id!r} nicht in widget_registry. Plotly-Widgets: {plotly_paths}")
+            if not path_id and _debug:
+                print(f"[update_plot] key={key!r} nicht in SEMANTIC_BINDING. Verfügbar: {list(SEMANTIC_BINDING.keys())}")
+            if fallback_to_any:
+                for pid, w in registry.items():
+                    if hasattr(w, "update_figure"):
+                        w.update_figure(data, layout=layout, config=config, restyle_only=restyle_only)
+                        if _debug and not path_id:
+                            print(f"[update_plot] Fallback: erstes Plotly-Widget {pid!r} aktualisiert (setze user_id={key!r} für feste Zuordnung)")
+                        return
+            return
+        w = registry[path_id]
+        if hasattr(w, "update_figure"):
+            w.update_figure(data, layout=layout, config=config, restyle_only=restyle_only)
+        elif _debug:
+            print(f"[update_plot] Widget {path_id!r} hat keine update_figure-Methode")
+
+
+def append_points(
+    key: str,
+    x_new: Any,
+    y_new: Any,
+    max_points: int = 1000,
+    *,
+    fallback_to_any: bool = True,
+) -> None:
+    """
+    Hängt neue Samples an ein Plotly-Widget an (Streaming), statt jeden Frame das ganze Fenster zu senden.
+    x_new/y_new: Array der neuen Werte (eine Spur) oder Liste von Arrays (eine pro Spur); x_new=None →
+    fortlaufender Sample-Index. Im Browser Plotly.extendTraces, jede Spur behält die letzten max_points
+    (mindestens 1). fallback_to_any: Wie bei update_plot. Nur in GUI-Kontext aufrufen (Callbacks, Timer).
+    """
+    max_points = max(1, int(max_points))
+    with span("gui_binding.append_points", key=key):
+        frame = _frame()
+        if frame is not None:
+            frame.ops.append((
+                "append_points",
+                (key, x_new, y_new, max_points),
+                {"fallback_to_any": fallback_to_any},
+            ))
+            return
+        path_id = SEMANTIC_BINDING.get(key)
+        _, registry, _ = _client_state_and_registry()
+        if registry is None:
+            return
+        w = registry.get(path_id) if path_id else None
+        if w is None and fallback_to_any:
+            w = next((w for w in registry.values() if hasattr(w, "append_points")), None)
+        if w is not None and hasattr(w, "append_points"):
+            w.append_points(x_new, y_new, max_points)
+
+
+# Im Worker-Modus aufzeichenbare Funktionen (Name → Funktion für apply_ops)
+_DEFERRABLE: dict[str, Callable[..., None]] = {
+    "set": set,
+    "clear_markdown": clear_markdown,
+    "update_plot": update_plot,
+    "append_points": append_points,
+    "notify": notify,
+}
@@ -0,0 +1,234 @@
+"""
+Hot-Reload: geänderte Assignment-Module und user_callbacks.py ohne Neustart der NiceGUI-App neu laden.
+
+ui.run(reload=False) bleibt: der uvicorn-Reload würde den ganzen Prozess neu starten (Browser verbindet
+neu, Layout wird neu gebaut). Stattdessen beobachtet watchfiles den Ordner assignments/ und lädt pro
+Änderung nur die betroffenen Module per importlib.reload – auf dem Event-Loop, also nie mitten in einem
+Callback oder Timer-Tick:
+
+- user_callbacks.py: Modul und callback_skeleton (bindet die Callback-Funktionen per Import) neu laden,
+  danach die Callback-Registry aus get_callback_registry() in einem Schritt austauschen (CallbackRegistry.swap).
+- Assignment (user_template.py, …): Modul neu laden, danach den Cache der assignment_registry neu
+  auflösen – der Timer ruft ab dem nächsten Tick das neue timer_tick auf. Worker-Pools des Tick-Executors
+  werden beendet: Prozess-Worker (TIMER_EXECUTOR=process) hätten sonst weiter den alten Modulstand.
+- Fehler beim Laden (Syntaxfehler, Exception auf Modulebene): der vorherige Modulinhalt wird
+  wiederhergestellt und bleibt aktiv; Callback-Registry und Timer bleiben unverändert.
+
+Modul-Globals (z. B. Zähler im Assignment) beginnen nach einem Reload neu. Nicht importierte Assignments
+werden nicht geladen (erst bei Auswahl im Dropdown). Abschalten: HOT_RELOAD=0.
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import os
+import sys
+import time
+import traceback
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from .assignment_registry import get_timer_tick, invalidate_assignment_cache
+from .tick_executor import shutdown_executors
+
+_ASSIGNMENTS_DIR = Path(__file__).resolve().parent.parent / "assignments"
+_CALLBACKS_MODULE = "user_callbacks"
+_SKELETON_MODULE = "callback_skeleton"
+_SKIP_STEMS = frozenset({"__init__"})
+
+# Entprellung der Dateiereignisse (Editoren schreiben beim Speichern oft mehrfach)
+DEFAULT_DEBOUNCE_MS = int(os.environ.get("HOT_RELOAD_DEBOUNCE_MS", "100"))
+
+
+def hot_reload_enabled() -> bool:
+    """HOT_RELOAD=0/false/no schaltet den Watcher ab (Default an)."""
+    return os.environ.get("HOT_RELOAD", "1").strip().lower() not in ("0", "false", "no")
+
+
+class CallbackRegistry(Mapping):
+    """
+    Callback-Registry für den Renderer (path_id → Callback). Der Renderer liest bei jedem Event
+    callbacks.get(path_id); swap() ersetzt die Einträge durch Austausch einer Referenz auf einmal.
+    """
+
+    def __init__(self, callbacks: Mapping[str, Callable]) -> None:
+        self._callbacks: dict[str, Callable] = dict(callbacks)
+        self.version = 0
+
+    def __getitem__(self, key: str) -> Callable:
+        return self._callbacks[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._callbacks.get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._callbacks)
+
+    def __len__(self) -> int:
+        return len(self._callbacks)
+
+    def swap(self, callbacks: Mapping[str, Callable]) -> None:
+        self._callbacks = dict(callbacks)
+        self.version += 1
+
+
+@dataclass
+class ReloadResult:
+    """Ergebnis eines Reloads: geladene und fehlgeschlagene Module, Dauer und Latenz ab Speichern."""
+    reloaded: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)  # Modul → Fehlermeldung (alter Stand bleibt aktiv)
+    callbacks_swapped: bool = False
+    timer_swapped: bool = False
+    reload_ms: float = 0.0  # importlib.reload + Austausch
+    latency_ms: float | None = None  # Speichern der Datei (mtime) → neuer Code aktiv
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def summary(self) -> str:
+        parts = []
+        if self.reloaded:
+            parts.append(f"{', '.join(self.reloaded)} neu geladen in {self.reload_ms:.1f} ms")
+            if self.latency_ms is not None:
+                parts.append(f"seit Speichern {self.latency_ms:.0f} ms")
+        for name, err in self.failed.items():
+            parts.append(f"{name} NICHT geladen (alter Stand bleibt aktiv): {err}")
+        return "; ".join(parts)
+
+
+class HotReloader:
+    """Beobachtet assignments/*.py (watchfiles.awatch) und lädt geänderte Module neu."""
+
+    def __init__(
+        self,
+        app_package: str,
+        callbacks: CallbackRegistry,
+        *,
+        on_result: Callable[[ReloadResult], None] | None = None,
+        debounce_ms: int = DEFAULT_DEBOUNCE_MS,
+    ) -> None:
+        self.app_package = app_package
+        self.callbacks = callbacks
+        self.on_result = on_result
+        self.debounce_ms = debounce_ms
+        self._stop: asyncio.Event | None = None
+        self.stats: dict[str, Any] = {
+            "reloads": 0,
+            "failures": 0,
+            "last_reload_ms": None,
+            "last_latency_ms": None,
+            "last_error": None,
+        }
+
+    async def run(self) -> None:
+        """Watcher-Schleife (als Hintergrund-Task auf dem NiceGUI-Event-Loop starten)."""
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            print("[hot-reload] watchfiles nicht installiert – Hot-Reload aus")
+            return
+        self._stop = asyncio.Event()
+        async for changes in awatch(
+            _ASSIGNMENTS_DIR,
+            watch_filter=lambda _change, path: path.endswith(".py"),
+            debounce=self.debounce_ms,
+            stop_event=self._stop,
+            recursive=False,
+        ):
+            self.handle_changes(path for _, path in changes)
+
+    def stop(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+
+    def handle_changes(self, paths: Iterable[str | os.PathLike]) -> ReloadResult | None:
+        """Geänderte Dateien neu laden; None, wenn keine geladenen Module betroffen sind."""
+        paths = [Path(p) for p in paths]
+        stems = {p.stem for p in paths} - _SKIP_STEMS
+        assignments = sorted(s for s in stems if s != _CALLBACKS_MODULE and self._module_name(s) in sys.modules)
+        callbacks_changed = _CALLBACKS_MODULE in stems and self._module_name(_CALLBACKS_MODULE) in sys.modules
+        if not assignments and not callbacks_changed:
+            return None
+
+        result = ReloadResult()
+        t0 = time.perf_counter()
+        for stem in assignments:
+            if self._reload(self._module_name(stem), result):
+                result.timer_swapped = True
+        if result.timer_swapped:
+            # Timer-Ziel sofort neu binden (nicht erst beim nächsten Tick)
+            invalidate_assignment_cache()
+            get_timer_tick()
+            shutdown_executors()  # nächster Tick startet neue Worker mit dem neuen Modul
+        if callbacks_changed and self._reload(self._module_name(_CALLBACKS_MODULE), result):
+            skeleton_name = f"{self.app_package}._core.{_SKELETON_MODULE}"
+            if self._reload(skeleton_name, result):
+                try:
+                    registry = sys.modules[skeleton_name].get_callback_registry()
+                except Exception as e:
+                    result.failed[_SKELETON_MODULE] = f"{type(e).__name__}: {e}"
+                else:
+                    self.callbacks.swap(registry)
+                    result.callbacks_swapped = True
+        result.reload_ms = (time.perf_counter() - t0) * 1000.0
+        result.latency_ms = _latency_since_saved(paths)
+
+        self.stats["reloads"] += 1
+        self.stats["last_reload_ms"] = result.reload_ms
+        self.stats["last_latency_ms"] = result.latency_ms
+        if result.failed:
+            self.stats["failures"] += 1
+            self.stats["last_error"] = "; ".join(result.failed.values())
+        print(f"[hot-reload] {result.summary()}")
+        if self.on_result is not None:
+            try:
+                self.on_result(result)
+            except Exception:
+                pass
+        return result
+
+    def _module_name(self, stem: str) -> str:
+        return f"{self.app_package}.assignments.{stem}"
+
+    def _reload(self, name: str, result: ReloadResult) -> bool:
+        """importlib.reload; bei Fehler alten Modulinhalt wiederherstellen. True bei Erfolg."""
+        module = sys.modules.get(name)
+        short = name.rsplit(".", 1)[-1]
+        if module is None:
+            return False
+        snapshot = dict(module.__dict__)
+        try:
+            importlib.reload(module)
+        except Exception as e:
+            module.__dict__.clear()
+            module.__dict__.update(snapshot)
+            sys.modules[name] = module
+            result.failed[short] = _format_error(e)
+            return False
+        result.reloaded.append(short)
+        return True
+
+
+def _format_error(e: BaseException) -> str:
+    """Kurzform: Typ, Meldung und Zeile im Assignment (für Konsole und ui.notify)."""
+    if isinstance(e, SyntaxError):
+        return f"SyntaxError: {e.msg} ({Path(e.filename or '').name}, Zeile {e.lineno})"
+    frames = traceback.extract_tb(e.__traceback__)
+    where = next((f for f in reversed(frames) if Path(f.filename).parent == _ASSIGNMENTS_DIR), None)
+    loc = f" ({Path(where.filename).name}, Zeile {where.lineno})" if where else ""
+    return f"{type(e).__name__}: {e}{loc}"
+
+
+def _latency_since_saved(paths: list[Path]) -> float | None:
+    mtimes = []
+    for p in paths:
+        try:
+            mtimes.append(p.stat().st_mtime)
+        except OSError:
+            pass
+    if not mtimes:
+        return None
+    return max(0.0, (time.time() - max(mtimes)) * 1000.0)
@@ -0,0 +1,177 @@
+"""
+Perf-Statistik: Laufzeiten pro benanntem Abschnitt (z. B. domain_logic, plot_update, broadcast) in einem
+NumPy-Ringpuffer fester Größe.
+
+Bisher: Python-Liste mit pop(0) (O(n) pro Messwert) und nur letzter/mittlerer Wert. Hier kostet ein
+Messwert eine Array-Zuweisung (O(1), keine Allokation); Auswertung erst bei summary():
+
+- p50/p95/p99/max und Mittelwert über die letzten capacity Messwerte,
+- jitter_ms: mittlere Änderung zwischen aufeinanderfolgenden Messwerten (|Δ|, wie RFC 3550),
+- overruns: Messwerte über dem Budget des Abschnitts (z. B. Timer-Intervall), seit Start gezählt.
+
+Verwendung:
+
+    with PERF.section("domain_logic"):
+        run_domain_logic()
+    PERF.record("broadcast", elapsed_ms)
+    PERF.summary()  # {"domain_logic": {...}, "broadcast": {...}}
+"""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import numpy as np
+
+import tracing
+
+DEFAULT_CAPACITY = 1024
+
+
+class RingBuffer:
+    """Float-Ringpuffer (NumPy) mit fester Kapazität; append in O(1), values() in Einfügereihenfolge."""
+
+    __slots__ = ("_buf", "_next", "_count")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError("capacity muss ≥ 1 sein")
+        self._buf = np.zeros(capacity, dtype=np.float64)
+        self._next = 0
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buf)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value: float) -> None:
+        self._buf[self._next] = value
+        self._next += 1
+        if self._next == len(self._buf):
+            self._next = 0
+        if self._count < len(self._buf):
+            self._count += 1
+
+    def last(self) -> float:
+        return float(self._buf[self._next - 1]) if self._count else 0.0
+
+    def values(self) -> np.ndarray:
+        """Kopie der gespeicherten Werte, ältester zuerst."""
+        if self._count < len(self._buf):
+            return self._buf[: self._count].copy()
+        return np.concatenate((self._buf[self._next :], self._buf[: self._next]))
+
+    def clear(self) -> None:
+        self._next = 0
+        self._count = 0
+
+
+def summarize(values: np.ndarray) -> dict[str, float]:
+    """avg/p50/p95/p99/max und jitter (mittleres |Δ| aufeinanderfolgender Werte) eines Arrays."""
+    if len(values) == 0:
+        return {"avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0, "jitter_ms": 0.0}
+    p50, p95, p99 = np.percentile(values, (50, 95, 99))
+    return {
+        "avg_ms": float(values.mean()),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "max_ms": float(values.max()),
+        "jitter_ms": float(np.abs(np.diff(values)).mean()) if len(values) > 1 else 0.0,
+    }
+
+
+class SectionStats:
+    """Messwerte (ms) eines Abschnitts: Ringpuffer, Gesamtzahl und Overruns gegenüber budget_ms."""
+
+    __slots__ = ("name", "budget_ms", "buffer", "count", "overruns")
+
+    def __init__(self, name: str, capacity: int = DEFAULT_CAPACITY, budget_ms: float | None = None) -> None:
+        self.name = name
+        self.budget_ms = budget_ms
+        self.buffer = RingBuffer(capacity)
+        self.count = 0
+        self.overruns = 0
+
+    def add(self, ms: float) -> None:
+        self.buffer.append(ms)
+        self.count += 1
+        if self.budget_ms is not None and ms > self.budget_ms:
+            self.overruns += 1
+
+    def summary(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"count": self.count, "last_ms": self.buffer.last()}
+        out.update(summarize(self.buffer.values()))
+        out["overruns"] = self.overruns
+        out["budget_ms"] = self.budget_ms
+        return out
+
+
+class _Section:
+    """Zeitmessung für with PERF.section(name) (Klasse statt @contextmanager: weniger Overhead pro Messung)."""
+
+    __slots__ = ("_stats", "_t0")
+
+    def __init__(self, stats: SectionStats) -> None:
+        self._stats = stats
+        self._t0 = 0
+
+    def __enter__(self) -> None:
+        self._t0 = time.perf_counter_ns()
+
+    def __exit__(self, *exc: Any) -> None:
+        dur_ns = time.perf_counter_ns() - self._t0
+        self._stats.add(dur_ns / 1e6)
+        if tracing.enabled():
+            tracing.add_span(self._stats.name, self._t0, dur_ns)  # Abschnitt auch im Trace (TRACE_SPANS=1)
+
+
+class PerfStats:
+    """Sammlung benannter Abschnitte; section() misst per perf_counter, record() übernimmt fertige Werte."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = capacity
+        self.sections: dict[str, SectionStats] = {}
+
+    def get(self, name: str) -> SectionStats:
+        s = self.sections.get(name)
+        if s is None:
+            s = self.sections[name] = SectionStats(name, self.capacity)
+        return s
+
+    def set_budget(self, name: str, budget_ms: float | None) -> None:
+        """Budget für Overrun-Zählung (z. B. Timer-Intervall in ms für den ganzen Tick)."""
+        self.get(name).budget_ms = budget_ms
+
+    def record(self, name: str, ms: float) -> None:
+        self.get(name).add(ms)
+
+    def section(self, name: str) -> _Section:
+        """Kontextmanager: Laufzeit des with-Blocks in ms unter name erfassen."""
+        return _Section(self.get(name))
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        return {name: s.summary() for name, s in self.sections.items()}
+
+    def drain(self) -> dict[str, list[float]]:
+        """Messwerte seit dem letzten drain() abgeben und leeren (im Worker-Prozess, Rückgabe an den Hauptprozess)."""
+        out = {name: s.buffer.values().tolist() for name, s in self.sections.items() if len(s.buffer)}
+        self.sections.clear()
+        return out
+
+    def merge(self, samples: dict[str, list[float]]) -> None:
+        """Mit drain() abgegebene Messwerte übernehmen (Budgets/Overruns zählen wie bei record())."""
+        for name, values in samples.items():
+            s = self.get(name)
+            for ms in values:
+                s.add(ms)
+
+    def reset(self) -> None:
+        self.sections.clear()
+
+
+# Prozessweite Instanz für App-Framework und Assignments
+PERF = PerfStats()
@@ -0,0 +1,166 @@
+"""
+Profiler: laufende App auf Knopfdruck profilieren, ohne Neustart unter einem Profiler.
+
+capture(seconds) misst für die angegebene Dauer die echten Ticks und Callbacks:
+
+- cProfile auf dem Event-Loop-Thread (Timer, Callbacks, Widget-Updates, Websocket) → sortierter
+  pstats-Bericht (cumulative) und .pstats-Datei (z. B. für snakeviz),
+- Stichproben-Profiler (Hintergrund-Thread, sys._current_frames alle PROFILE_SAMPLE_MS, Default 5 ms) über
+  alle Threads inkl. Worker (TIMER_EXECUTOR=thread) → Collapsed-Stack-Datei für Flamegraphs
+  (flamegraph.pl oder https://www.speedscope.app).
+
+Ausgabe in <App>/profiles/profile_<Zeitstempel>.{txt,pstats,collapsed}. Es läuft höchstens eine Messung
+gleichzeitig. Auslösen über den Button „Profil“ neben DEBUG MODE oder (mit PROFILE_ENDPOINT=1) über die
+Route GET /_profile?seconds=N – beides nur von localhost (is_local_client/is_local_request; Remote-Browser
+sehen den Button nicht).
+"""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_SECONDS = 5.0
+MAX_SECONDS = 120.0
+DEFAULT_SAMPLE_MS = 5.0
+REPORT_LINES = 60
+LOCAL_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+_running = threading.Lock()
+
+
+@dataclass
+class ProfileResult:
+    """Ergebnis einer Messung: Pfade der Dateien und der pstats-Bericht als Text."""
+    seconds: float
+    report: str
+    report_path: Path
+    pstats_path: Path | None
+    collapsed_path: Path
+    samples: int
+
+    def summary(self) -> str:
+        return f"Profil {self.seconds:.1f} s, {self.samples} Stichproben → {self.report_path.parent}"
+
+
+def is_local_request(request: Any) -> bool:
+    """True, wenn die Anfrage (Starlette-Request) von LOCAL_HOSTS kommt."""
+    client = getattr(request, "client", None)
+    return client is not None and client.host in LOCAL_HOSTS
+
+
+def is_local_client(client: Any) -> bool:
+    """Wie is_local_request für einen NiceGUI-Client (Seitenaufruf); ohne Request → False."""
+    try:
+        request = client.request
+    except (AttributeError, RuntimeError):  # NiceGUI: „Request is not set“
+        return False
+    return is_local_request(request)
+
+
+def profile_endpoint_enabled() -> bool:
+    """PROFILE_ENDPOINT=1 aktiviert die HTTP-Route /_profile (nur localhost)."""
+    return os.environ.get("PROFILE_ENDPOINT", "").strip().lower() in ("1", "true", "yes")
+
+
+class StackSampler:
+    """Stichproben aller Thread-Stacks in einem Hintergrund-Thread; Ergebnis als Collapsed Stacks."""
+
+    def __init__(self, interval_sec: float = DEFAULT_SAMPLE_MS / 1000.0) -> None:
+        self.interval = max(0.0005, interval_sec)
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for tid, frame in sys._current_frames().items():
+                if tid == own:
+                    continue
+                parts = []
+                while frame is not None:
+                    code = frame.f_code
+                    parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                parts.append(names.get(tid, str(tid)))
+                self.stacks[";".join(reversed(parts))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """Format „a;b;c Anzahl“ pro Zeile (Wurzel zuerst), wie stackcollapse/flamegraph.pl."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _report(profile: cProfile.Profile, seconds: float, samples: int) -> str:
+    out = io.StringIO()
+    out.write(f"Profil: {seconds:.1f} s Event-Loop (cProfile), {samples} Stichproben aller Threads\n\n")
+    stats = pstats.Stats(profile, stream=out)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(REPORT_LINES)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(REPORT_LINES // 2)
+    return out.getvalue()
+
+
+async def capture(seconds: float = DEFAULT_SECONDS, out_dir: str | os.PathLike = "profiles") -> ProfileResult:
+    """
+    seconds lang profilieren (auf dem Event-Loop aufrufen; die App läuft währenddessen normal weiter).
+    RuntimeError, wenn bereits eine Messung läuft.
+    """
+    if not _running.acquire(blocking=False):
+        raise RuntimeError("Es läuft bereits eine Profil-Messung")
+    try:
+        seconds = min(max(0.1, float(seconds)), MAX_SECONDS)
+        sample_ms = float(os.environ.get("PROFILE_SAMPLE_MS", DEFAULT_SAMPLE_MS))
+        sampler = StackSampler(sample_ms / 1000.0)
+        profile: cProfile.Profile | None = cProfile.Profile()
+        try:
+            profile.enable()  # profiliert diesen Thread = Event-Loop, also alle Tasks während des Wartens
+        except ValueError:
+            profile = None  # anderer Profiler aktiv (z. B. Debugger): nur Stichproben
+        sampler.start()
+        t0 = time.perf_counter()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            if profile is not None:
+                profile.disable()
+            sampler.stop()
+        elapsed = time.perf_counter() - t0
+
+        out = Path(out_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        base = out / time.strftime("profile_%Y%m%d_%H%M%S")
+        pstats_path = None
+        if profile is not None:
+            report = _report(profile, elapsed, sampler.samples)
+            pstats_path = base.with_suffix(".pstats")
+            profile.dump_stats(str(pstats_path))
+        else:
+            report = f"cProfile nicht verfügbar (anderer Profiler aktiv); {sampler.samples} Stichproben\n"
+        report_path = base.with_suffix(".txt")
+        report_path.write_text(report, encoding="utf-8")
+        collapsed_path = base.with_suffix(".collapsed")
+        collapsed_path.write_text(sampler.collapsed(), encoding="utf-8")
+        return ProfileResult(elapsed, report, report_path, pstats_path, collapsed_path, sampler.samples)
+    finally:
+        _running.release()
@@ -0,0 +1,115 @@
+"""
+Tick-Driver: ein prozessweiter Takt für alle Browser-Tabs statt eines Timers pro Client.
+
+Der State ist für alle Clients gemeinsam (_SHARED_STATE_REF in app.py); ein Timer pro Tab hätte bei drei
+offenen Tabs dieselbe Sinus-Spur dreimal berechnet und serialisiert. Der Driver rechnet timer_tick einmal
+pro Periode – aufgezeichnet über gui_binding.run_deferred (inline oder im Worker, siehe tick_executor) –
+und wendet die aufgezeichneten set()/update_plot()-Aufrufe danach in jedem abonnierten Client an
+(Widget-Registry des Clients). Rechenaufwand O(1) in der Anzahl der Zuschauer; Serialisierung und
+Decimation der Plot-Daten laufen ebenfalls einmal pro Broadcast (plotly_graph.shared_serialization),
+pro Client bleibt nur das Aktualisieren der Widgets und das Senden.
+
+Ohne abonnierte Clients wird nicht gerechnet. Clients melden sich in build_root mit subscribe() an; gelöschte
+Clients (Tab geschlossen, Reload) werden beim nächsten Tick entfernt.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+from tracing import span
+from widgets.plotly_graph import shared_serialization
+
+from . import gui_binding
+from .perf_stats import PERF
+from .tick_executor import TickExecutor
+from .tick_scheduler import TickScheduler
+
+_drivers: list = []
+
+
+class TickDriver:
+    """Prozessweiter Tick: einmal rechnen (TickScheduler + TickExecutor), an alle Clients verteilen."""
+
+    def __init__(
+        self,
+        get_tick: Callable[[], Callable[..., Any] | None],
+        get_state: Callable[[], dict[str, Any] | None],
+        scheduler_factory: Callable[..., TickScheduler],
+        *,
+        executor_mode: str | Callable[[], str] = "inline",
+        is_client_alive: Callable[[Any], bool] | None = None,
+    ) -> None:
+        self.get_state = get_state
+        self.is_client_alive = is_client_alive or (lambda _client: True)
+        self._clients: dict[str, Any] = {}
+        self.executor = TickExecutor(executor_mode, snapshot=self._snapshot, apply=self.broadcast)
+        self.scheduler = scheduler_factory(self._get_tick(get_tick))
+        self.stats: dict[str, Any] = {"computed": 0, "broadcasts": 0, "last_broadcast_ms": None}
+        _drivers.append(self)
+
+    # ---- Clients ----
+
+    def subscribe(self, client: Any) -> None:
+        self._clients[client.id] = client
+
+    def unsubscribe(self, client: Any) -> None:
+        self._clients.pop(getattr(client, "id", client), None)
+
+    @property
+    def clients(self) -> list[Any]:
+        """Abonnierte, noch lebende Clients (gelöschte werden dabei entfernt)."""
+        for cid, client in list(self._clients.items()):
+            if not self.is_client_alive(client):
+                del self._clients[cid]
+        return list(self._clients.values())
+
+    # ---- Takt ----
+
+    async def run(self) -> None:
+        await self.scheduler.run()
+
+    def stop(self) -> None:
+        self.scheduler.stop()
+
+    def _get_tick(self, get_tick: Callable[[], Callable[..., Any] | None]) -> Callable[[], Callable[[], None] | None]:
+        submit_for = self.executor.wrap(get_tick)
+
+        def _get() -> Callable[[], None] | None:
+            if not self.clients:
+                return None  # niemand schaut zu: nicht rechnen
+            return submit_for()
+        return _get
+
+    def _snapshot(self) -> tuple[dict[str, Any], dict[str, str]]:
+        self.stats["computed"] += 1
+        return dict(self.get_state() or {}), dict(gui_binding.SEMANTIC_BINDING)
+
+    def broadcast(self, ops: list) -> None:
+        """Aufgezeichnete set()/update_plot() in jedem Client-Kontext ausführen (Event-Loop)."""
+        if not ops:
+            return
+        t0 = time.perf_counter()
+        clients = self.clients
+        with span("tick.broadcast", clients=len(clients)), shared_serialization():
+            for client in clients:
+                try:
+                    with client:
+                        gui_binding.apply_ops(ops)
+                except Exception:
+                    pass
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        self.stats["broadcasts"] += 1
+        self.stats["last_broadcast_ms"] = elapsed_ms
+        PERF.record("broadcast", elapsed_ms)  # Widgets aller Clients aktualisieren inkl. Serialisierung
+
+
+def get_driver_stats() -> dict[str, Any]:
+    """clients (abonniert), computed (Rechnungen), broadcasts, last_broadcast_ms – Summe über alle Driver."""
+    clients = sum(len(d._clients) for d in _drivers)
+    out: dict[str, Any] = {"clients": clients}
+    for key in ("computed", "broadcasts"):
+        out[key] = sum(d.stats[key] for d in _drivers)
+    last = [d.stats["last_broadcast_ms"] for d in _drivers if d.stats["last_broadcast_ms"] is not None]
+    out["last_broadcast_ms"] = max(last) if last else None
+    return out
@@ -0,0 +1,215 @@
+"""
+Tick-Executor: timer_tick im Worker-Thread oder -Prozess statt auf dem NiceGUI-Event-Loop rechnen.
+
+Im Standardmodus (inline) läuft timer_tick auf dem Event-Loop; eine aufwendige FFT oder ein Filter im
+Assignment blockiert dann Websocket, Slider-Events und Rendering für alle Clients. Mit TIMER_EXECUTOR=thread
+bzw. =process (oder TIMER_EXECUTOR = "thread" im Assignment-Modul) gilt pro Tick:
+
+1. Event-Loop: State und SEMANTIC_BINDING des Clients kopieren (gui_binding.snapshot).
+2. Worker: timer_tick über gui_binding.run_deferred ausführen – get() liest die Kopie, set()/update_plot()
+   werden nur aufgezeichnet.
+3. Event-Loop: aufgezeichnete Aufrufe im Client-Kontext ausführen (gui_binding.apply_ops).
+
+Gegendruck: pro TickExecutor höchstens ein Job in Arbeit; Ticks, die währenddessen fällig werden, entfallen
+(busy_skips) statt sich anzustauen.
+
+process: echte Parallelität (kein GIL), aber Modul-Globals des Assignments (Phase, Zähler) leben im
+Worker-Prozess; timer_tick muss auf Modulebene definiert sein (pickle). thread: gleiche Modul-Globals wie
+auf dem Loop; NumPy/SciPy geben das GIL in den Rechenkernen frei.
+
+Im Worker gilt wie auf dem Loop: get_tick_info() liefert die TickInfo des auslösenden Ticks. PERF-Messwerte
+(tick, domain_logic, plot_update) landen im Modus process zunächst im PERF des Worker-Prozesses; sie werden
+mit dem Ergebnis zurückgegeben und im Hauptprozess übernommen (PERF.drain/merge). Auswertungen, die das
+Assignment selbst im Worker ausgibt (get_perf_stats() in timer_tick), sehen dort nur den aktuellen Tick.
+Nach einem Hot-Reload beendet der HotReloader die Pools (shutdown_executors); neue Worker importieren das
+Assignment frisch, sonst liefe im Prozess-Worker weiter der alte Modulstand.
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager
+
+import numpy as np
+
+from . import gui_binding
+from .perf_stats import PERF, RingBuffer, summarize
+from .tick_scheduler import STATS_WINDOW, TickInfo, get_tick_info, set_tick_info
+
+EXECUTOR_MODES = ("inline", "thread", "process")
+
+_pools: dict[str, Executor] = {}
+_executors: weakref.WeakSet = weakref.WeakSet()
+
+
+def _pool(mode: str) -> Executor:
+    """Gemeinsamer Pool pro Modus (lazy); Worker-Anzahl über TIMER_EXECUTOR_WORKERS (Default 2)."""
+    pool = _pools.get(mode)
+    if pool is None:
+        workers = max(1, int(os.environ.get("TIMER_EXECUTOR_WORKERS", "2")))
+        if mode == "process":
+            # spawn wie unter Windows: kein fork des Server-Prozesses mit laufendem Event-Loop und Threads
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="timer-tick")
+        _pools[mode] = pool
+    return pool
+
+
+def shutdown_executors() -> None:
+    """Pools beenden (beim Herunterfahren der App; nach Hot-Reload, der nächste Tick startet neue Worker)."""
+    for pool in _pools.values():
+        pool.shutdown(wait=False, cancel_futures=True)
+    _pools.clear()
+
+
+def executor_mode(module: Any = None) -> str:
+    """TIMER_EXECUTOR (Umgebung) > TIMER_EXECUTOR im Assignment-Modul > inline."""
+    mode = os.environ.get("TIMER_EXECUTOR", "").strip().lower()
+    if not mode and module is not None:
+        mode = str(getattr(module, "TIMER_EXECUTOR", "") or "").strip().lower()
+    return mode if mode in EXECUTOR_MODES else "inline"
+
+
+def _run_job(
+    tick: Callable[[], Any],
+    state: dict[str, Any],
+    binding: dict[str, str],
+    info: TickInfo | None,
+    collect_perf: bool,
+) -> tuple[list, dict[str, list[float]]]:
+    """Im Worker: TickInfo setzen, tick über run_deferred ausführen; im Prozess auch die PERF-Messwerte abgeben."""
+    set_tick_info(info)
+    try:
+        ops = gui_binding.run_deferred(tick, state, binding)
+    finally:
+        set_tick_info(None)
+    return ops, (PERF.drain() if collect_perf else {})
+
+
+class TickExecutor:
+    """Führt timer_tick inline oder im Pool aus (höchstens ein Job in Arbeit) und wendet Ergebnisse im Loop an."""
+
+    def __init__(
+        self,
+        mode: str | Callable[[], str] = "inline",
+        *,
+        context: Callable[[], ContextManager] | None = None,
+        snapshot: Callable[[], tuple[dict[str, Any], dict[str, str]]] | None = None,
+        apply: Callable[[list], None] | None = None,
+    ) -> None:
+        """
+        context: Client-Kontext für apply_ops (ein Client). snapshot/apply ersetzen Kopie und Anwenden,
+        z. B. für den TickDriver (gemeinsamer State, Ergebnis an alle Clients); mit apply wird auch im
+        Modus inline aufgezeichnet statt direkt in die GUI geschrieben.
+        """
+        self._mode = mode
+        self.context = context or nullcontext
+        self.snapshot = snapshot or gui_binding.snapshot
+        self._apply_ops = apply
+        self._in_flight: asyncio.Future | None = None
+        self.stats: dict[str, Any] = {
+            "submitted": 0,
+            "completed": 0,
+            "busy_skips": 0,
+            "failed": 0,
+            "overruns": 0,
+            "last_compute_ms": None,
+            "last_apply_ms": None,
+            "last_error": None,
+        }
+        self.compute_ms = RingBuffer(STATS_WINDOW)  # Einreichen bis Ergebnis (Worker-Modi)
+        _executors.add(self)
+
+    @property
+    def mode(self) -> str:
+        return self._mode() if callable(self._mode) else self._mode
+
+    @property
+    def busy(self) -> bool:
+        return self._in_flight is not None and not self._in_flight.done()
+
+    def wrap(self, get_tick: Callable[[], Callable[..., Any] | None]) -> Callable[[], Callable[[], None] | None]:
+        """Aus get_tick (z. B. get_timer_tick) ein get_tick für den TickScheduler machen."""
+        def _get() -> Callable[[], None] | None:
+            tick = get_tick()
+            if tick is None:
+                return None
+            return lambda: self.submit(tick)
+        return _get
+
+    def submit(self, tick: Callable[[], Any]) -> None:
+        """Im Client-Kontext aufrufen (Scheduler); inline sofort, sonst Job starten oder Tick verwerfen."""
+        mode = self.mode
+        if mode == "inline":
+            if self._apply_ops is None:
+                tick()
+            else:
+                state, binding = self.snapshot()
+                self._apply_ops(gui_binding.run_deferred(tick, state, binding))
+            return
+        if self.busy:
+            self.stats["busy_skips"] += 1
+            return
+        state, binding = self.snapshot()
+        loop = asyncio.get_running_loop()
+        info = get_tick_info()
+        t0 = time.perf_counter()
+        self.stats["submitted"] += 1
+        future = loop.run_in_executor(_pool(mode), _run_job, tick, state, binding, info, mode == "process")
+        future.add_done_callback(lambda f: self._apply(f, t0, info))
+        self._in_flight = future
+
+    def _apply(self, future: asyncio.Future, t0: float, info: TickInfo | None) -> None:
+        """Done-Callback auf dem Event-Loop: aufgezeichnete set()/update_plot() im Client-Kontext ausführen."""
+        compute_ms = (time.perf_counter() - t0) * 1000.0
+        self.stats["last_compute_ms"] = compute_ms
+        self.compute_ms.append(compute_ms)
+        if info is not None and compute_ms > info.interval_sec * 1000.0:
+            self.stats["overruns"] += 1  # Ergebnis erst nach der nächsten Frist (Scheduler sieht nur submit)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.stats["failed"] += 1
+            self.stats["last_error"] = f"{type(error).__name__}: {error}"
+            return
+        ops, samples = future.result()
+        PERF.merge(samples)
+        t1 = time.perf_counter()
+        try:
+            if self._apply_ops is not None:
+                self._apply_ops(ops)
+            else:
+                with self.context():
+                    gui_binding.apply_ops(ops)
+        except Exception as e:
+            self.stats["failed"] += 1
+            self.stats["last_error"] = f"{type(e).__name__}: {e}"
+            return
+        self.stats["completed"] += 1
+        self.stats["last_apply_ms"] = (time.perf_counter() - t1) * 1000.0
+
+
+def get_executor_stats() -> dict[str, Any]:
+    """
+    Summen über alle TickExecutor: exec_submitted, exec_completed, exec_busy_skips, exec_failed, exec_overruns
+    (Job länger als das Tick-Intervall), exec_compute_ms (letzter Job), exec_compute_p95_ms, exec_last_error.
+    """
+    executors = list(_executors)
+    out: dict[str, Any] = {
+        f"exec_{key}": sum(e.stats[key] for e in executors)
+        for key in ("submitted", "completed", "busy_skips", "failed", "overruns")
+    }
+    computes = [e.stats["last_compute_ms"] for e in executors if e.stats["last_compute_ms"] is not None]
+    out["exec_compute_ms"] = max(computes) if computes else None
+    samples = [e.compute_ms.values() for e in executors if len(e.compute_ms)]
+    out["exec_compute_p95_ms"] = summarize(np.concatenate(samples))["p95_ms"] if samples else None
+    out["exec_last_error"] = next((e.stats["last_error"] for e in executors if e.stats["last_error"]), None)
+    out["exec_mode"] = executors[0].mode if executors else "inline"
+    return out
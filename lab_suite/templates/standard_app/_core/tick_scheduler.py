@@ -0,0 +1,237 @@
+"""
+Tick-Scheduler: ruft timer_tick mit fester Frist (Deadline) pro Periode auf – Ersatz für ui.timer.
+
+ui.timer wartet nach jedem Aufruf einfach das Intervall ab; dauert ein Tick länger, verschiebt sich der
+Takt (Drift) und die Auswertung kennt nur Mittelwerte. Der Scheduler plant dagegen auf einem festen Raster
+t0 + k·Intervall:
+
+- Drift-Kompensation: die nächste Frist ergibt sich aus dem Raster, nicht aus „Ende + Intervall“.
+- Overrun: ein Tick, der über die nächste Frist hinaus läuft, wird gezählt (overruns).
+- Verspätete Ticks werden nicht nachgeholt: verpasste Fristen zählen als skipped; mit late_policy="merge"
+  (Default) läuft sofort ein Tick für alle verpassten Perioden, mit "skip" erst zur nächsten Rasterfrist.
+  get_tick_info().missed sagt dem Assignment, wie viele Perioden ein Tick abdeckt (z. B. Phase weiterdrehen).
+- Adaptive Rate (optional, TIMER_ADAPTIVE=1): bei anhaltender Überlast (mehr als die Hälfte der letzten
+  Ticks mit Overrun) wird das Intervall schrittweise bis TIMER_MAX_INTERVAL_SEC vergrößert, bei Entlastung
+  wieder bis zum Basisintervall verkleinert.
+
+get_tick_stats() liefert Zähler und Perzentile der Verspätung (Start nach Frist) und der Tick-Dauer über
+alle laufenden Scheduler; das Assignment übernimmt sie in get_perf_stats(). Exceptions aus timer_tick
+werden gezählt (failed, last_error) und bei neuer Meldung einmal ausgegeben.
+
+Mit TIMER_EXECUTOR=thread/process ruft der Scheduler nur TickExecutor.submit auf: Tick-Dauer und Overruns
+messen dann das Einreichen, nicht die Rechnung. Die Rechenzeit bis zum Ergebnis und Jobs, die länger als
+das Intervall brauchen, zählt der Tick-Executor (exec_compute_p95_ms, exec_overruns); Ticks, die wegen
+eines laufenden Jobs entfallen, stehen in exec_busy_skips. Auch die adaptive Rate sieht diese Überlast nicht.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager
+
+import numpy as np
+
+from tracing import span
+
+from .perf_stats import RingBuffer, summarize
+
+# Fenster für Perzentile und Überlast-Erkennung (Anzahl Ticks)
+STATS_WINDOW = 1000
+ADAPT_WINDOW = 20
+ADAPT_FACTOR = 1.25
+
+_schedulers: list[TickScheduler] = []
+_current = threading.local()  # TickInfo des gerade laufenden Ticks (pro Thread: Event-Loop bzw. Worker)
+
+
+@dataclass
+class TickInfo:
+    """Angaben zum laufenden Tick (für das Assignment über get_tick_info())."""
+    index: int  # Rasterindex k der Frist t0 + k·Intervall
+    deadline: float  # Frist (time.monotonic)
+    lateness_ms: float  # Start des Ticks nach der Frist
+    missed: int  # übersprungene Perioden vor diesem Tick (0 = pünktlich)
+    interval_sec: float  # aktuelles Intervall (bei adaptiver Rate ggf. größer als das Basisintervall)
+
+
+class TickScheduler:
+    """
+    Fristgesteuerter Tick-Takt auf dem asyncio-Event-Loop (run() als Hintergrund-Task starten).
+    get_tick: liefert pro Tick die aufzurufende Funktion (z. B. assignment_registry.get_timer_tick).
+    context: Kontextmanager pro Tick (NiceGUI-Client, damit gui_binding den Client findet).
+    is_alive: endet die Schleife, sobald False (z. B. Client gelöscht); stop() beendet sie explizit.
+    """
+
+    def __init__(
+        self,
+        get_tick: Callable[[], Callable[..., Any] | None],
+        interval_sec: float,
+        *,
+        late_policy: str = "merge",
+        adaptive: bool = False,
+        max_interval_sec: float | None = None,
+        context: Callable[[], ContextManager] | None = None,
+        is_alive: Callable[[], bool] | None = None,
+    ) -> None:
+        if interval_sec <= 0:
+            raise ValueError("interval_sec muss > 0 sein")
+        if late_policy not in ("merge", "skip"):
+            raise ValueError("late_policy muss 'merge' oder 'skip' sein")
+        self.get_tick = get_tick
+        self.base_interval = interval_sec
+        self.interval = interval_sec
+        self.late_policy = late_policy
+        self.adaptive = adaptive
+        self.max_interval = max(interval_sec, max_interval_sec or 4 * interval_sec)
+        self.context = context or nullcontext
+        self.is_alive = is_alive or (lambda: True)
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.rate_changes = 0
+        self.failed = 0
+        self.last_error: str | None = None
+        self.lateness_ms = RingBuffer(STATS_WINDOW)
+        self.duration_ms = RingBuffer(STATS_WINDOW)
+        self._recent_overrun: deque[bool] = deque(maxlen=ADAPT_WINDOW)
+        self._running = False
+
+    async def run(self) -> None:
+        self._running = True
+        _schedulers.append(self)
+        try:
+            t0 = time.monotonic()
+            k = 0
+            missed = 0
+            while self._running:
+                deadline = t0 + k * self.interval
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    await asyncio.sleep(0)  # Event-Loop nie blockieren (Websocket, Slider)
+                if not self._running or not self.is_alive():
+                    break
+                start = time.monotonic()
+                info = TickInfo(k, deadline, (start - deadline) * 1000.0, missed, self.interval)
+                self._run_tick(info)
+                end = time.monotonic()
+                self.duration_ms.append((end - start) * 1000.0)
+                self.lateness_ms.append(info.lateness_ms)
+                self.ticks += 1
+
+                # Nächste Frist auf dem Raster; verpasste Fristen überspringen statt nachholen
+                next_k = k + 1
+                late_k = math.floor((end - t0) / self.interval)  # letzte bereits verstrichene Frist
+                overrun = late_k >= next_k
+                self._recent_overrun.append(overrun)
+                if overrun:
+                    self.overruns += 1
+                    missed = late_k - next_k + (1 if self.late_policy == "skip" else 0)
+                    next_k = late_k if self.late_policy == "merge" else late_k + 1
+                    self.skipped += missed
+                else:
+                    missed = 0
+                k = next_k
+                if self.adaptive and self._adapt_rate():
+                    # Raster mit neuem Intervall an der aktuellen Frist neu verankern
+                    t0, k = t0 + k * info.interval_sec, 0
+        finally:
+            self._running = False
+            if self in _schedulers:
+                _schedulers.remove(self)
+
+    def stop(self) -> None:
+        self._running = False
+
+    def _run_tick(self, info: TickInfo) -> None:
+        tick = self.get_tick()
+        if tick is None:
+            return
+        set_tick_info(info)
+        try:
+            with span("timer_tick", index=info.index, missed=info.missed), self.context():
+                tick()
+        except Exception as e:
+            self.failed += 1
+            error = f"{type(e).__name__}: {e}"
+            if error != self.last_error:
+                print(f"[tick] timer_tick fehlgeschlagen: {error}")  # gleiche Meldung nicht jede Periode
+            self.last_error = error
+        finally:
+            set_tick_info(None)
+
+    def _adapt_rate(self) -> bool:
+        """Intervall bei anhaltender Überlast vergrößern, bei Entlastung verkleinern. True bei Änderung."""
+        if len(self._recent_overrun) < ADAPT_WINDOW:
+            return False
+        load = sum(self._recent_overrun) / len(self._recent_overrun)
+        new = self.interval
+        if load > 0.5:
+            new = min(self.max_interval, self.interval * ADAPT_FACTOR)
+        elif load == 0 and self.interval > self.base_interval:
+            recent = self.duration_ms.values()[-ADAPT_WINDOW:]
+            # nur verkleinern, wenn die Ticks auch ins kleinere Intervall passen würden
+            if recent.max() < 0.5 * self.interval / ADAPT_FACTOR * 1000.0:
+                new = max(self.base_interval, self.interval / ADAPT_FACTOR)
+        if new == self.interval:
+            return False
+        self.interval = new
+        self.rate_changes += 1
+        self._recent_overrun.clear()
+        return True
+
+
+def get_tick_info() -> TickInfo | None:
+    """Angaben zum gerade laufenden Tick (nur innerhalb von timer_tick gesetzt, sonst None)."""
+    return getattr(_current, "info", None)
+
+
+def set_tick_info(info: TickInfo | None) -> None:
+    """TickInfo für den aktuellen Thread setzen (Scheduler; Tick-Executor im Worker-Thread/-Prozess)."""
+    _current.info = info
+
+
+def get_tick_stats() -> dict[str, Any]:
+    """
+    Zähler und Perzentile aller laufenden Scheduler: ticks, overruns, skipped, overrun_pct,
+    lateness_p50/p95/p99/max_ms, lateness_jitter_ms, tick_p95_ms, interval_ms (aktuell), base_interval_ms,
+    rate_changes, failed (Exceptions in timer_tick), last_error.
+    """
+    lateness = summarize(np.concatenate([s.lateness_ms.values() for s in _schedulers] or [np.zeros(0)]))
+    durations = summarize(np.concatenate([s.duration_ms.values() for s in _schedulers] or [np.zeros(0)]))
+    ticks = sum(s.ticks for s in _schedulers)
+    overruns = sum(s.overruns for s in _schedulers)
+    return {
+        "ticks": ticks,
+        "overruns": overruns,
+        "skipped": sum(s.skipped for s in _schedulers),
+        "overrun_pct": 100.0 * overruns / ticks if ticks else 0.0,
+        "lateness_p50_ms": lateness["p50_ms"],
+        "lateness_p95_ms": lateness["p95_ms"],
+        "lateness_p99_ms": lateness["p99_ms"],
+        "lateness_max_ms": lateness["max_ms"],
+        "lateness_jitter_ms": lateness["jitter_ms"],
+        "tick_p95_ms": durations["p95_ms"],
+        "interval_ms": max((s.interval for s in _schedulers), default=0.0) * 1000.0,
+        "base_interval_ms": max((s.base_interval for s in _schedulers), default=0.0) * 1000.0,
+        "rate_changes": sum(s.rate_changes for s in _schedulers),
+        "failed": sum(s.failed for s in _schedulers),
+        "last_error": next((s.last_error for s in reversed(_schedulers) if s.last_error), None),
+    }
+
+
+def scheduler_from_env(get_tick: Callable[[], Callable[..., Any] | None], interval_sec: float, **kwargs) -> TickScheduler:
+    """Scheduler mit Einstellungen aus der Umgebung: TIMER_ADAPTIVE, TIMER_MAX_INTERVAL_SEC, TIMER_LATE_POLICY."""
+    adaptive = os.environ.get("TIMER_ADAPTIVE", "").strip().lower() in ("1", "true", "yes")
+    max_interval = os.environ.get("TIMER_MAX_INTERVAL_SEC", "").strip()
+    kwargs.setdefault("adaptive", adaptive)
+    kwargs.setdefault("max_interval_sec", float(max_interval) if max_interval else None)
+    kwargs.setdefault("late_policy", os.environ.get("TIMER_LATE_POLICY", "merge").strip().lower() or "merge")
+    return TickScheduler(get_tick, interval_sec, **kwargs)
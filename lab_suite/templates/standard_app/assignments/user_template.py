@@ -11,14 +11,20 @@ Stand get() / set() / update_plot():
 - set(key, value): Schreibt in State und aktualisiert Output-Widgets (LED: set_state,
   VU-Meter: set_value), sofern die path_id in der Widget-Registry steht.
 - update_plot(key, data, layout=None): Aktualisiert ein Plotly-Widget (user_id = key).
-- Voraussetzung: Aufruf im GUI-Kontext (z. B. aus user_callbacks.py oder aus einem
-  ui.timer), damit ui.context.client.state und widget_registry verfügbar sind.
+- append_points(key, x_new, y_new, max_points): Streaming – nur neue Samples senden, der Browser
+  hält die letzten max_points pro Spur (Plotly.extendTraces).
+- Voraussetzung: Aufruf im GUI-Kontext (z. B. aus user_callbacks.py), damit ui.context.client.state
+  und widget_registry verfügbar sind – oder in timer_tick (siehe Timer).
 - Wenn SEMANTIC_BINDING korrekt befüllt ist (user_id pro Widget gesetzt), reicht
   get("power"), set("led_status", "on"), update_plot("sine_plot", data) etc.
 
-Timer: Die App startet einen Timer (einstellbare Rate, z. B. 10 Hz) und ruft
+Timer: Die App startet einen Takt (einstellbare Rate, z. B. 10 Hz) und ruft
 timer_tick() in diesem Modul auf, falls vorhanden. So können Plots/Logik periodisch
-laufen, unabhängig von Button-Callbacks.
+laufen, unabhängig von Button-Callbacks. timer_tick läuft einmal für alle Browser-Tabs und ohne
+Client-Kontext (Tick-Driver, ggf. im Worker, siehe TIMER_EXECUTOR): get() liest eine State-Kopie,
+set()/clear_markdown()/update_plot()/append_points()/notify() aus gui_binding werden aufgezeichnet und
+danach in jedem Tab ausgeführt. ui.notify, ui.context.client & Co. stehen dort nicht zur Verfügung –
+stattdessen gui_binding.notify() verwenden.
 
 Performance: ENABLE_PERF_STATS=True oder DEBUG_PERF=1 aktiviert Laufzeit-Messung
 (perf_counter) und optional Prozess-CPU (psutil). Budget = Timer-Intervall;
@@ -28,11 +34,19 @@ from __future__ import annotations
 
 import math
 import os
-import random
-import time
+
+import numpy as np
 
 # Zugriff auf die GUI über fachliche Größen (User-IDs aus dem Layout)
 from .._core import gui_binding
+# Laufzeiten pro Abschnitt (NumPy-Ringpuffer: p50/p95/p99/max, Jitter, Overruns)
+from .._core.perf_stats import PERF
+# Fristen/Overruns des App-Timers (Tick-Scheduler)
+from .._core.tick_driver import get_driver_stats
+from .._core.tick_executor import get_executor_stats
+from .._core.tick_scheduler import get_tick_info, get_tick_stats
+# Zeichen-Quittungen der Plots (verworfene Frames, Latenz bis gezeichnet)
+from widgets.plotly_graph import get_draw_stats
 
 # Demo: Phasenverschiebung für animierten Sinus (wird in timer_tick erhöht)
 _sine_phase = 0.0
@@ -43,9 +57,9 @@ _DEBUG_PLOT_FIRST_RUN = False
 # Performance: Laufzeiten (ms) und optional Prozess-CPU; Auswertung alle REPORT_EVERY_TICKS
 ENABLE_PERF_STATS = os.environ.get("DEBUG_PERF", "").strip() in ("1", "true", "yes")
 ENABLE_PERF_STATS = True
-PERF_HISTORY_SIZE = 100
 REPORT_EVERY_TICKS = 50
-_perf_tick_durations_ms: list[float] = []
+# Abschnitte in PERF: tick (ganzer timer_tick), domain_logic, plot_update (Daten + update_plot);
+# broadcast (Widgets aller Clients inkl. Serialisierung) misst der Tick-Driver
 _perf_tick_count = 0
 _perf_process: object | None = None
 try:
@@ -57,6 +71,10 @@ except ImportError:
     print("psutil not found")
     _perf_process = None
 
+# Ausführung von timer_tick: "inline" (Event-Loop), "thread" oder "process" (Worker-Pool; get/set/update_plot
+# laufen dann über eine State-Kopie, siehe _core/tick_executor.py). Umgebungsvariable TIMER_EXECUTOR hat Vorrang.
+TIMER_EXECUTOR = "inline"
+
 # Scattergl (WebGL): flüssigere Animation, bessere Performance bei vielen Punkten (PLOT_SCATTERGL=1)
 USE_SCATTERGL = True #os.environ.get("PLOT_SCATTERGL", "").strip().lower() in ("1", "true", "yes")
 
@@ -64,8 +82,8 @@ USE_SCATTERGL = True #os.environ.get("PLOT_SCATTERGL", "").strip().lower() in ("
 def run_domain_logic() -> None:
     """
     Beispiel: Parameter aus der GUI lesen, Fachlogik ausführen, Ergebnis in die GUI schreiben.
-    Rufen Sie diese Funktion z. B. aus einem Callback in user_callbacks.py oder aus einem
-    ui.timer auf, damit get/set im GUI-Kontext laufen.
+    Rufen Sie diese Funktion z. B. aus einem Callback in user_callbacks.py oder aus timer_tick auf
+    (dort werden get/set über den aufgezeichneten Tick abgewickelt).
     """
     power_on = gui_binding.get("Power-switch", False)
     gain = gui_binding.get("gain")
@@ -83,10 +101,21 @@ def get_perf_stats(timer_interval_sec: float = 0.1) -> dict:
     """
     Liefert die letzten Performance-Kennzahlen (Laufzeit pro Tick, Headroom für DSP).
     timer_interval_sec: Timer-Intervall (z. B. aus TIMER_INTERVAL_SEC, Default 0.1).
-    Returns: dict mit last_ms, avg_ms, budget_ms, headroom_ms, headroom_pct, cpu_pct (falls psutil).
+    Returns: dict mit last_ms, avg_ms, budget_ms, headroom_ms, headroom_pct, cpu_pct (falls psutil),
+    p50_ms, p95_ms, p99_ms, max_ms, jitter_ms, budget_overruns (ganzer Tick), sections (pro Abschnitt
+    count, last/avg/p50/p95/p99/max/jitter_ms, overruns),
+    dazu aus dem Tick-Scheduler: ticks, overruns, skipped, overrun_pct, lateness_p50/p95/p99/max_ms,
+    tick_p95_ms, interval_ms, base_interval_ms, rate_changes, failed, last_error; aus dem Tick-Executor
+    exec_mode, exec_submitted, exec_completed, exec_busy_skips, exec_failed, exec_overruns, exec_compute_ms,
+    exec_compute_p95_ms, exec_last_error (Worker-Modi: Rechenzeit bis zum Ergebnis); aus dem Tick-Driver
+    clients, computed, broadcasts, last_broadcast_ms; aus PlotlyGraph plot_frames_sent/acked/dropped,
+    plot_latency_p50/p95/max_ms, plot_draw_ms.
     """
     budget_ms = timer_interval_sec * 1000.0
-    if not _perf_tick_durations_ms:
+    PERF.set_budget("tick", budget_ms)
+    sections = PERF.summary()
+    tick = sections.get("tick")
+    if tick is None or not tick["count"]:
         return {
             "last_ms": 0.0,
             "avg_ms": 0.0,
@@ -94,9 +123,19 @@ def get_perf_stats(timer_interval_sec: float = 0.1) -> dict:
             "headroom_ms": budget_ms,
             "headroom_pct": 100.0,
             "cpu_pct": None,
+            "p50_ms": 0.0,
+            "p95_ms": 0.0,
+            "p99_ms": 0.0,
+            "max_ms": 0.0,
+            "jitter_ms": 0.0,
+            "budget_overruns": 0,
+            "sections": sections,
+            **get_tick_stats(),
+            **get_executor_stats(),
+            **get_driver_stats(),
+            **get_draw_stats(),
         }
-    last_ms = _perf_tick_durations_ms[-1]
-    avg_ms = sum(_perf_tick_durations_ms) / len(_perf_tick_durations_ms)
+    avg_ms = tick["avg_ms"]
     headroom_ms = max(0.0, budget_ms - avg_ms)
     headroom_pct = (headroom_ms / budget_ms * 100.0) if budget_ms > 0 else 100.0
     cpu_pct = None
@@ -106,21 +145,35 @@ def get_perf_stats(timer_interval_sec: float = 0.1) -> dict:
         except Exception:
             pass
     return {
-        "last_ms": last_ms,
+        "last_ms": tick["last_ms"],
         "avg_ms": avg_ms,
         "budget_ms": budget_ms,
         "headroom_ms": headroom_ms,
         "headroom_pct": headroom_pct,
         "cpu_pct": cpu_pct,
+        "p50_ms": tick["p50_ms"],
+        "p95_ms": tick["p95_ms"],
+        "p99_ms": tick["p99_ms"],
+        "max_ms": tick["max_ms"],
+        "jitter_ms": tick["jitter_ms"],
+        "budget_overruns": tick["overruns"],
+        "sections": sections,
+        **get_tick_stats(),
+        **get_executor_stats(),
+        **get_driver_stats(),
+        **get_draw_stats(),
     }
 
 
 def debug_plot_binding() -> None:
     """
-    Einmal aufrufen (z. B. aus timer_tick oder einem Button), um zu prüfen,
+    Einmal aufrufen (z. B. aus einem Button-Callback), um zu prüfen,
     ob „sine_plot“ gebunden ist und welche Plotly-Widgets in der Registry stehen.
-    Ausgabe in der Konsole (Server/Terminal).
+    Ausgabe in der Konsole (Server/Terminal). Braucht den Client-Kontext; in timer_tick
+    (_DEBUG_PLOT_FIRST_RUN) gibt es nur eine Warnung.
     """
+    if not gui_binding.gui_context_available("debug_plot_binding"):
+        return
     try:
         from nicegui import ui
         reg = getattr(ui.context.client, "widget_registry", None) or {}
@@ -140,6 +193,10 @@ _SINE_LAYOUT = {
     "xaxis": {"title": {"text": "x"}, "range": [0, 4 * math.pi], "autorange": False},
     "yaxis": {"title": {"text": "y"}, "range": [-1.5, 1.5], "autorange": False},
 }
+# Festes x-Raster: einmal berechnen; PlotlyGraph sendet unverändertes x nur als Cache-Verweis.
+# NumPy-Arrays gehen als binäre Typed Arrays an den Browser (Listen würden als Dezimaltext serialisiert).
+_SINE_N = 2000
+_SINE_X = np.linspace(0.0, 4 * math.pi, _SINE_N)
 
 
 def _update_sine_demo() -> None:
@@ -149,11 +206,10 @@ def _update_sine_demo() -> None:
     Layout wird immer mitgegeben, damit der Client die Achsen per relayout fix halten kann.
     """
     global _sine_layout_sent
-    n = 2000
-    x = [4 * math.pi * i / (n - 1) for i in range(n)]
+    x = _SINE_X
     # Sinus + AWGN, damit man Updates (z. B. mit scattergl) besser erkennt
     noise_sigma = 0.12
-    y = [math.sin(xi + _sine_phase) + random.gauss(0, noise_sigma) for xi in x]
+    y = np.sin(x + _sine_phase) + np.random.normal(0.0, noise_sigma, _SINE_N)
     trace = {"x": x, "y": y, "mode": "lines", "name": "sin(x)+noise"}
     if USE_SCATTERGL:
         trace["type"] = "scattergl"
@@ -167,41 +223,56 @@ def _update_sine_demo() -> None:
 
 def timer_tick(timer_interval_sec: float | None = None) -> None:
     """
-    Wird periodisch vom App-Timer aufgerufen (einstellbare Rate, z. B. 10 Hz).
+    Wird periodisch vom App-Takt aufgerufen (einstellbare Rate, z. B. 10 Hz) – einmal für alle Tabs und
+    ohne Client-Kontext: nur über gui_binding auf die GUI zugreifen (siehe Modul-Docstring).
     Hier: Domain-Logik ausführen und Sinus-Demo-Plot aktualisieren (animierte Phase).
     timer_interval_sec: Für Performance-Budget; wenn None, wird TIMER_INTERVAL_SEC aus der Umgebung gelesen (Default 0.1).
     """
-    global _sine_phase, _DEBUG_PLOT_FIRST_RUN, _perf_tick_durations_ms, _perf_tick_count
+    global _sine_phase, _DEBUG_PLOT_FIRST_RUN, _perf_tick_count
     interval = timer_interval_sec
+    info = get_tick_info()
+    if interval is None and info is not None:
+        interval = info.interval_sec  # aktuelles Intervall des Schedulers (adaptive Rate)
     if interval is None:
         interval = float(os.environ.get("TIMER_INTERVAL_SEC", "0.1"))
     if _DEBUG_PLOT_FIRST_RUN:
         _DEBUG_PLOT_FIRST_RUN = False
         debug_plot_binding()
-    t0 = time.perf_counter()
-    run_domain_logic()
-    _sine_phase += 0.00  # leichte Animation
-    _update_sine_demo()
-    if ENABLE_PERF_STATS:
-        elapsed_ms = (time.perf_counter() - t0) * 1000.0
-        _perf_tick_durations_ms.append(elapsed_ms)
-        if len(_perf_tick_durations_ms) > PERF_HISTORY_SIZE:
-            _perf_tick_durations_ms.pop(0)
-        _perf_tick_count += 1
-        if _perf_tick_count % REPORT_EVERY_TICKS == 0:
-            s = get_perf_stats(interval)
-            msg = (
-                f"Tick: last={s['last_ms']:.2f} ms, avg={s['avg_ms']:.2f} ms, "
-                f"budget={s['budget_ms']:.0f} ms, headroom={s['headroom_pct']:.0f}%"
-            )
-            if s.get("cpu_pct") is not None:
-                msg += f", CPU={s['cpu_pct']:.1f}%"
-            print(f"[perf] {msg}")
-            # Optional: in GUI anzeigen, wenn ein Label mit user_id "perf_status" existiert
-            try:
-                gui_binding.set("perf_status", msg)
-            except Exception:
-                pass
+    _sine_phase += 0.00
+    if not ENABLE_PERF_STATS:
+        run_domain_logic()
+        _update_sine_demo()
+        return
+    with PERF.section("tick"):
+        with PERF.section("domain_logic"):
+            run_domain_logic()
+        with PERF.section("plot_update"):
+            _update_sine_demo()
+    _perf_tick_count += 1
+    if _perf_tick_count % REPORT_EVERY_TICKS == 0:
+        s = get_perf_stats(interval)
+        msg = (
+            f"Tick: last={s['last_ms']:.2f} ms, avg={s['avg_ms']:.2f} ms, p95={s['p95_ms']:.2f} ms, "
+            f"max={s['max_ms']:.2f} ms, jitter={s['jitter_ms']:.2f} ms, "
+            f"budget={s['budget_ms']:.0f} ms, headroom={s['headroom_pct']:.0f}%"
+        )
+        if s["ticks"]:
+            msg += f", overruns={s['overruns']} ({s['overrun_pct']:.0f}%), late p95={s['lateness_p95_ms']:.1f} ms"
+        if s.get("cpu_pct") is not None:
+            msg += f", CPU={s['cpu_pct']:.1f}%"
+        if s["plot_latency_p95_ms"] is not None:
+            msg += f", plot p95={s['plot_latency_p95_ms']:.1f} ms, dropped={s['plot_frames_dropped']}"
+        print(f"[perf] {msg}")
+        sections = ", ".join(
+            f"{name} p95={sec['p95_ms']:.2f} ms" for name, sec in s["sections"].items() if name != "tick"
+        )
+        if sections:
+            print(f"[perf] {sections}")
+        # Optional: in GUI anzeigen, wenn ein Label mit user_id "perf_status" existiert
+        try:
+            gui_binding.set("perf_status", msg)
+        except Exception:
+            pass
 
 
 def solve_task() -> None:
@@ -0,0 +1,7 @@
+"""pytest: lab_suite in sys.path, damit die gemeinsamen Pakete (coding, widgets, …) importierbar sind."""
+import sys
+from pathlib import Path
+
+_LAB_SUITE_ROOT = Path(__file__).resolve().parent.parent
+if str(_LAB_SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_LAB_SUITE_ROOT))
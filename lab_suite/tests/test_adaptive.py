@@ -0,0 +1,116 @@
+"""Tests für coding.adaptive: Geschwister-Eigenschaft nach jedem update() und Round-Trips (FGK, Vitter)."""
+import random
+
+import pytest
+
+from coding import adaptive, build_huffman_tree
+from coding.adaptive import NYT, ROOT, new_model
+
+
+def _check_tree(model) -> None:
+    """Geschwister-Eigenschaft und Konsistenz der Knotenlisten (nur belegte Positionen nyt…ROOT)."""
+    w, parent, left, symbol = model.weight, model.parent, model.left, model.symbol
+    assert symbol[model.nyt] == NYT and w[model.nyt] == 0
+    assert model.position[NYT] == model.nyt
+    for q in range(model.nyt, ROOT + 1):
+        # Gewichte steigen mit der Nummerierung, Geschwister liegen auf (2j, 2j+1)
+        if q < ROOT:
+            assert w[q] <= w[q + 1], f"Gewicht fällt bei Position {q}"
+            assert parent[q] > q
+            assert parent[q] == parent[q ^ 1], f"Position {q} und {q ^ 1} sind keine Geschwister"
+        if symbol[q] >= 0:
+            assert model.position[symbol[q]] == q
+        else:
+            c = left[q]
+            assert c % 2 == 0 and parent[c] == q
+            assert w[q] == w[c] + w[c + 1]
+    if model.algorithm == "vitter":
+        # innerhalb eines Gewichts stehen Blätter vor inneren Knoten
+        for q in range(model.nyt, ROOT):
+            if w[q] == w[q + 1] and symbol[q] < 0:
+                assert symbol[q + 1] < 0, f"Blatt nach innerem Knoten gleichen Gewichts bei Position {q + 1}"
+
+
+def _cost(model, counts: dict[int, int]) -> int:
+    lengths = model.code_lengths()
+    return sum(c * lengths[s] for s, c in counts.items())
+
+
+def _huffman_cost(counts: dict[int, int]) -> int:
+    weights = list(counts.items()) + [(NYT, 0)]
+    tree = build_huffman_tree(weights)
+    return sum(w * l for (_, w), l in zip(weights, tree.code_lengths()) if w)
+
+
+@pytest.mark.parametrize("algorithm", adaptive.ALGORITHMS)
+@pytest.mark.parametrize("seed", range(4))
+def test_sibling_property_after_each_update(algorithm, seed):
+    rng = random.Random(seed)
+    alphabet = rng.sample(range(256), rng.randint(2, 40))
+    weights = [rng.random() ** 3 for _ in alphabet]
+    model = new_model(algorithm)
+    counts: dict[int, int] = {}
+    for _ in range(600):
+        sym = rng.choices(alphabet, weights=weights)[0]
+        model.update(sym)
+        counts[sym] = counts.get(sym, 0) + 1
+        _check_tree(model)
+        # Geschwister-Eigenschaft ⇔ Huffman-Baum: gleiche gewichtete Codelänge wie der statische Huffman-Code
+        assert _cost(model, counts) == _huffman_cost(counts)
+
+
+@pytest.mark.parametrize("algorithm", adaptive.ALGORITHMS)
+def test_all_byte_values(algorithm):
+    model = new_model(algorithm)
+    for sym in list(range(256)) + list(range(255, -1, -1)):
+        model.update(sym)
+    _check_tree(model)
+    data = bytes(range(256)) * 3
+    assert adaptive.decode(adaptive.encode(data, algorithm), len(data), algorithm) == data
+
+
+@pytest.mark.parametrize("algorithm", adaptive.ALGORITHMS)
+def test_encoder_emits_current_codewords(algorithm):
+    data = b"abracadabra, abrakadabra!"
+    model = new_model(algorithm)
+    bits = ""
+    for sym in data:
+        bits += model.codeword(sym)
+        model.update(sym)
+    packed = adaptive.encode(data, algorithm)
+    assert "".join(format(b, "08b") for b in packed) == bits.ljust(8 * len(packed), "0")
+
+
+@pytest.mark.parametrize("algorithm", adaptive.ALGORITHMS)
+def test_empty_and_single_symbol(algorithm):
+    assert adaptive.encode(b"", algorithm) == b""
+    assert adaptive.decode(b"", 0, algorithm) == b""
+    data = b"z" * 100
+    packed = adaptive.encode(data, algorithm)
+    assert len(packed) <= 14  # 8 Rohbits + danach 1 Bit pro Symbol
+    assert adaptive.decode(packed, len(data), algorithm) == data
+
+
+@pytest.mark.parametrize("algorithm", adaptive.ALGORITHMS)
+@pytest.mark.parametrize("seed", range(20))
+def test_fuzz_round_trip(algorithm, seed):
+    rng = random.Random(1000 + seed)
+    alphabet = rng.sample(range(256), rng.randint(1, 256))
+    weights = [rng.random() ** rng.choice((1, 4, 12)) for _ in alphabet]
+    data = bytes(rng.choices(alphabet, weights=weights, k=rng.randint(0, 3000)))
+    chunk_size = rng.choice((1, 5, 64, 1 << 20))
+    packed = adaptive.encode(data, algorithm, chunk_size=chunk_size)
+    assert packed == adaptive.encode(data, algorithm)  # Blockgröße ändert den Bitstrom nicht
+    assert adaptive.decode(packed, len(data), algorithm, chunk_size=rng.choice((1, 3, 1 << 20))) == data
+
+
+def test_truncated_stream_raises():
+    data = bytes(range(50))
+    packed = adaptive.encode(data)
+    with pytest.raises(ValueError):
+        adaptive.decode(packed[:10], len(data))
+
+
+def test_unknown_algorithm_raises():
+    with pytest.raises(ValueError):
+        new_model("lzw")
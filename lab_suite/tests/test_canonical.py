@@ -0,0 +1,90 @@
+"""Round-Trip- und Bit-Tests für coding.CanonicalCode (kanonischer Huffman-Code)."""
+import random
+
+import pytest
+
+from coding import CanonicalCode
+
+
+def _bits(code: CanonicalCode, data) -> str:
+    """Erwarteter Bitstrom: Codewörter aneinandergehängt, auf volle Bytes mit Nullen aufgefüllt."""
+    book = code.codebook()
+    bits = "".join(book[sym] for sym in data)
+    return bits.ljust(-(-len(bits) // 8) * 8, "0")
+
+
+def _packed(code: CanonicalCode, data) -> str:
+    encoded = code.encode(data)
+    return "".join(format(b, "08b") for b in encoded)
+
+
+def test_empty_alphabet_raises():
+    with pytest.raises(ValueError):
+        CanonicalCode.from_data(b"")
+    with pytest.raises(ValueError):
+        CanonicalCode({})
+
+
+def test_empty_input_round_trip():
+    code = CanonicalCode.from_data(b"abc")
+    assert code.encode(b"") == b""
+    assert code.decode(b"", 0) == b""
+
+
+def test_single_symbol():
+    code = CanonicalCode.from_data(b"a")
+    assert code.code_lengths() == {ord("a"): 1}
+    data = b"a" * 9
+    encoded = code.encode(data)
+    assert len(encoded) == 2  # 9 Bit
+    assert code.decode(encoded, len(data)) == data
+
+
+def test_canonical_codewords():
+    # Längen a:1, b:2, c:3, d:3 → 0, 10, 110, 111 (nach Länge, dann Symbol nummeriert)
+    code = CanonicalCode({"d": 3, "b": 2, "c": 3, "a": 1})
+    assert code.codebook() == {"a": "0", "b": "10", "c": "110", "d": "111"}
+
+
+def test_skewed_weights_lengths_and_round_trip():
+    fib = [1, 1]
+    while len(fib) < 30:
+        fib.append(fib[-1] + fib[-2])
+    weights = {i: f for i, f in enumerate(fib)}
+    code = CanonicalCode.from_weights(weights, table_bits=8)
+    assert code.max_length == 29  # Fibonacci-Gewichte: entarteter Baum, länger als die Lookup-Tabelle
+    rng = random.Random(3)
+    data = rng.choices(list(weights), weights=list(weights.values()), k=3000) + [0, 1]
+    encoded = code.encode(data)
+    assert _packed(code, data) == _bits(code, data)
+    assert code.decode(encoded, len(data)) == bytes(data)  # Symbole 0…255 → bytes
+
+
+def test_length_limited_code_is_complete_and_bounded():
+    weights = {i: 2 ** i for i in range(20)}
+    code = CanonicalCode.from_weights(weights, max_length=8)
+    assert code.max_length == 8
+    assert sum(2.0 ** -l for l in code.lengths) == pytest.approx(1.0)
+    data = bytes(range(20)) * 5
+    assert code.decode(code.encode(data), len(data)) == data
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_bit_exact_round_trip_bytes(chunk_size):
+    rng = random.Random(chunk_size)
+    data = bytes(rng.choice(b"aaaaaaabbbccde\x00\xff") for _ in range(2000))
+    code = CanonicalCode.from_data(data)
+    encoded = code.encode(data, chunk_size=chunk_size)
+    assert encoded == code.encode(data)  # Blockgröße ändert den Bitstrom nicht
+    assert _packed(code, data) == _bits(code, data)
+    assert code.decode(encoded, len(data), chunk_size=max(1, chunk_size // 3)) == data
+
+
+def test_round_trip_str_and_objects():
+    text = "Fischers Fritz fischt frische Fische – äöü ß"
+    code = CanonicalCode.from_data(text)
+    assert code.decode(code.encode(text), len(text)) == text
+    words = "der die das der der die und".split()
+    word_code = CanonicalCode.from_weights({w: words.count(w) for w in set(words)})
+    assert word_code.decode(word_code.encode(words), len(words)) == words
+
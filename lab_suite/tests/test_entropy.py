@@ -0,0 +1,53 @@
+"""coding.entropy: blockweises Zählen und Tabellen-Reihenfolge wie in entropy1.py."""
+import math
+
+import numpy as np
+import pytest
+
+from coding.entropy import count_symbols, entropy, entropy_table, new_first_array
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_text("zZ,ab,Zz bäa", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 20])
+def test_ties_in_first_occurrence_order(text_file, chunk_size):
+    text = text_file.read_text(encoding="utf-8")
+    first = new_first_array("utf8")
+    counts = count_symbols(text_file, "utf8", chunk_size=chunk_size, first=first)
+    table = entropy_table(counts, first)
+    # wie sorted(dict-Zählung in Lesereihenfolge, key=count, reverse=True)
+    tokens: dict = {}
+    for c in text:
+        tokens[c] = tokens.get(c, 0) + 1
+    expected = sorted(tokens.items(), key=lambda x: x[1], reverse=True)
+    assert [(chr(sym), cnt) for sym, cnt, *_ in table] == expected
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_bytes_first_and_counts(text_file, use_mmap):
+    data = text_file.read_bytes()
+    first = new_first_array("byte")
+    counts = count_symbols(text_file, "byte", chunk_size=4, use_mmap=use_mmap, first=first)
+    assert counts.tolist() == np.bincount(np.frombuffer(data, np.uint8), minlength=256).tolist()
+    for sym in set(data):
+        assert first[sym] == data.index(bytes([sym]))
+
+
+def test_ties_without_first_by_symbol_value():
+    counts = np.zeros(256, dtype=np.int64)
+    counts[[ord("b"), ord("a"), ord("c")]] = [2, 2, 5]
+    assert [row[0] for row in entropy_table(counts)] == [ord("c"), ord("a"), ord("b")]
+
+
+def test_entropy_values():
+    counts = np.array([1, 1, 2, 0])
+    assert entropy(counts) == pytest.approx(1.5)
+    table = entropy_table(counts)
+    assert sum(row[4] for row in table) == pytest.approx(1.5)
+    assert table[0][3] == pytest.approx(math.log2(2))
+    assert entropy(np.zeros(4)) == 0.0 and entropy_table(np.zeros(4)) == []
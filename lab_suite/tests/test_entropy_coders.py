@@ -0,0 +1,97 @@
+"""Round-Trip-Tests für coding.RangeCoder, RANSCoder und TANSCoder (Range-Coder und ANS)."""
+import random
+
+import pytest
+
+from coding import RANSCoder, RangeCoder, TANSCoder
+from coding.frequencies import FrequencyTable
+
+CODERS = [RangeCoder, RANSCoder, TANSCoder]
+
+
+def _coder(cls, table: FrequencyTable, block_size: int | None = None):
+    if cls is RangeCoder or block_size is None:
+        return cls(table)
+    return cls(table, block_size=block_size)
+
+
+def _pieces(data: bytes, rng: random.Random, max_len: int = 50) -> list[bytes]:
+    """data in unregelmäßige Stücke (auch leere) zerlegen."""
+    out, pos = [], 0
+    while pos < len(data):
+        n = rng.randint(0, max_len)
+        out.append(data[pos : pos + n])
+        pos += n
+    return out
+
+
+def _fibonacci_data(n_symbols: int, k: int, seed: int) -> bytes:
+    fib = [1, 1]
+    while len(fib) < n_symbols:
+        fib.append(fib[-1] + fib[-2])
+    rng = random.Random(seed)
+    return bytes(rng.choices(range(n_symbols), weights=fib, k=k)) + bytes(range(n_symbols))
+
+
+@pytest.mark.parametrize("cls", CODERS)
+def test_empty_input_round_trip(cls):
+    coder = _coder(cls, FrequencyTable.from_data(b"ab"))
+    encoded = coder.encode(b"")
+    assert coder.decode(encoded, 0) == b""
+    assert b"".join(coder.decode_iter([encoded], 0)) == b""
+
+
+@pytest.mark.parametrize("cls", CODERS)
+@pytest.mark.parametrize("n", [1, 1000])
+def test_single_symbol_alphabet(cls, n):
+    data = b"A" * n
+    table = FrequencyTable.from_data(data)
+    assert table.freq[ord("A")] == table.total
+    coder = _coder(cls, table)
+    encoded = coder.encode(data)
+    assert len(encoded) <= 8  # Wahrscheinlichkeit 1: nur Anfangs-/Endzustand
+    assert coder.decode(encoded, n) == data
+
+
+@pytest.mark.parametrize("cls", CODERS)
+def test_unknown_symbol_raises(cls):
+    coder = _coder(cls, FrequencyTable.from_data(b"abc"))
+    with pytest.raises(ValueError):
+        coder.encode(b"abz")
+
+
+@pytest.mark.parametrize("cls", CODERS)
+@pytest.mark.parametrize("scale_bits", [8, 12, 16])
+def test_skewed_table_round_trip_near_ideal(cls, scale_bits):
+    data = _fibonacci_data(24, 20_000, seed=scale_bits)
+    table = FrequencyTable.from_data(data, scale_bits=scale_bits)
+    if scale_bits <= 12:
+        assert min(table.freq[s] for s in table.symbols()) == 1  # seltene Symbole am Quantisierungsrand
+    coder = _coder(cls, table)
+    encoded = coder.encode(data)
+    assert coder.decode(encoded, len(data)) == data
+    # Codelänge nahe der Grenze mit quantisierten Wahrscheinlichkeiten (Zustand/Abschluss pro Block)
+    assert 8 * len(encoded) <= table.ideal_bits() * len(data) * 1.01 + 64
+
+
+@pytest.mark.parametrize("cls", CODERS)
+@pytest.mark.parametrize("block_size", [1, 7, 4096])
+def test_chunked_iter_round_trip(cls, block_size):
+    rng = random.Random(block_size)
+    data = bytes(rng.choice(b"aaaaaaaabbbbccde\x00\xff") for _ in range(3000))
+    table = FrequencyTable.from_data(data)
+    coder = _coder(cls, table, block_size)
+    encoded = coder.encode(data)
+    encoded_iter = b"".join(coder.encode_iter(_pieces(data, rng)))
+    assert encoded_iter == encoded  # Zerlegung der Eingabe ändert den Bytestrom nicht
+    decoded = list(coder.decode_iter(_pieces(encoded, rng, max_len=5), len(data)))
+    assert b"".join(decoded) == data
+
+
+@pytest.mark.parametrize("cls", CODERS)
+def test_truncated_stream_raises(cls):
+    data = _fibonacci_data(16, 2000, seed=1)
+    coder = _coder(cls, FrequencyTable.from_data(data))
+    encoded = coder.encode(data)
+    with pytest.raises(ValueError):
+        coder.decode(encoded[: len(encoded) // 2], len(data))
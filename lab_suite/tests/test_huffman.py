@@ -0,0 +1,144 @@
+"""coding.build_huffman_tree: Optimalität und dieselben Codes/Bäume wie die bisherigen Lab-Implementierungen."""
+import itertools
+import math
+import random
+from fractions import Fraction
+
+import pytest
+
+from coding import build_huffman_tree, build_length_limited_tree, huffman_codebook, length_limited_code_lengths
+
+
+def _legacy_01_03(freq):
+    """Wie labs/01_03_Codierung/huffman.py: absteigend sortierte Liste, die letzten zwei zusammenfassen."""
+    nodes = list(freq)
+    while len(nodes) > 1:
+        (key1, c1), (key2, c2) = nodes[-1], nodes[-2]
+        nodes = sorted(nodes[:-2] + [((key1, key2), c1 + c2)], key=lambda x: x[1], reverse=True)
+    codes = {}
+    stack = [(nodes[0][0], "")]
+    while stack:
+        node, prefix = stack.pop()
+        if isinstance(node, tuple):
+            stack.append((node[0], prefix + "0"))
+            stack.append((node[1], prefix + "1"))
+        else:
+            codes[node] = prefix
+    return codes
+
+
+def _legacy_01_05(leaves):
+    """Wie das Live-Lab 01_05: nodes.sort() im while, innerer Knoten vorne eingefügt."""
+    nodes = list(leaves)
+    while len(nodes) > 1:
+        nodes.sort(key=lambda n: n[1])
+        left, right = nodes[0], nodes[1]
+        nodes = [(None, left[1] + right[1], left, right)] + nodes[2:]
+    return nodes[0]
+
+
+def _as_tuples(tree):
+    nodes = [(sym, w) for sym, w in zip(tree.symbols, tree.weights)]
+    for i in range(tree.num_leaves, tree.root + 1):
+        nodes.append((None, tree.weights[i], nodes[tree.left[i]], nodes[tree.right[i]]))
+    return nodes[tree.root]
+
+
+def _random_freq(rng):
+    syms = rng.sample("abcdefghijklmnopqrstuvwxyz", rng.randint(1, 12))
+    counts = {s: rng.randint(1, 4) for s in syms}  # kleine Zählwerte → viele Gleichstände
+    return sorted(counts.items(), key=lambda x: x[1], reverse=True)
+
+
+def _fibonacci_weights(n):
+    fib = [1, 1]
+    while len(fib) < n:
+        fib.append(fib[-1] + fib[-2])
+    return {i: fib[i] for i in range(n)}
+
+
+def _cost(weights, lengths):
+    return sum(w * lengths[sym] for sym, w in weights.items())
+
+
+def _brute_force_cost(weights, max_length):
+    """Minimum von Σ w·l über alle vollständigen Codes mit Längen ≤ max_length (schwerstes Symbol kürzester Code)."""
+    ws = sorted(weights.values(), reverse=True)
+    best = None
+    for lengths in itertools.combinations_with_replacement(range(1, max_length + 1), len(ws)):
+        if sum(Fraction(1, 1 << l) for l in lengths) == 1:
+            cost = sum(w * l for w, l in zip(ws, lengths))
+            best = cost if best is None else min(best, cost)
+    return best
+
+
+def test_empty_raises():
+    with pytest.raises(ValueError):
+        build_huffman_tree({})
+
+
+def test_single_symbol():
+    tree = build_huffman_tree({"a": 5})
+    assert tree.codes() == [""]
+    assert tree.code_lengths() == [1]
+
+
+def test_ties_match_legacy_01_03():
+    rng = random.Random(1)
+    for _ in range(500):
+        freq = _random_freq(rng)
+        assert huffman_codebook(freq, reverse_ties=True) == _legacy_01_03(freq)
+
+
+def test_ties_match_legacy_01_05():
+    rng = random.Random(2)
+    for _ in range(500):
+        leaves = [(sym, count / 10) for sym, count in _random_freq(rng)]
+        assert _as_tuples(build_huffman_tree(leaves)) == _legacy_01_05(leaves)
+
+
+def test_mean_length_within_entropy_bound():
+    weights = {i: 1 / (i + 1) for i in range(50)}
+    tree = build_huffman_tree(weights)
+    total = sum(weights.values())
+    probs = [w / total for w in weights.values()]
+    entropy = -sum(p * math.log2(p) for p in probs)
+    assert entropy <= tree.mean_length() < entropy + 1
+    assert sum(2.0 ** -l for l in tree.code_lengths()) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("max_length", [6, 8, 12, 20, 40])
+def test_length_limited_within_limit_and_kraft(max_length):
+    weights = _fibonacci_weights(40)  # Huffman-Baum der Tiefe 39
+    lengths = length_limited_code_lengths(weights, max_length)
+    assert set(lengths) == set(weights)
+    assert max(lengths.values()) <= max_length
+    assert sum(Fraction(1, 1 << l) for l in lengths.values()) == 1
+    tree = build_length_limited_tree(weights, max_length)
+    assert max(tree.code_lengths()) <= max_length
+    assert _cost(weights, dict(zip(tree.symbols, tree.code_lengths()))) == _cost(weights, lengths)
+
+
+def test_length_limited_optimal_brute_force():
+    rng = random.Random(3)
+    for _ in range(100):
+        n = rng.randint(2, 7)
+        weights = {i: rng.choice((1, 2, 3, 5, 40, 300)) for i in range(n)}
+        for max_length in range(math.ceil(math.log2(n)), n):
+            lengths = length_limited_code_lengths(weights, max_length)
+            assert max(lengths.values()) <= max_length
+            assert sum(Fraction(1, 1 << l) for l in lengths.values()) == 1
+            assert _cost(weights, lengths) == _brute_force_cost(weights, max_length)
+
+
+def test_length_limited_without_effective_limit_matches_huffman():
+    weights = _fibonacci_weights(12)
+    tree = build_huffman_tree(weights)
+    huffman = dict(zip(tree.symbols, tree.code_lengths()))
+    assert _cost(weights, length_limited_code_lengths(weights, 11)) == _cost(weights, huffman)
+    assert build_length_limited_tree(weights, 11).codes() == tree.codes()
+
+
+def test_length_limited_rejects_too_small_limit():
+    with pytest.raises(ValueError):
+        length_limited_code_lengths({i: 1 for i in range(9)}, 3)
@@ -0,0 +1,171 @@
+"""Round-Trip- und Format-Tests für coding.LZSS und coding.LZW."""
+import random
+
+import pytest
+
+from coding import LZSS, LZW
+from coding.lz import LZW_CLEAR, LZW_FIRST_CODE, MAX_MATCH, MIN_MATCH
+
+
+def _tokens(stream: bytes) -> list:
+    """LZSS-Strom → Liste aus Literalen (int) und Treffern (Abstand, Länge)."""
+    out, p = [], 0
+    while p < len(stream):
+        flags = stream[p]
+        p += 1
+        for bit in range(8):
+            if p >= len(stream):
+                break
+            if flags >> bit & 1:
+                out.append(((stream[p] << 8 | stream[p + 1]) + 1, stream[p + 2] + MIN_MATCH))
+                p += 3
+            else:
+                out.append(stream[p])
+                p += 1
+    return out
+
+
+def _matches(stream: bytes) -> list[tuple[int, int]]:
+    return [t for t in _tokens(stream) if isinstance(t, tuple)]
+
+
+def _codes9(stream: bytes) -> list[int]:
+    """LZW-Strom mit fester Codebreite 9 (max_bits=9) → Codes (LSB zuerst)."""
+    acc = int.from_bytes(stream, "little")
+    return [(acc >> (9 * k)) & 0x1FF for k in range(8 * len(stream) // 9)]
+
+
+def _text(n: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    words = [bytes(rng.choices(b"abcdefghij", k=rng.randint(1, 6))) for _ in range(40)]
+    return b" ".join(rng.choice(words) for _ in range(n))[:n]
+
+
+# ---- LZSS ----
+
+
+@pytest.mark.parametrize("finder", ["hash", "naive"])
+def test_lzss_empty_and_short(finder):
+    lz = LZSS(match_finder=finder)
+    for data in (b"", b"a", b"ab", b"abc"):
+        encoded = lz.encode(data)
+        assert _matches(encoded) == []
+        assert lz.decode(encoded) == data
+
+
+@pytest.mark.parametrize("finder", ["hash", "naive"])
+def test_lzss_window_edge(finder):
+    lz = LZSS(window_bits=4, match_finder=finder)  # Fenster 16 Byte
+    block = bytes(range(100, 116))
+    # Wiederholung genau im Abstand des Fensters: ein Treffer über die volle Länge
+    encoded = lz.encode(block + block)
+    assert _matches(encoded) == [(16, 16)]
+    assert lz.decode(encoded) == block + block
+    # ein Byte weiter außerhalb des Fensters: kein Treffer möglich
+    data = block + b"\x00" + block
+    encoded = lz.encode(data)
+    assert _matches(encoded) == []
+    assert lz.decode(encoded, chunk_size=5) == data
+
+
+@pytest.mark.parametrize("finder", ["hash", "naive"])
+@pytest.mark.parametrize("run", [MIN_MATCH + 1, MAX_MATCH + 1, 3 * MAX_MATCH + 5])
+def test_lzss_match_lengths(finder, run):
+    lz = LZSS(match_finder=finder)
+    data = b"a" * run
+    encoded = lz.encode(data)
+    matches = _matches(encoded)
+    assert all(MIN_MATCH <= length <= MAX_MATCH for _, length in matches)
+    assert all(dist == 1 for dist, _ in matches)  # überlappende Kopie
+    assert sum(length for _, length in matches) == run - 1
+    assert lz.decode(encoded) == data
+
+
+@pytest.mark.parametrize("max_chain", [1, 2, 32])
+def test_lzss_hash_chain_collisions(max_chain):
+    # viele Positionen mit demselben 3-Byte-Präfix: lange Ketten, Abbruch nach max_chain Kandidaten
+    rng = random.Random(max_chain)
+    data = b"".join(b"abc" + bytes(rng.choices(b"xyz", k=rng.randint(0, 4))) for _ in range(2000))
+    lz = LZSS(window_bits=10, max_chain=max_chain)
+    encoded = lz.encode(data)
+    assert all(dist <= lz.window for dist, _ in _matches(encoded))
+    assert lz.decode(encoded) == data
+
+
+def test_lzss_long_chain_matches_naive():
+    # mit unbegrenzter Kette findet die Hash-Suche denselben (nächstgelegenen längsten) Treffer wie naive
+    data = _text(6000, seed=1)
+    hashed = LZSS(window_bits=10, max_chain=1 << 10).encode(data)
+    naive = LZSS(window_bits=10, match_finder="naive").encode(data)
+    assert hashed == naive
+
+
+@pytest.mark.parametrize("finder", ["hash", "naive"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 300])
+def test_lzss_chunked_round_trip(finder, chunk_size):
+    data = _text(5000, seed=chunk_size)
+    lz = LZSS(window_bits=8, match_finder=finder)
+    encoded = lz.encode(data)
+    assert lz.encode(data, chunk_size=chunk_size) == encoded  # Blockaufteilung ändert den Strom nicht
+    assert lz.decode(encoded, chunk_size=chunk_size) == data
+
+
+def test_lzss_reference_before_start_raises():
+    with pytest.raises(ValueError):
+        LZSS().decode(bytes((0b1, 0, 4, 0)))  # Treffer mit Abstand 5 ohne Vorgeschichte
+
+
+def test_lzss_rejects_bad_parameters():
+    with pytest.raises(ValueError):
+        LZSS(window_bits=17)
+    with pytest.raises(ValueError):
+        LZSS(match_finder="zlib")
+
+
+# ---- LZW ----
+
+
+def test_lzw_empty():
+    lzw = LZW()
+    assert lzw.encode(b"") == b""
+    assert lzw.decode(b"") == b""
+
+
+@pytest.mark.parametrize("data", [b"aaa", b"aaaaaaa", b"abababa"])
+def test_lzw_kwkwk(data):
+    # Encoder benutzt einen Code, den der Decoder erst beim Dekodieren anlegt (K + w + K + w + K)
+    lzw = LZW(max_bits=9)
+    encoded = lzw.encode(data)
+    codes = _codes9(encoded)
+    # nach dem k-ten Code (Index k − 1) legt der Encoder FIRST_CODE + k − 1 an; KwKwK = genau dieser Code folgt
+    assert any(code >= LZW_FIRST_CODE and code == LZW_FIRST_CODE + k - 1 for k, code in enumerate(codes))
+    assert lzw.decode(encoded) == data
+
+
+def test_lzw_kwkwk_codes():
+    assert _codes9(LZW(max_bits=9).encode(b"aaa")) == [ord("a"), LZW_FIRST_CODE]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 13, 1 << 20])
+def test_lzw_dictionary_reset(chunk_size):
+    data = _text(20_000, seed=2) + bytes(random.Random(2).randrange(256) for _ in range(3000))
+    lzw = LZW(max_bits=9)  # Codebreite bleibt 9, Wörterbuch nach 255 Einträgen voll
+    encoded = lzw.encode(data, chunk_size=chunk_size)
+    assert _codes9(encoded).count(LZW_CLEAR) >= 2
+    assert lzw.decode(encoded, chunk_size=chunk_size) == data
+
+
+@pytest.mark.parametrize("max_bits", [10, 12, 16])
+def test_lzw_growing_width_round_trip(max_bits):
+    data = _text(50_000, seed=max_bits)
+    lzw = LZW(max_bits=max_bits)
+    encoded = lzw.encode(data)
+    assert len(encoded) < len(data)
+    assert lzw.encode(data, chunk_size=77) == encoded
+    assert lzw.decode(encoded, chunk_size=3) == data
+
+
+def test_lzw_invalid_code_raises():
+    # erster Code 300: weder Byte noch gerade angelegter Eintrag
+    with pytest.raises(ValueError):
+        LZW().decode((300).to_bytes(2, "little"))
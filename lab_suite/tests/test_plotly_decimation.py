@@ -0,0 +1,97 @@
+"""Tests für widgets.plotly_decimation: minmax/LTTB-Indizes und decimate_trace (inkl. Zoom-Fenster)."""
+import numpy as np
+import pytest
+
+from widgets.plotly_decimation import decimate_trace, lttb_indices, minmax_indices
+
+
+def _signal(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.sin(np.linspace(0, 40, n)) + rng.normal(0, 0.3, n) + np.where(rng.random(n) < 0.001, 5.0, 0.0)
+
+
+def _check_indices(idx: np.ndarray, n: int, n_out: int) -> None:
+    assert len(idx) <= n_out
+    assert (np.diff(idx) > 0).all(), "Indizes nicht streng steigend"
+    assert idx[0] == 0 and idx[-1] == n - 1
+
+
+@pytest.mark.parametrize("n", [10, 101, 1000, 12_345])
+@pytest.mark.parametrize("n_out", [4, 5, 50, 333])
+def test_minmax_indices(n, n_out):
+    y = _signal(n, seed=n + n_out)
+    idx = minmax_indices(y, n_out)
+    if n_out >= n:
+        assert (idx == np.arange(n)).all()
+        return
+    _check_indices(idx, n, n_out)
+    # globale Extremwerte bleiben sichtbar
+    assert y[idx].min() == y.min() and y[idx].max() == y.max()
+
+
+@pytest.mark.parametrize("n", [10, 101, 1000, 12_345])
+@pytest.mark.parametrize("n_out", [3, 5, 50, 333])
+def test_lttb_indices(n, n_out):
+    x = np.cumsum(np.random.default_rng(n).random(n))  # ungleichmäßig, aber monoton
+    y = _signal(n, seed=n_out)
+    idx = lttb_indices(x, y, n_out)
+    if n_out >= n:
+        assert (idx == np.arange(n)).all()
+        return
+    _check_indices(idx, n, n_out)
+    if n <= 4 * n_out:  # ohne minmax-Vorauswahl: genau n_out Punkte
+        assert len(idx) == n_out
+
+
+def test_small_n_out_returns_all():
+    y = _signal(100, seed=0)
+    assert (minmax_indices(y, 3) == np.arange(100)).all()
+    assert (lttb_indices(np.arange(100), y, 2) == np.arange(100)).all()
+
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+def test_decimate_trace_full(method):
+    y = _signal(20_000, seed=1)
+    trace = {"type": "scatter", "y": y, "name": "s"}
+    out = decimate_trace(trace, 400, method)
+    assert out is not trace and trace["y"] is y  # Original unverändert
+    assert out["name"] == "s"
+    assert len(out["y"]) <= 400 and len(out["x"]) == len(out["y"])
+    # x=None: x ist der Originalindex
+    assert (out["y"] == y[out["x"]]).all()
+    assert out["x"][0] == 0 and out["x"][-1] == len(y) - 1
+
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+def test_decimate_trace_window_offset_without_x(method):
+    y = _signal(50_000, seed=2)
+    out = decimate_trace({"y": y}, 200, method, window=(10_000.4, 19_999.6))
+    xs = out["x"]
+    assert len(xs) <= 200
+    assert (np.diff(xs) > 0).all()
+    # Fenster plus je ein Randpunkt: Indizes beziehen sich auf das Originalarray, nicht auf den Ausschnitt
+    assert xs[0] == 9_999 and xs[-1] == 20_001
+    assert (out["y"] == y[xs]).all()
+    if method == "minmax":
+        assert out["y"].max() == y[9_999:20_002].max()
+
+
+def test_decimate_trace_window_with_x():
+    x = np.linspace(0.0, 100.0, 30_001)
+    y = _signal(len(x), seed=3)
+    out = decimate_trace({"x": x, "y": y}, 300, "minmax", window=(25.0, 50.0))
+    lo, hi = np.searchsorted(x, 25.0) - 1, np.searchsorted(x, 50.0, side="right")
+    assert out["x"][0] == x[lo] and out["x"][-1] == x[hi]
+    assert out["y"].min() == y[lo : hi + 1].min()
+
+
+def test_decimate_trace_passthrough():
+    short = {"y": np.arange(10.0)}
+    assert decimate_trace(short, 100) is short
+    heatmap = {"z": np.zeros((3, 3)), "y": np.arange(3.0)}
+    assert decimate_trace(heatmap, 2) is heatmap
+    unsorted = {"x": np.arange(1000.0)[::-1], "y": np.arange(1000.0)}
+    assert decimate_trace(unsorted, 10) is unsorted
+    text = {"y": ["a"] * 1000}
+    assert decimate_trace(text, 10) is text
+    assert decimate_trace({"y": np.arange(1000.0)}, 10, "none")["y"].size == 1000
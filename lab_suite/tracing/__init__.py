@@ -0,0 +1,211 @@
+"""
+lab_suite/tracing – Opt-in-Tracing-Spans für den Hot-Path der Apps (Callback → gui_binding → Widget-Update →
+Websocket), aggregiert pro Span-Name und als Chrome-Trace-Event-JSON exportierbar.
+
+Bisher ließ sich nur timer_tick als Ganzes messen; ob die Zeit in der Fachlogik, in _to_serializable, in
+Element.update() oder im ausgehenden Socket-Paket steckt, blieb offen. Mit TRACE_SPANS=1 erzeugt jeder
+span()-Block ein Ereignis (Name, Start, Dauer, Thread) und aktualisiert die Aggregation pro Name
+(count, total, max). Ohne TRACE_SPANS liefert span() einen gemeinsamen Leer-Kontextmanager
+(ein Funktionsaufruf, keine Zeitmessung).
+
+Instrumentiert sind u. a.: renderer.on_change/on_click, gui_binding.get/set/update_plot/append_points,
+plotly.update_figure (mit .serialize/.update), timer_tick, tick.broadcast und socket.emit (NiceGUI-Websocket,
+über install_socket_tracing()).
+
+Ausgabe: dump_trace() schreibt {"traceEvents": [...]} nach TRACE_FILE (Default trace_events.json im
+Arbeitsverzeichnis), zusätzlich automatisch beim Beenden. Die Datei lässt sich in chrome://tracing oder
+https://ui.perfetto.dev öffnen; ein Tick erscheint dort als verschachtelte Spans pro Thread. Ereignisse im
+Worker-Prozess (TIMER_EXECUTOR=process) werden nicht übertragen.
+
+    from tracing import span
+    with span("domain_logic", key="power"):
+        ...
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+DEFAULT_TRACE_FILE = "trace_events.json"
+DEFAULT_MAX_EVENTS = 100_000
+
+
+def _env_enabled() -> bool:
+    return os.environ.get("TRACE_SPANS", "").strip().lower() in ("1", "true", "yes")
+
+
+_enabled = _env_enabled()
+_pid = os.getpid()
+_t0_ns = time.perf_counter_ns()
+_events: deque = deque(maxlen=max(1, int(os.environ.get("TRACE_MAX_EVENTS", DEFAULT_MAX_EVENTS))))
+_agg: dict[str, list] = {}  # Name → [count, total_ns, max_ns]
+_lock = threading.Lock()
+_thread_names: dict[int, str] = {}
+
+
+class _NullSpan:
+    """Leer-Kontextmanager bei abgeschaltetem Tracing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Misst einen with-Block und trägt ihn als Complete-Event (ph "X") ein."""
+
+    __slots__ = ("name", "args", "_start")
+
+    def __init__(self, name: str, args: dict[str, Any] | None) -> None:
+        self.name = name
+        self.args = args
+        self._start = 0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc: Any) -> None:
+        end = time.perf_counter_ns()
+        _record(self.name, self._start, end - self._start, self.args)
+
+
+def _record(name: str, start_ns: int, dur_ns: int, args: dict[str, Any] | None) -> None:
+    tid = threading.get_ident()
+    event = {
+        "name": name,
+        "ph": "X",
+        "ts": (start_ns - _t0_ns) / 1000.0,
+        "dur": dur_ns / 1000.0,
+        "pid": _pid,
+        "tid": tid,
+    }
+    if args:
+        event["args"] = args
+    _events.append(event)
+    with _lock:
+        if tid not in _thread_names:
+            _thread_names[tid] = threading.current_thread().name
+        agg = _agg.get(name)
+        if agg is None:
+            _agg[name] = [1, dur_ns, dur_ns]
+        else:
+            agg[0] += 1
+            agg[1] += dur_ns
+            if dur_ns > agg[2]:
+                agg[2] = dur_ns
+
+
+def add_span(name: str, start_ns: int, dur_ns: int, **args: Any) -> None:
+    """Bereits gemessenen Abschnitt (time.perf_counter_ns) eintragen, z. B. aus perf_stats."""
+    if _enabled:
+        _record(name, start_ns, dur_ns, args or None)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable(on: bool = True) -> None:
+    """Tracing zur Laufzeit ein-/ausschalten (sonst über TRACE_SPANS beim Import)."""
+    global _enabled
+    _enabled = on
+
+
+def span(name: str, **args: Any):
+    """Kontextmanager für einen Span; args erscheinen im Trace-Viewer (nur bei eingeschaltetem Tracing)."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args or None)
+
+
+def get_span_stats() -> dict[str, dict[str, float]]:
+    """Aggregation pro Span-Name: count, total_ms, avg_ms, max_ms (seit Start bzw. reset())."""
+    with _lock:
+        items = [(name, list(agg)) for name, agg in _agg.items()]
+    return {
+        name: {
+            "count": count,
+            "total_ms": total / 1e6,
+            "avg_ms": total / count / 1e6,
+            "max_ms": max_ns / 1e6,
+        }
+        for name, (count, total, max_ns) in sorted(items, key=lambda item: -item[1][1])
+    }
+
+
+def reset() -> None:
+    with _lock:
+        _events.clear()
+        _agg.clear()
+
+
+def trace_events() -> list[dict[str, Any]]:
+    """Gespeicherte Ereignisse (höchstens TRACE_MAX_EVENTS, älteste fallen heraus) plus Thread-Namen."""
+    events = list(_events)
+    with _lock:
+        names = dict(_thread_names)
+    meta = [
+        {"name": "thread_name", "ph": "M", "pid": _pid, "tid": tid, "args": {"name": tname}}
+        for tid, tname in names.items()
+    ]
+    return meta + events
+
+
+def dump_trace(path: str | os.PathLike | None = None) -> Path:
+    """Chrome-Trace-Event-JSON schreiben (TRACE_FILE bzw. trace_events.json); gibt den Pfad zurück."""
+    out = Path(path or os.environ.get("TRACE_FILE", "").strip() or DEFAULT_TRACE_FILE)
+    data = {"traceEvents": trace_events(), "displayTimeUnit": "ms", "otherData": {"spans": get_span_stats()}}
+    out.write_text(json.dumps(data), encoding="utf-8")
+    return out
+
+
+def install_socket_tracing() -> bool:
+    """
+    NiceGUI-Websocket (core.sio.emit) als Span socket.emit erfassen – inkl. JSON-Kodierung des Pakets.
+    Nur bei eingeschaltetem Tracing; True, wenn installiert.
+    """
+    if not _enabled:
+        return False
+    try:
+        from nicegui import core
+    except ImportError:
+        return False
+    sio = getattr(core, "sio", None)
+    emit = getattr(sio, "emit", None)
+    if emit is None or getattr(emit, "_traced", False):
+        return False
+
+    @functools.wraps(emit)
+    async def traced_emit(event: str, *a: Any, **kw: Any) -> Any:
+        with span("socket.emit", event=event):
+            return await emit(event, *a, **kw)
+    traced_emit._traced = True
+    sio.emit = traced_emit
+    return True
+
+
+def _dump_at_exit() -> None:
+    # nur im Hauptprozess: Worker-Prozesse (spawn) würden die Datei sonst überschreiben
+    if _enabled and _events and multiprocessing.parent_process() is None:
+        try:
+            dump_trace()
+        except OSError:
+            pass
+
+
+atexit.register(_dump_at_exit)
@@ -0,0 +1,147 @@
+"""
+Decimation für PlotlyGraph: lange Spuren vor dem Senden auf etwa 2 × Plotbreite (Pixel) reduzieren.
+
+Ein Plot mit 600 px Breite kann von 10⁶ Samples ohnehin nur ~600 Spalten darstellen; der Rest kostet
+Serialisierung, Websocket und Zeichnen im Browser. Beide Verfahren erhalten Spitzen:
+
+- minmax: pro Bucket Minimum und Maximum (in Originalreihenfolge) – vollständig vektorisiert
+  (reshape + argmin/argmax), Hüllkurve exakt wie bei voller Auflösung; gut für Signale/Rauschen.
+- lttb: Largest-Triangle-Three-Buckets – pro Bucket der Punkt mit größter Dreiecksfläche zum zuvor
+  gewählten Punkt und zum Mittel des nächsten Buckets; optisch näher am Original bei glatten Kurven.
+  Die Auswahl ist sequentiell; bei langen Spuren daher erst vektorisierte minmax-Vorauswahl auf
+  4 × n_out Punkte (MinMaxLTTB), Bucket-Mittel per cumsum.
+
+Alle Funktionen liefern Indizes in die Originalarrays (aufsteigend, erster und letzter Punkt enthalten).
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+DECIMATION_METHODS = ("none", "minmax", "lttb")
+MINMAX_PRESELECT = 4  # lttb: Kandidaten pro Zielpunkt nach minmax-Vorauswahl
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indizes von Min/Max pro Bucket (n_out // 2 Buckets) plus erster/letzter Punkt."""
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+    buckets = (n_out - 2) // 2
+    size = -(-n // buckets)  # aufrunden
+    full = n // size
+    parts = []
+    if full:
+        block = y[: full * size].reshape(full, size)
+        base = np.arange(full) * size
+        parts.append(np.stack((base + block.argmin(axis=1), base + block.argmax(axis=1)), axis=1))
+    if full * size < n:
+        tail = y[full * size :]
+        parts.append(np.array([[full * size + tail.argmin(), full * size + tail.argmax()]]))
+    idx = np.sort(np.concatenate(parts), axis=1).ravel()
+    return np.unique(np.concatenate(([0], idx, [n - 1])))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: n_out Indizes (erster und letzter Punkt fest). Bei mehr als
+    MINMAX_PRESELECT × n_out Punkten zuerst minmax-Vorauswahl (MinMaxLTTB), damit die sequentielle
+    Schleife nur wenige Kandidaten pro Bucket sieht.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    if n > MINMAX_PRESELECT * n_out:
+        pre = minmax_indices(y, MINMAX_PRESELECT * n_out)
+        return pre[lttb_indices(np.asarray(x)[pre], np.asarray(y)[pre], n_out)]
+    xs = np.asarray(x, dtype=np.float64)
+    ys = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)  # n_out - 2 Buckets [edges[i], edges[i+1])
+    counts = np.diff(edges)
+    cx = np.concatenate(([0.0], np.cumsum(xs)))
+    cy = np.concatenate(([0.0], np.cumsum(ys)))
+    # Mittelwert des jeweils nächsten Buckets; für den letzten Bucket der letzte Punkt
+    avg_x = np.append((cx[edges[2:]] - cx[edges[1:-1]]) / counts[1:], xs[-1]).tolist()
+    avg_y = np.append((cy[edges[2:]] - cy[edges[1:-1]]) / counts[1:], ys[-1]).tolist()
+    # wenige Kandidaten pro Bucket: Python-Schleife auf Listen ist schneller als NumPy-Aufrufe pro Bucket
+    xl, yl, el = xs.tolist(), ys.tolist(), edges.tolist()
+    out = [0]
+    a = 0
+    for i in range(n_out - 2):
+        ax, ay, bx, by = xl[a], yl[a], avg_x[i], avg_y[i]
+        dx, dy = ax - bx, by - ay
+        best, best_area = el[i], -1.0
+        for j in range(el[i], el[i + 1]):
+            area = abs(dx * (yl[j] - ay) - (ax - xl[j]) * dy)
+            if area > best_area:
+                best, best_area = j, area
+        a = best
+        out.append(a)
+    out.append(n - 1)
+    return np.array(out, dtype=np.int64)
+
+
+def decimate_indices(x: np.ndarray | None, y: np.ndarray, n_out: int, method: str = "minmax") -> np.ndarray:
+    """Indizes nach method ("minmax" | "lttb"); x=None bedeutet x = Index."""
+    if method == "lttb":
+        return lttb_indices(np.arange(len(y)) if x is None else x, y, n_out)
+    return minmax_indices(y, n_out)
+
+
+def window_slice(x: np.ndarray | None, n: int, x0: float, x1: float) -> slice:
+    """Bereich der Punkte mit x0 ≤ x ≤ x1 (plus je ein Punkt Rand, damit die Linie bis zum Plotrand reicht)."""
+    if x is None:
+        lo, hi = int(np.floor(x0)), int(np.ceil(x1)) + 1
+    else:
+        lo = int(np.searchsorted(x, x0, side="left"))
+        hi = int(np.searchsorted(x, x1, side="right"))
+    return slice(max(0, lo - 1), min(n, hi + 1))
+
+
+def _as_1d(values: Any) -> np.ndarray | None:
+    if values is None or isinstance(values, (str, dict)):
+        return None
+    try:
+        arr = np.asarray(values)
+    except (TypeError, ValueError):
+        return None
+    if arr.ndim != 1 or arr.dtype.kind not in "fiub":
+        return None
+    return arr
+
+
+def decimate_trace(
+    trace: dict[str, Any],
+    n_out: int,
+    method: str = "minmax",
+    window: tuple[float, float] | None = None,
+) -> dict[str, Any]:
+    """
+    Trace mit reduziertem x/y (neues Dict, Original bleibt unverändert). window=(x0, x1): nur dieser
+    x-Bereich (Zoom), dort wieder bis n_out Punkte. Nicht reduziert werden Traces ohne numerisches 1-D-y,
+    mit z (Heatmap, 3D) oder mit nicht monoton steigendem x (Scatter).
+    """
+    if method == "none" or "z" in trace:
+        return trace
+    y = _as_1d(trace.get("y"))
+    if y is None:
+        return trace
+    x = _as_1d(trace.get("x")) if trace.get("x") is not None else None
+    if trace.get("x") is not None and (x is None or len(x) != len(y)):
+        return trace
+    if x is not None and len(x) > 1 and not (x[1:] >= x[:-1]).all():
+        return trace
+    offset = 0
+    if window is not None:
+        s = window_slice(x, len(y), window[0], window[1])
+        offset = s.start
+        y = y[s]
+        x = x[s] if x is not None else None
+    if len(y) <= n_out and window is None:
+        return trace
+    idx = decimate_indices(x, y, n_out, method)
+    out = dict(trace)
+    out["y"] = y[idx]
+    out["x"] = x[idx] if x is not None else idx + offset
+    return out
@@ -2,6 +2,50 @@
 // Lädt plotly.js bei Bedarf von CDN (NiceGUI setzt window.Plotly oft nicht).
 const PLOTLY_CDN = "https://cdn.plot.ly/plotly-2.27.0.min.js";
 
+// Binäre Typed-Array-Payloads {dtype, bdata[, shape]} (plotly_graph.py, plotly.py ≥ 6) → Float64Array & Co.
+// plotly.js 2.27 kennt das Format noch nicht; base64 wird direkt in einen ArrayBuffer dekodiert (keine Zahlen-Arrays).
+const TYPED_ARRAYS = {
+  f8: Float64Array, f4: Float32Array,
+  i1: Int8Array, u1: Uint8Array, i2: Int16Array, u2: Uint16Array, i4: Int32Array, u4: Uint32Array,
+};
+
+function decodeTypedArray(spec) {
+  const Ctor = TYPED_ARRAYS[spec.dtype];
+  const bin = atob(spec.bdata);
+  const bytes = new Uint8Array(bin.length);
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+  const flat = new Ctor(bytes.buffer);
+  if (!spec.shape) return flat;
+  // 2D (z. B. z einer Heatmap): Zeilen als Sichten auf denselben Puffer, keine Kopie
+  const [rows, cols] = String(spec.shape).split(",").map(Number);
+  const out = new Array(rows);
+  for (let r = 0; r < rows; r++) out[r] = flat.subarray(r * cols, (r + 1) * cols);
+  return out;
+}
+
+function isTypedSpec(v) {
+  return v !== null && typeof v === "object" && typeof v.bdata === "string" && v.dtype in TYPED_ARRAYS;
+}
+
+// Trace-/Layout-Objekte flach kopieren und Typed-Array-Payloads ersetzen; Zahlen-Arrays werden nicht durchlaufen
+function decodeTyped(v) {
+  if (isTypedSpec(v)) return decodeTypedArray(v);
+  if (Array.isArray(v)) {
+    return v.length && v[0] !== null && typeof v[0] === "object" ? v.map(decodeTyped) : v;
+  }
+  if (v !== null && typeof v === "object") {
+    const out = {};
+    for (const k of Object.keys(v)) out[k] = decodeTyped(v[k]);
+    return out;
+  }
+  return v;
+}
+
+// {"cached": Version}: Array unverändert seit dem letzten Senden (plotly_graph.py), aus dem Browser-Cache einsetzen
+function isCachedRef(v) {
+  return v !== null && typeof v === "object" && !Array.isArray(v) && typeof v.cached === "number";
+}
+
 export default {
   template: `
     <div class="plotly-graph-wrapper" :style="wrapperStyle">
@@ -18,9 +62,17 @@ export default {
     plotlyScriptUrl: { type: String, default: "" },
     /** Bei true: nur Trace-Daten (x/y) per restyle aktualisieren, kein voller react – flüssiger bei Animation. */
     restyleOnly: { type: Boolean, default: false },
+    /** Server reduziert Spuren (decimation): Zoom (relayout) und Plotbreite (resize) an Python melden. */
+    decimate: { type: Boolean, default: false },
+    /** Letztes append_points, das bereits in data enthalten ist (ältere appendPoints-Aufrufe verwerfen). */
+    appendSeq: { type: Number, default: 0 },
+    /** Pro Trace die Version von x/y/z ({x: 3, y: 7}); gleiche Version = Array aus arrayCache. */
+    dataVersions: { type: Array, default: () => [] },
+    /** Nummer des Frames (update_figure); nach dem Zeichnen per Event "drawn" quittiert (Backpressure). */
+    frameSeq: { type: Number, default: 0 },
   },
   data() {
-    return { plotlyReady: false, loadStarted: false };
+    return { plotlyReady: false, loadStarted: false, ownRelayout: false, reportedWidth: 0, pendingAppends: [], drawQueued: false };
   },
   computed: {
     wrapperStyle() {
@@ -30,6 +82,9 @@ export default {
       return `width: 100%; height: 100%; min-height: 200px;`;
     },
   },
+  created() {
+    this.arrayCache = {}; // "Trace.Key" → {version, value}; bewusst nicht reaktiv (große Arrays)
+  },
   mounted() {
     if (typeof window === "undefined") return;
     if (window.Plotly) {
@@ -55,16 +110,100 @@ export default {
       };
       document.head.appendChild(script);
     },
+    watchView(el) {
+      // Zoom/Autoscale → Server lädt den sichtbaren x-Bereich in voller Auflösung (bzw. wieder alles)
+      el.on("plotly_relayout", (ev) => {
+        if (this.ownRelayout || !ev) return;
+        if ("xaxis.range[0]" in ev || "xaxis.range" in ev || "xaxis.autorange" in ev) this.$emit("relayout", ev);
+      });
+      // Plotbreite → Zielpunkte pro Spur (2 × Pixel); nur bei Änderung um mehr als 10 %
+      const report = () => {
+        const width = Math.round(el.clientWidth);
+        if (width > 0 && Math.abs(width - this.reportedWidth) > 0.1 * this.reportedWidth) {
+          this.reportedWidth = width;
+          this.$emit("resize", { width });
+        }
+      };
+      report();
+      if (typeof ResizeObserver !== "undefined") {
+        this.resizeObserver = new ResizeObserver(report);
+        this.resizeObserver.observe(el);
+      }
+    },
+    // append_points (Python): nur neue Samples anhängen, Plotly kürzt jede Spur auf maxPoints (gleitendes Fenster)
+    appendPoints(payload) {
+      if (payload.seq <= this.appendSeq) return; // schon in data (Props-Update kam zuerst)
+      const el = this.$refs.container;
+      if (!el || !window.Plotly || !el.data) {
+        this.pendingAppends.push(payload); // noch nicht gezeichnet: nach newPlot nachholen
+        return;
+      }
+      const traces = payload.traces;
+      const missing = Math.max(...traces) + 1 - el.data.length;
+      if (missing > 0) {
+        window.Plotly.addTraces(el, Array.from({ length: missing }, () => ({ x: [], y: [], mode: "lines" })));
+      }
+      // Spalten im Typ der vorhandenen Spur: Plotly hängt an Arrays per concat an (Typed Array würde verschachtelt)
+      const column = (target, values) => {
+        const arr = decodeTyped(values);
+        if (ArrayBuffer.isView(target)) return ArrayBuffer.isView(arr) ? arr : new target.constructor(arr);
+        return ArrayBuffer.isView(arr) ? Array.from(arr) : arr;
+      };
+      const x = traces.map((t, k) => column(el.data[t].x, payload.x[k]));
+      const y = traces.map((t, k) => column(el.data[t].y, payload.y[k]));
+      try {
+        window.Plotly.extendTraces(el, { x, y }, traces, payload.maxPoints);
+      } catch (err) {
+        console.warn("PlotlyGraph appendPoints:", err);
+      }
+    },
+    // Cache-Verweise ersetzen, neue Arrays merken; false = Version fehlt (Server sendet nach "resync" alles)
+    resolveCached(data) {
+      const versions = Array.isArray(this.dataVersions) ? this.dataVersions : [];
+      let complete = true;
+      data.forEach((trace, k) => {
+        const traceVersions = versions[k] || {};
+        for (const key of Object.keys(traceVersions)) {
+          const slot = `${k}.${key}`;
+          if (isCachedRef(trace[key])) {
+            const hit = this.arrayCache[slot];
+            if (hit && hit.version === traceVersions[key]) trace[key] = hit.value;
+            else complete = false;
+          } else {
+            this.arrayCache[slot] = { version: traceVersions[key], value: trace[key] };
+          }
+        }
+      });
+      return complete;
+    },
+    // data, layout und frameSeq ändern sich meist im selben Update: nur einmal zeichnen
+    scheduleDraw() {
+      if (!this.plotlyReady || this.drawQueued) return;
+      this.drawQueued = true;
+      this.$nextTick(() => {
+        this.drawQueued = false;
+        this.draw();
+      });
+    },
     async draw() {
       const el = this.$refs.container;
       if (!el || !window.Plotly) return;
-      const data = Array.isArray(this.data) && this.data.length ? this.data : [{ x: [], y: [], mode: "lines" }];
-      const layout = this.layout && typeof this.layout === "object" ? { ...this.layout } : {};
+      const seq = this.frameSeq;
+      const data = Array.isArray(this.data) && this.data.length ? decodeTyped(this.data) : [{ x: [], y: [], mode: "lines" }];
+      if (!this.resolveCached(data)) {
+        this.$emit("resync");
+        return;
+      }
+      const layout = this.layout && typeof this.layout === "object" ? decodeTyped(this.layout) : {};
       const config = this.config && typeof this.config === "object" ? this.config : { responsive: true };
       const t0 = typeof performance !== "undefined" ? performance.now() : 0;
+      let durationMs = null;
       try {
         if (!el.data) {
           await window.Plotly.newPlot(el, data, layout, config);
+          if (this.decimate) this.watchView(el);
+          const pending = this.pendingAppends.splice(0);
+          for (const payload of pending) this.appendPoints(payload);
         } else if (this.restyleOnly && data.length > 0) {
           const xArr = data.map((t) => t.x || []);
           const yArr = data.map((t) => t.y || []);
@@ -79,12 +218,19 @@ export default {
             if (layout.yaxis.range) relayoutArg["yaxis.range"] = layout.yaxis.range;
             if (layout.yaxis.autorange === false) relayoutArg["yaxis.autorange"] = false;
           }
-          if (Object.keys(relayoutArg).length) await window.Plotly.relayout(el, relayoutArg);
+          if (Object.keys(relayoutArg).length) {
+            this.ownRelayout = true; // kein Zoom-Event an den Server für eigenes relayout
+            try {
+              await window.Plotly.relayout(el, relayoutArg);
+            } finally {
+              this.ownRelayout = false;
+            }
+          }
         } else {
           await window.Plotly.react(el, data, layout, config);
         }
         if (typeof window !== "undefined" && t0 > 0) {
-          const durationMs = performance.now() - t0;
+          durationMs = performance.now() - t0;
           window.__lastPlotDurationMs = durationMs;
           if (typeof console !== "undefined" && console.log) {
             console.log("[PlotlyGraph] draw:", durationMs.toFixed(2), "ms");
@@ -93,11 +239,17 @@ export default {
       } catch (err) {
         console.warn("PlotlyGraph draw:", err);
       }
+      // auch nach Fehlern quittieren, sonst hält der Server weitere Frames bis zum Timeout zurück
+      if (seq) this.$emit("drawn", { seq, ms: durationMs });
     },
   },
+  unmounted() {
+    if (this.resizeObserver) this.resizeObserver.disconnect();
+  },
   watch: {
-    data: { handler() { if (this.plotlyReady) this.$nextTick(() => this.draw()); }, deep: true },
-    layout: { handler() { if (this.plotlyReady && !this.restyleOnly) this.$nextTick(() => this.draw()); }, deep: true },
-    restyleOnly: { handler() { if (this.plotlyReady) this.$nextTick(() => this.draw()); } },
+    data: { handler() { this.scheduleDraw(); }, deep: true },
+    layout: { handler() { if (!this.restyleOnly) this.scheduleDraw(); }, deep: true },
+    restyleOnly: { handler() { this.scheduleDraw(); } },
+    frameSeq: { handler() { this.scheduleDraw(); } },
   },
 };
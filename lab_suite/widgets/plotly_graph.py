@@ -5,35 +5,185 @@ Spektrum, Oszilloskop (Time-Domain), Scatter, 3D: ein gemeinsamer Graph-Containe
 Steuerung und Defaults (RBW, Time-Base, …) bleiben in spezialisierten Wrappern oder
 in der App (z. B. SpectrumPanel mit PlotlyGraph + Frequenz-/Pegel-Controls).
 
-Daten: data/layout können NumPy-Arrays enthalten (x, y, z in Traces); sie werden
-intern zu Listen konvertiert (JSON-Serialisierung, Performance: .tolist() ist schnell).
+Daten: data/layout können NumPy-Arrays enthalten (x, y, z in Traces). Numerische Arrays gehen als
+binäre Typed-Array-Payloads {"dtype": "f8", "bdata": "<base64>"} an den Browser (Plotly-Format, wie
+plotly.py ≥ 6) statt als Dezimal-Text über .tolist(); plotly_graph.js dekodiert sie direkt in
+Float64Array/Float32Array. float32=True halbiert Bytes pro Frame (Genauigkeit ~7 Stellen, für Anzeige
+genug). binary=False schaltet auf Listen zurück. Siehe benchmarks/bench_plotly_transport.py.
+
+Decimation (decimation="minmax" | "lttb", siehe plotly_decimation.py): lange Spuren werden vor dem Senden
+auf max_points bzw. 2 × Plotbreite reduziert; beim Zoom (relayout im Browser) wird der sichtbare
+x-Bereich aus den vollen Daten neu reduziert, beim Zurücksetzen (Doppelklick) wieder der ganze Bereich.
+
+Browser-Cache für unveränderte Arrays: Bleibt x/y/z einer Trace gegenüber dem letzten Senden gleich (z. B.
+festes Zeit- oder Frequenzraster), steht in data nur {"cached": Version}; plotly_graph.js setzt das zuletzt
+empfangene Array dieser Version ein. Fehlt es dort (neu geladene Seite, Reconnect), meldet der Browser
+"resync" und bekommt einmal alle Arrays vollständig.
+
+Mehrere Clients (Tick-Driver: dieselben Traces an alle Tabs): innerhalb von shared_serialization() werden
+gleiche Arrays (Objekt-Identität) nur einmal kodiert und reduziert, und der Cache-Vergleich gegen den
+zuletzt gesendeten Wert läuft einmal statt einmal pro Graph.
+
+Backpressure: Der Browser quittiert jeden fertig gezeichneten Frame (Event "drawn" mit frameSeq). Solange
+die Quittung aussteht, sendet update_figure nicht, sondern merkt sich nur den neuesten Frame (ältere entfallen)
+und schickt ihn mit der Quittung. So stauen sich auf langsamen Rechnern keine Frames. Zähler und Latenz
+(update_figure → gezeichnet) aller Graphen: get_draw_stats().
 """
 from __future__ import annotations
 
-from typing import Any
+import base64
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator
 
+import numpy as np
 from nicegui.element import Element
 
+from tracing import span
+
+from .plotly_decimation import DECIMATION_METHODS, decimate_trace
+
+# Zielpunkte pro Spur, solange der Browser noch keine Plotbreite gemeldet hat
+DEFAULT_MAX_POINTS = 2000
+# Ohne Quittung (Plotly nicht geladen, Event verloren) nach dieser Zeit trotzdem wieder senden
+DRAW_ACK_TIMEOUT_SEC = 2.0
+
+_draw_stats = {"frames_sent": 0, "frames_acked": 0, "frames_dropped": 0}
+_draw_latency_ms: deque[float] = deque(maxlen=512)  # update_figure → Quittung (inkl. Websocket)
+_draw_client_ms: deque[float] = deque(maxlen=512)  # reine Zeichenzeit im Browser
+_shared: list = [None]  # während shared_serialization(): Schlüssel → (Quellobjekte…, Ergebnis)
+
+
+# NumPy-Typkürzel → Plotly-Typed-Array-dtype (Little Endian); int64/uint64 kennt Plotly.js nicht → f8
+_TYPED_DTYPES = {
+    "f8": "f8", "f4": "f4",
+    "i1": "i1", "u1": "u1", "i2": "i2", "u2": "u2", "i4": "i4", "u4": "u4",
+    "i8": "f8", "u8": "f8", "b1": "u1",
+}
+
+
+def _typed_array(arr: Any, float32: bool = False) -> dict[str, str] | None:
+    """NumPy-Array als {"dtype", "bdata"[, "shape"]} (base64, Little Endian); None bei nicht numerischem dtype."""
+    dtype = _TYPED_DTYPES.get(f"{arr.dtype.kind}{arr.dtype.itemsize}")
+    if dtype is None:
+        return None
+    if float32 and dtype == "f8":
+        dtype = "f4"
+    arr = arr.astype("<" + dtype, copy=False)
+    out = {"dtype": dtype, "bdata": base64.b64encode(memoryview(arr.ravel())).decode("ascii")}
+    if arr.ndim > 1:
+        out["shape"] = ",".join(str(n) for n in arr.shape)  # z. B. z-Matrix für heatmap/surface
+    return out
+
+
+@contextmanager
+def shared_serialization() -> Iterator[None]:
+    """
+    Serialisierung, Decimation und Cache-Vergleich im with-Block zwischen allen Graphen teilen (ein Broadcast).
+    Die Quellobjekte dürfen innerhalb des Blocks nicht verändert werden; Schlüssel ist die Objekt-Identität.
+    """
+    outer = _shared[0]
+    if outer is None:
+        _shared[0] = {}
+    try:
+        yield
+    finally:
+        if outer is None:
+            _shared[0] = None
 
-def _to_serializable(obj: Any) -> Any:
-    """Konvertiert NumPy-Arrays/Skalare in listen/json-serialisierbare Python-Typen (für Plotly/Vue)."""
+
+def _to_serializable(obj: Any, *, binary: bool = False, float32: bool = False) -> Any:
+    """
+    Konvertiert NumPy-Arrays/Skalare in json-serialisierbare Python-Typen (für Plotly/Vue).
+    binary=True: numerische Arrays als Typed-Array-Payload (base64) statt Liste; float32 nur mit binary.
+    """
     if obj is None:
         return None
+    memo = _shared[0]
+    if memo is not None and isinstance(obj, (np.ndarray, list)):
+        key = ("serialize", id(obj), binary, float32)
+        hit = memo.get(key)
+        if hit is None:
+            hit = memo[key] = (obj, _convert(obj, binary, float32))  # obj festhalten: id bleibt eindeutig
+        return hit[1]
+    return _convert(obj, binary, float32)
+
+
+def _convert(obj: Any, binary: bool, float32: bool) -> Any:
     try:
         import numpy as np
         if isinstance(obj, np.ndarray):
+            if binary:
+                typed = _typed_array(obj, float32)
+                if typed is not None:
+                    return typed
             return obj.tolist()
         if isinstance(obj, (np.floating, np.integer)):
             return float(obj) if isinstance(obj, np.floating) else int(obj)
     except ImportError:
         pass
     if isinstance(obj, dict):
-        return {k: _to_serializable(v) for k, v in obj.items()}
+        return {k: _to_serializable(v, binary=binary, float32=float32) for k, v in obj.items()}
     if isinstance(obj, list):
-        return [_to_serializable(v) for v in obj]
+        return [_to_serializable(v, binary=binary, float32=float32) for v in obj]
     return obj
 
 
+def _same_payload(a: Any, b: Any) -> bool:
+    """Inhaltsvergleich serialisierter Arrays; in shared_serialization() einmal pro Paar statt pro Graph."""
+    if a is b:
+        return True
+    memo = _shared[0]
+    if memo is None:
+        return a == b
+    key = ("equal", id(a), id(b))
+    hit = memo.get(key)
+    if hit is None:
+        hit = memo[key] = (a, b, a == b)
+    return hit[2]
+
+
+def _decimate_shared(trace: dict, n_out: int, method: str, x_window: tuple[float, float] | None) -> dict:
+    """decimate_trace; in shared_serialization() für gleiche Trace und Parameter nur einmal."""
+    memo = _shared[0]
+    if memo is None:
+        return decimate_trace(trace, n_out, method, x_window)
+    key = ("decimate", id(trace), n_out, method, x_window)
+    hit = memo.get(key)
+    if hit is None:
+        hit = memo[key] = (trace, decimate_trace(trace, n_out, method, x_window))
+    return hit[1]
+
+
+def get_draw_stats() -> dict[str, Any]:
+    """
+    Summe über alle PlotlyGraphs: plot_frames_sent/acked/dropped (wegen ausstehender Quittung ersetzt),
+    plot_latency_p50/p95/max_ms (update_figure bis gezeichnet), plot_draw_ms (Mittel der Browser-Zeichenzeit).
+    """
+    out: dict[str, Any] = {f"plot_{key}": value for key, value in _draw_stats.items()}
+    latency = np.array(_draw_latency_ms)
+    client = np.array(_draw_client_ms)
+    out["plot_latency_p50_ms"] = float(np.percentile(latency, 50)) if latency.size else None
+    out["plot_latency_p95_ms"] = float(np.percentile(latency, 95)) if latency.size else None
+    out["plot_latency_max_ms"] = float(latency.max()) if latency.size else None
+    out["plot_draw_ms"] = float(client.mean()) if client.size else None
+    return out
+
+
+_CACHED_KEYS = ("x", "y", "z")  # Trace-Arrays, die bei Gleichheit nur als Verweis gesendet werden
+
+
+def _per_trace(values: Any) -> list[Any]:
+    """Ein Array → [Array]; Liste von Arrays/Listen → Liste (ein Eintrag pro Trace)."""
+    if isinstance(values, np.ndarray):
+        return [values] if values.ndim == 1 else list(values)
+    values = list(values)
+    if values and isinstance(values[0], (list, tuple, np.ndarray)):
+        return [np.asarray(v) for v in values]
+    return [np.asarray(values)]
+
+
 class PlotlyGraph(Element, component="plotly_graph.js"):
 
     def __init__(
@@ -44,13 +194,50 @@ class PlotlyGraph(Element, component="plotly_graph.js"):
         *,
         height: str = "400px",
         plotly_script_url: str = "",
+        binary: bool = True,
+        float32: bool = False,
+        max_points: int = 0,
+        decimation: str = "none",
+        backpressure: bool = True,
     ) -> None:
+        """
+        binary: NumPy-Arrays als base64-Typed-Arrays senden; float32: float64 dabei auf float32 kürzen.
+        decimation: "none" | "minmax" | "lttb"; max_points: Punkte pro Spur (0 = 2 × Plotbreite in Pixeln).
+        backpressure: update_figure wartet auf die Zeichen-Quittung des Browsers (nur neuester Frame).
+        """
         super().__init__()
-        self._props["data"] = _to_serializable(data or [])
-        self._props["layout"] = _to_serializable(layout or {})
+        self.binary = binary
+        self.float32 = float32
+        self.max_points = max(0, int(max_points))
+        self.decimation = decimation if decimation in DECIMATION_METHODS else "none"
+        self.plot_width = 0  # vom Browser gemeldet (Event resize)
+        self._data_src: list[dict] = data or []  # zuletzt übergebene Traces (volle Auflösung, für Zoom/Append)
+        self._data_stale = False  # append_points: Props erst beim nächsten update() neu serialisieren
+        self._append_seq = 0  # Nummer des letzten append_points; Props-Stand enthält alle bis appendSeq
+        self._sent: dict[tuple[int, str], tuple[Any, int]] = {}  # (Trace, Key) → (gesendeter Wert, Version)
+        self._data_version = 0
+        self._data_full: list = []  # zuletzt gesetzte Traces ohne Cache-Verweise (für resync)
+        self.backpressure = backpressure
+        self._frame_seq = 0  # zuletzt gesendeter Frame (Prop frameSeq)
+        self._acked_seq = 0  # zuletzt vom Browser quittierter Frame
+        self._frame_sent_at: dict[int, float] = {}  # frameSeq → perf_counter beim Senden
+        self._pending_frame: tuple | None = None  # (data, layout, config, restyle_only), wartet auf Quittung
+        self._layout_src: dict = layout or {}
+        self._x_window: tuple[float, float] | None = None
+        if self.decimation != "none":
+            data, layout = self._decimated(data or [], layout)
+            self.on("relayout", self._on_relayout)
+            self.on("resize", self._on_resize)
+        self.on("resync", self._on_resync)
+        self.on("drawn", self._on_drawn)
+        self._set_data(self._serialize(data or []))
+        self._props["layout"] = self._serialize(layout or {})
         self._props["config"] = config or {"responsive": True}
         self._props["height"] = height
         self._props["plotlyScriptUrl"] = plotly_script_url
+        self._props["decimate"] = self.decimation != "none"
+        self._props["appendSeq"] = 0
+        self._props["frameSeq"] = 0
 
     def update_figure(
         self,
@@ -64,21 +251,239 @@ class PlotlyGraph(Element, component="plotly_graph.js"):
         Graphen aktualisieren (neue Traces/Layout).
         data/traces dürfen NumPy-Arrays in x/y/z enthalten.
         restyle_only=True: nur x/y per restyle senden (weniger Daten, oft flüssiger bei Animation).
+        NumPy-Arrays gehen binär (base64) an den Browser, sofern binary (Default); Listen bleiben Listen.
+        Mit decimation werden die vollen Daten für den Zoom behalten und reduziert gesendet.
+        Mit backpressure wird während eines ausstehenden Zeichnens nur der neueste Frame vorgemerkt.
         """
-        self._props["data"] = _to_serializable(data)
-        self._props["restyleOnly"] = restyle_only
-        if layout is not None:
-            self._props["layout"] = _to_serializable(layout)
-        if config is not None:
-            self._props["config"] = config
+        with span("plotly.update_figure"):
+            if self._pending_frame is not None:
+                # vorgemerkter Frame wird ersetzt; Layout/Config daraus gelten weiter, falls hier None
+                _draw_stats["frames_dropped"] += 1
+                _, pending_layout, pending_config, pending_restyle = self._pending_frame
+                self._pending_frame = None
+                layout = layout if layout is not None else pending_layout
+                config = config if config is not None else pending_config
+                restyle_only = restyle_only and pending_restyle
+            if self._draw_outstanding():
+                self._pending_frame = (data, layout, config, restyle_only)
+                return
+            self._send_figure(data, layout, config, restyle_only)
+
+    def _draw_outstanding(self) -> bool:
+        if not self.backpressure or self._acked_seq >= self._frame_seq:
+            return False
+        sent_at = self._frame_sent_at.get(self._frame_seq)
+        return sent_at is not None and time.perf_counter() - sent_at < DRAW_ACK_TIMEOUT_SEC
+
+    def _send_figure(self, data: list[dict], layout: dict | None, config: dict | None, restyle_only: bool) -> None:
+        self._frame_seq += 1
+        self._frame_sent_at[self._frame_seq] = time.perf_counter()
+        if len(self._frame_sent_at) > 64:  # nie quittierte Frames (Timeout) nicht ansammeln
+            del self._frame_sent_at[next(iter(self._frame_sent_at))]
+        _draw_stats["frames_sent"] += 1
+        self._data_src = data
+        self._data_stale = False
+        if self.decimation != "none":
+            data, layout = self._decimated(data, layout)
+        with span("plotly.serialize"):
+            self._set_data(self._serialize(data))
+            self._props["restyleOnly"] = restyle_only
+            if layout is not None:
+                self._props["layout"] = self._serialize(layout)
+            if config is not None:
+                self._props["config"] = config
+            self._props["frameSeq"] = self._frame_seq
+        with span("plotly.update"):
+            self.update()
+
+    def _on_drawn(self, e: Any) -> None:
+        """Zeichen-Quittung {seq, ms} des Browsers: Latenz erfassen, vorgemerkten Frame senden."""
+        args = e.args if isinstance(getattr(e, "args", None), dict) else {}
+        try:
+            seq = int(args.get("seq") or 0)
+        except (TypeError, ValueError):
+            return
+        if seq <= self._acked_seq:
+            return  # erneutes Zeichnen desselben Frames (resync, append_points, Zoom)
+        self._acked_seq = seq
+        sent_at = self._frame_sent_at.pop(seq, None)
+        for old in [s for s in self._frame_sent_at if s < seq]:
+            del self._frame_sent_at[old]
+        _draw_stats["frames_acked"] += 1
+        if sent_at is not None:
+            _draw_latency_ms.append(1000.0 * (time.perf_counter() - sent_at))
+        if isinstance(args.get("ms"), (int, float)):
+            _draw_client_ms.append(float(args["ms"]))
+        if self._pending_frame is not None:
+            frame, self._pending_frame = self._pending_frame, None
+            self._send_figure(*frame)
+
+    def append_points(
+        self,
+        x_new: Any,
+        y_new: Any,
+        max_points: int = 1000,
+        *,
+        traces: list[int] | None = None,
+    ) -> None:
+        """
+        Neue Samples anhängen (Streifenschreiber/Oszilloskop): nur die neuen Punkte gehen an den Browser
+        (Plotly.extendTraces), dort bleiben je Trace die letzten max_points. Nutzlast pro Frame ∝ neue Samples.
+        x_new/y_new: ein Array (Trace 0) oder Liste von Arrays (Traces 0, 1, … bzw. traces); x_new=None:
+        fortlaufender Sample-Index. Serverseitig wird das Fenster mitgeführt, damit ein späteres
+        update()/Neuzeichnen denselben Stand zeigt. max_points < 1 wird auf 1 begrenzt ([-0:] hielte alles).
+        """
+        max_points = max(1, int(max_points))
+        with span("plotly.append_points"):
+            ys = _per_trace(y_new)
+            xs = _per_trace(x_new) if x_new is not None else [None] * len(ys)
+            traces = list(traces) if traces is not None else list(range(len(ys)))
+            src = list(self._data_src)
+            x_send = []
+            for t, xn, yn in zip(traces, xs, ys):
+                while len(src) <= t:
+                    src.append({"x": [], "y": [], "mode": "lines"})
+                trace = dict(src[t])
+                y_old = np.asarray(trace.get("y") if trace.get("y") is not None else [])
+                x_old = np.asarray(trace["x"]) if trace.get("x") is not None else np.arange(len(y_old))
+                if xn is None:
+                    start = int(x_old[-1]) + 1 if len(x_old) else 0
+                    xn = np.arange(start, start + len(yn))
+                trace["x"] = np.concatenate((x_old, xn))[-max_points:]
+                trace["y"] = np.concatenate((y_old, yn))[-max_points:]
+                src[t] = trace
+                x_send.append(xn)
+            self._data_src = src
+            self._data_stale = True
+            self._append_seq += 1
+            payload = {"seq": self._append_seq, "traces": traces, "x": x_send, "y": ys, "maxPoints": max_points}
+            self.run_method("appendPoints", self._serialize(payload))
+
+    def update(self) -> None:
+        """
+        Wie Element.update(); nach append_points vorher die Props aus dem mitgeführten Fenster setzen.
+        appendSeq: Der Browser verwirft danach eintreffende appendPoints-Aufrufe, die schon in data stecken
+        (NiceGUI sendet Props-Updates vor run_method-Nachrichten derselben Runde).
+        """
+        with self._props.suspend_updates():  # Props-Änderungen würden sonst wieder update() auslösen
+            self._props["appendSeq"] = self._append_seq
+            if self._data_stale:
+                self._data_stale = False
+                data = self._data_src
+                if self.decimation != "none":
+                    data, _ = self._decimated(data, None)
+                self._set_data(self._serialize(data))
+        super().update()
+
+    def _serialize(self, obj: Any) -> Any:
+        return _to_serializable(obj, binary=self.binary, float32=self.float32)
+
+    def _set_data(self, data: list) -> None:
+        """
+        Serialisierte Traces in die Props: x/y/z, die inhaltlich dem zuletzt gesendeten Wert entsprechen, nur
+        als {"cached": Version}. dataVersions nennt pro Trace die Version jedes Arrays (neu → Browser merkt es sich).
+        """
+        self._data_full = data
+        out, versions = [], []
+        for k, trace in enumerate(data):
+            if not isinstance(trace, dict):
+                out.append(trace)
+                versions.append({})
+                continue
+            trace = dict(trace)
+            trace_versions = {}
+            for key in _CACHED_KEYS:
+                value = trace.get(key)
+                if not isinstance(value, (list, dict)):
+                    continue
+                sent = self._sent.get((k, key))
+                if sent is not None and _same_payload(sent[0], value):  # base64-Strings bzw. Listen: Inhalt
+                    trace[key] = {"cached": sent[1]}
+                    trace_versions[key] = sent[1]
+                else:
+                    self._data_version += 1
+                    self._sent[(k, key)] = (value, self._data_version)
+                    trace_versions[key] = self._data_version
+            out.append(trace)
+            versions.append(trace_versions)
+        self._props["data"] = out
+        self._props["dataVersions"] = versions
+
+    def _on_resync(self, _e: Any) -> None:
+        """Browser kennt einen Cache-Verweis nicht (Reconnect, neu geladen): alle Arrays einmal voll senden."""
+        self._sent.clear()
+        self._set_data(self._data_full)
         self.update()
 
+    # ---- Decimation ----
+
+    @property
+    def target_points(self) -> int:
+        """Punkte pro Spur: max_points, sonst 2 × gemeldete Plotbreite, sonst DEFAULT_MAX_POINTS."""
+        if self.max_points:
+            return self.max_points
+        return 2 * self.plot_width if self.plot_width else DEFAULT_MAX_POINTS
+
+    def _decimated(self, data: list[dict], layout: dict | None) -> tuple[list[dict], dict | None]:
+        """Volle Daten merken, Traces reduzieren; bei aktivem Zoom den x-Bereich ins Layout übernehmen."""
+        self._data_src = data
+        if layout is not None:
+            self._layout_src = layout
+        with span("plotly.decimate"):
+            n_out = self.target_points
+            data = [
+                _decimate_shared(t, n_out, self.decimation, self._x_window) if isinstance(t, dict) else t
+                for t in data
+            ]
+        if self._x_window is not None and layout is not None:
+            layout = dict(layout)
+            layout["xaxis"] = {**(layout.get("xaxis") or {}), "range": list(self._x_window), "autorange": False}
+        return data, layout
+
+    def _refresh(self) -> None:
+        """Zoom/Breite geändert: volle Daten neu reduzieren und senden."""
+        if self._data_src:
+            self.update_figure(self._data_src, self._layout_src)
+
+    def _on_relayout(self, e: Any) -> None:
+        """Zoom im Browser: x-Bereich in voller Auflösung nachladen; autorange (Doppelklick) → ganzer Bereich."""
+        args = e.args if isinstance(getattr(e, "args", None), dict) else {}
+        if args.get("xaxis.autorange"):
+            window = None
+        elif "xaxis.range[0]" in args and "xaxis.range[1]" in args:
+            window = (args["xaxis.range[0]"], args["xaxis.range[1]"])
+        elif isinstance(args.get("xaxis.range"), list) and len(args["xaxis.range"]) == 2:
+            window = tuple(args["xaxis.range"])
+        else:
+            return  # z. B. nur y-Achse oder autosize
+        if window is not None:
+            try:
+                window = (float(window[0]), float(window[1]))
+            except (TypeError, ValueError):
+                return  # Datums-/Kategorieachse: kein Zoom-Nachladen
+        if window == self._x_window:
+            return
+        self._x_window = window
+        self._refresh()
+
+    def _on_resize(self, e: Any) -> None:
+        args = e.args if isinstance(getattr(e, "args", None), dict) else {}
+        try:
+            width = int(args.get("width") or 0)
+        except (TypeError, ValueError):
+            return
+        if width <= 0 or width == self.plot_width:
+            return
+        self.plot_width = width
+        if not self.max_points:
+            self._refresh()
+
     def update_from_figure(self, fig: Any) -> None:
         """Figure von plotly.graph_objects (go.Figure) übernehmen (z. B. fig.to_plotly_json())."""
         try:
             out = fig.to_plotly_json()
-            self._props["data"] = _to_serializable(out.get("data", []))
-            self._props["layout"] = _to_serializable(out.get("layout", {}))
+            self._set_data(self._serialize(out.get("data", [])))
+            self._props["layout"] = self._serialize(out.get("layout", {}))
             if "config" in out:
                 self._props["config"] = out["config"]
             self.update()